@@ -4,8 +4,7 @@ from dotenv import load_dotenv
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import text
 from jinja2 import Template
 import logging
 from collections import defaultdict
@@ -18,15 +17,12 @@ load_dotenv()
 
 # Import settings after loading environment variables
 from app.core.config import settings
+from app.db.session import SessionLocal
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Create a database engine
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
 baseUrl = settings.BASE_URL
 
 def get_latest_newsletters():
@@ -1,13 +1,11 @@
 import os
 import sys
-import glob
-import importlib.util
-import concurrent.futures
+import asyncio
 import logging
+from functools import partial
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import text
 
 # Add the project root directory to the Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
@@ -22,28 +20,126 @@ load_dotenv()
 
 # Now we can import from app
 from app.core.config import settings
+from app.db.session import SessionLocal
+from app.pipeline.clients import close_clients
+from app.pipeline.articles import ArticleRecord
+from app.pipeline.assign import assign_articles
+from app.pipeline.checkpoint import RunCheckpoints
+from app.pipeline.extract import log_extract_stats
+from app.pipeline.fetcher import JOB_HANDLERS, TopicFetcher, publish_topic
+from app.pipeline.images import log_image_stats
+from app.pipeline.jobs import DONE, JobQueue, JobWorker
+from app.pipeline.llm import log_llm_stats
+from app.pipeline.metrics import record_run_metrics
+from app.pipeline.newsapi import log_key_stats
+from app.pipeline.newsletters import NewsletterBatch
+from app.pipeline.orchestrator import EMPTY, FAILED, OK, TIMEOUT, TopicOrchestrator
+from app.pipeline.queryplan import QueryPlan
+from app.pipeline.seen import SeenArticleIndex
+from app.pipeline.topics import get_topics
+
+def collect_candidates(fetcher, date, prefetched, checkpoints, deadline):
+    return checkpoints.stage(
+        fetcher.config.name, 'fetch',
+        lambda: fetcher.fetch_candidates(date, prefetched=prefetched.get(fetcher.config.name, {}), deadline=deadline),
+        encode=lambda records: [record.to_dict() for record in records],
+        decode=lambda saved: [ArticleRecord.from_dict(record) for record in saved],
+        keep=bool,
+    )
+
+def execute_topic(fetcher, articles, date, checkpoints, batch, deadline):
+    """Publish one topic; its newsletter id when stored by an earlier run, True when added to ``batch``."""
+    inserted_id = publish_topic(fetcher, articles, date, checkpoints, deadline, batch)
+    published = inserted_id or batch.has(fetcher.config.name)
+    if published:
+        logger.info(f"Successfully executed topic {fetcher.config.name}")
+    return published
+
+def prefetch(fetchers, date, checkpoints):
+    """Run every distinct NewsAPI query once and fan the results out per topic.
+
+    Pages stream in until no subscribing topic's top articles improve. Topics
+    whose candidates were checkpointed earlier today skip the fetch.
+    """
+    pending = [fetcher.config for name, fetcher in fetchers.items() if not checkpoints.has(name, 'fetch')]
+    if not pending:
+        return {}
+    plan = QueryPlan(pending, scorers={topic.name: fetchers[topic.name].score_page for topic in pending})
+    plan.execute(date)
+    plan.log_stats()
+    # Each topic gets its own scored records, so they are not enriched again
+    return {topic.name: plan.for_topic(topic.name) for topic in pending}
+
+def publish_via_queue(orchestrator, assigned, date):
+    """Enqueue each topic's publish step and work the queue until this run's jobs are finished.
+
+    Any DailyWorker processes running meanwhile claim jobs from the same queue.
+    """
+    queue = JobQueue()
+    queue.ensure_table()
+    for name, articles in assigned.items():
+        if orchestrator.summary.topics[name].status == OK:
+            queue.enqueue('daily', date, name, 'publish', {'articles': [article.to_dict() for article in articles]})
+
+    JobWorker(queue, JOB_HANDLERS).run('daily', date, drain=True, deadline=orchestrator.run_deadline)
+
+    for job in queue.results('daily', date):
+        outcome = orchestrator.summary.topics.get(job.topic)
+        if outcome is None or outcome.status != OK:
+            continue
+        if job.duration is not None:
+            outcome.phases['publish'] = job.duration
+            outcome.duration += job.duration
+        if job.status == DONE:
+            outcome.newsletter_id = (job.result or {}).get('newsletter_id')
+        elif job.status == FAILED:
+            orchestrator.finish(job.topic, FAILED, f"publish: {job.error}")
+        else:
+            orchestrator.finish(job.topic, TIMEOUT, f"publish job still {job.status} at the run deadline")
 
-# Create a database engine
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-current_dir = os.path.dirname(os.path.abspath(__file__))
-newsapi_dir = os.path.join(os.path.dirname(current_dir), "NewsAPI")
-
-def load_module(file_path):
-    spec = importlib.util.spec_from_file_location("module.name", file_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
-
-def execute_script(script_path):
+async def run_topics(topics, date, checkpoints):
+    """Fetch, assign and publish every topic under the topic and run deadlines."""
+    # Topics share one HTTP session, LLM client and DB pool
+    fetchers = {topic.name: TopicFetcher(topic) for topic in topics}
+    orchestrator = TopicOrchestrator('daily', date, fetchers)
     try:
-        module = load_module(script_path)
-        if hasattr(module, 'main'):
-            module.main()
-        logger.info(f"Successfully executed {script_path}")
-    except Exception as e:
-        logger.error(f"Error executing {script_path}: {str(e)}")
+        prefetched = await asyncio.to_thread(prefetch, fetchers, date, checkpoints)
+
+        candidates = await orchestrator.run_phase(
+            'fetch',
+            {name: partial(collect_candidates, fetcher, date, prefetched, checkpoints) for name, fetcher in fetchers.items()},
+            status=lambda records: OK if records else EMPTY,
+        )
+
+        # Give each story to the topic it fits best so it is not repeated across newsletters
+        assigned = assign_articles(candidates, {topic.name: topic.top_n for topic in topics if topic.name in candidates})
+        for name, articles in assigned.items():
+            orchestrator.summary.topics[name].articles = len(articles)
+            if not articles:
+                orchestrator.finish(name, EMPTY)
+
+        if settings.JOB_QUEUE_ENABLED:
+            await asyncio.to_thread(publish_via_queue, orchestrator, assigned, date)
+        else:
+            # Newsletters are written in one transaction once every topic has rendered
+            batch = NewsletterBatch(checkpoints, SeenArticleIndex('daily'))
+            published = await orchestrator.run_phase(
+                'publish',
+                {name: partial(execute_topic, fetchers[name], articles, date, checkpoints, batch) for name, articles in assigned.items()},
+                status=lambda result: OK if result else FAILED,
+            )
+            batched = [name for name in published if batch.has(name)]
+            stored = await asyncio.to_thread(batch.flush, batched)
+            for name, inserted_id in published.items():
+                if name in batched:
+                    inserted_id = stored.get(name)
+                    if not inserted_id:
+                        orchestrator.finish(name, FAILED, "store: newsletter insert failed")
+                        continue
+                orchestrator.summary.topics[name].newsletter_id = inserted_id
+    finally:
+        summary = orchestrator.close()
+    return summary
 
 def get_active_topics():
     with SessionLocal() as db:
@@ -59,34 +155,37 @@ def main():
     active_topics = get_active_topics()
     logger.info(f"Active topics: {active_topics}")
 
-    # Get all NewsAPI scripts
-    all_scripts = glob.glob(os.path.join(newsapi_dir, "*.py"))
-    
-    if not all_scripts:
-        logger.warning(f"No NewsAPI scripts found in the directory: {newsapi_dir}")
-        return
+    # Resolve active topics against the topic registry
+    topics = get_topics(active_topics)
+    unmatched = set(active_topics) - {topic.name.lower() for topic in topics}
+    if unmatched:
+        logger.info(f"No registered fetcher for topics: {sorted(unmatched)}")
 
-    # Filter scripts based on active topics
-    scripts_to_run = []
-    for script in all_scripts:
-        script_name = os.path.basename(script)
-        # Remove ".py" suffix and convert to lowercase
-        topic_name = os.path.splitext(script_name)[0].lower()
-        if topic_name in active_topics:
-            scripts_to_run.append(script)
-            logger.info(f"Matched script: {script_name} with topic: {topic_name}")
-        else:
-            logger.info(f"No match for script: {script_name}")
+    if not topics:
+        logger.warning("No active topics have a registered fetcher")
+        return
 
-    logger.info(f"Scripts to run: {scripts_to_run}")
+    logger.info(f"Topics to run: {[topic.name for topic in topics]}")
 
-    # Execute scripts in parallel
-    # Uncomment the following lines if you want to execute the scripts
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-         futures = [executor.submit(execute_script, script) for script in scripts_to_run]
-         concurrent.futures.wait(futures)
+    date = datetime.now().date() - timedelta(days=1)
+    # Stages completed by an earlier run for the same day are loaded instead of redone
+    checkpoints = RunCheckpoints('daily', date)
 
-    logger.info("All scripts executed successfully.")
+    try:
+        summary = asyncio.run(run_topics(topics, date, checkpoints))
+        summary.log()
+    finally:
+        checkpoints.log_report()
+        checkpoints.prune()
+        SeenArticleIndex('daily').prune()
+        log_key_stats()
+        log_llm_stats()
+        record_run_metrics('daily', date)
+        log_extract_stats()
+        log_image_stats()
+        close_clients()
+
+    logger.info("Daily run finished.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
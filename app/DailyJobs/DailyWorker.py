@@ -0,0 +1,49 @@
+import os
+import sys
+import logging
+from dotenv import load_dotenv
+
+# Add the project root directory to the Python path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, project_root)
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Load environment variables
+load_dotenv()
+
+# Now we can import from app
+from app.pipeline.clients import close_clients
+from app.pipeline.extract import log_extract_stats
+from app.pipeline.fetcher import JOB_HANDLERS
+from app.pipeline.images import log_image_stats
+from app.pipeline.jobs import JobQueue, JobWorker
+from app.pipeline.llm import log_llm_stats
+from app.pipeline.metrics import record_run_metrics
+
+def main():
+    """Claim and run queued topic jobs until the queue has been idle for JOB_WORKER_IDLE_SECONDS.
+
+    Start any number of these next to a DailyNewsRun with JOB_QUEUE_ENABLED to
+    split its topics between them.
+    """
+    queue = JobQueue()
+    queue.ensure_table()
+    worker = JobWorker(queue, JOB_HANDLERS)
+    logger.info(f"Worker {queue.worker_id} waiting for jobs ({worker.concurrency} at a time)")
+    try:
+        worker.run()
+    finally:
+        log_llm_stats()
+        for edition, run_date in sorted(worker.runs):
+            record_run_metrics(edition, run_date)
+        log_extract_stats()
+        log_image_stats()
+        close_clients()
+
+    logger.info("Daily worker finished.")
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,12 @@ import os
 import sys
 import glob
 import importlib.util
-import concurrent.futures
+import asyncio
 import logging
+from functools import partial
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import text
 
 # Add the project root directory to the Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
@@ -22,10 +22,14 @@ load_dotenv()
 
 # Now we can import from app
 from app.core.config import settings
-
-# Create a database engine
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+from app.db.session import SessionLocal
+from app.pipeline.clients import close_clients
+from app.pipeline.http_client import close_async_session
+from app.pipeline.images import log_image_stats
+from app.pipeline.llm import log_llm_stats
+from app.pipeline.metrics import record_run_metrics
+from app.pipeline.newsapi import log_key_stats
+from app.pipeline.orchestrator import TopicOrchestrator
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 newsapi_dir = os.path.join(os.path.dirname(current_dir), "NewsAPI_Weekly")
@@ -36,14 +40,32 @@ def load_module(file_path):
     spec.loader.exec_module(module)
     return module
 
-def execute_script(script_path):
+async def run_module(module, deadline):
+    try:
+        await asyncio.wait_for(module.main(), deadline.remaining())
+    finally:
+        # Also when main() was cancelled at the deadline, before it closed the session itself
+        await close_async_session()
+
+def execute_script(script_path, deadline):
+    """Run a weekly module's async main() on its own event loop, cancelling it at the deadline.
+
+    The loop's shared aiohttp session is closed before the loop is, so modules
+    must not share a loop.
+    """
+    module = load_module(script_path)
+    if hasattr(module, 'main'):
+        asyncio.run(run_module(module, deadline))
+    logger.info(f"Successfully executed {script_path}")
+
+async def run_scripts(scripts, run_date):
+    names = {os.path.splitext(os.path.basename(script))[0]: script for script in scripts}
+    orchestrator = TopicOrchestrator('weekly', run_date, names)
     try:
-        module = load_module(script_path)
-        if hasattr(module, 'main'):
-            module.main()
-        logger.info(f"Successfully executed {script_path}")
-    except Exception as e:
-        logger.error(f"Error executing {script_path}: {str(e)}")
+        await orchestrator.run_phase('run', {name: partial(execute_script, script) for name, script in names.items()})
+    finally:
+        summary = orchestrator.close()
+    return summary
 
 def get_active_topics():
     with SessionLocal() as db:
@@ -80,13 +102,18 @@ def main():
 
     logger.info(f"Scripts to run: {scripts_to_run}")
 
-    # Execute scripts in parallel
-    # Uncomment the following lines if you want to execute the scripts
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-         futures = [executor.submit(execute_script, script) for script in scripts_to_run]
-         concurrent.futures.wait(futures)
-
-    logger.info("All scripts executed successfully.")
+    # Execute scripts in parallel, each within the topic deadline
+    run_date = datetime.now().date()
+    try:
+        summary = asyncio.run(run_scripts(scripts_to_run, run_date))
+        summary.log()
+    finally:
+        log_key_stats()
+        log_llm_stats()
+        record_run_metrics('weekly', run_date)
+        log_image_stats()
+        close_clients()
+    logger.info("Weekly run finished.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,24 +3,30 @@ import requests
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 import logging
-from openai import OpenAI
-import psycopg2
 from psycopg2 import sql
 from bs4 import BeautifulSoup
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from app.db.session import pooled_connection
+from app.pipeline.articles import ArticleRecord
+from app.pipeline.keywords import KeywordCategorizer, KeywordMatcher
+from app.pipeline.llm import get_llm_executor
+from app.pipeline.newsapi import NewsApiError, get_everything
+from app.pipeline.prompt import pack_articles
+from app.pipeline.ratelimit import QuotaExhausted
+from app.pipeline.render import render_daily
+from app.pipeline.topics import get_topic
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-current_dir = os.path.dirname(os.path.abspath(__file__))
-web_template_path = os.path.join(current_dir, 'newsletter_template.html')
-email_template_path = os.path.join(current_dir, 'newsletter_template.html')  # Using same template
-
 # Load environment variables
 load_dotenv()
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
 class AINewsFetcher:
     def __init__(self):
@@ -91,9 +97,14 @@ class AINewsFetcher:
             ]
         }
 
+        # Built once so keyword extraction is a single pass over each article
+        self.category_matcher = KeywordCategorizer(self.ai_categories)
+        self.companies = sorted({company for companies in self.major_ai_companies.values() for company in companies})
+        self.company_matcher = KeywordMatcher(self.companies)
+
     def get_active_subscriptions(self):
         try:
-            with psycopg2.connect(self.db_url) as conn:
+            with pooled_connection() as conn:
                 with conn.cursor() as cur:
                     query = sql.SQL("""
                         SELECT 
@@ -183,13 +194,10 @@ class AINewsFetcher:
             'language': language,
             'sortBy': sort_by,
             'pageSize': 10,
-            'apiKey': self.news_api_key
         }
 
         try:
-            response = requests.get(self.base_url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = get_everything(params)
             articles = data.get('articles', [])
             
             # Process each article safely
@@ -213,6 +221,9 @@ class AINewsFetcher:
             
             return processed_articles
 
+        except (NewsApiError, QuotaExhausted) as e:
+            logger.error(f"Error fetching news: {e}")
+            return []
         except requests.RequestException as e:
             logger.error(f"Error fetching news: {e}")
             if hasattr(e, 'response') and e.response is not None:
@@ -223,21 +234,14 @@ class AINewsFetcher:
     def _extract_keywords(self, text):
         if not text:  # Handle None or empty text
             return []
-            
-        keywords = []
-        text_lower = str(text).lower()  # Convert to string to handle any type
-        
-        # Check for category keywords
-        for category, terms in self.ai_categories.items():
-            if any(term.lower() in text_lower for term in terms):
-                keywords.append(category)
-        
+
+        text = str(text)  # Convert to string to handle any type
+        keywords = self.category_matcher.categorize(text)
+
         # Check for company mentions
-        for company_type, companies in self.major_ai_companies.items():
-            for company in companies:
-                if company.lower() in text_lower:
-                    keywords.append(company)
-        
+        hits = self.company_matcher.counts(text)
+        keywords.extend(company for company in self.companies if company.lower() in hits)
+
         return list(set(keywords))
 
  # Add safety checks to process_articles_with_ai method
@@ -250,16 +254,17 @@ class AINewsFetcher:
                 'summary': "No articles available today."
             }
 
-        # Safely prepare articles text
-        articles_text = "\n\n".join([
-            f"Title: {article.get('title', 'No Title')}\n"
-            f"Description: {article.get('description', 'No Description')}\n"
-            f"Category: {article.get('category', 'General')}\n"
-            f"Keywords: {', '.join(article.get('keywords', []))}\n"
-            f"Source: {article.get('source', {}).get('name', 'Unknown Source')}"
-            for article in articles
-            if article and article.get('title') and article.get('description')  # Only include articles with content
-        ])
+        # Articles with the most keyword matches first, so the token budget keeps the most relevant;
+        # the packed list is what the returned indices refer to
+        candidates = sorted(
+            (article for article in articles if article and article.get('title') and article.get('description')),
+            key=lambda article: len(article.get('keywords', [])),
+            reverse=True,
+        )
+        articles_text, articles = pack_articles(
+            [{**article, 'source_name': (article.get('source') or {}).get('name', '')} for article in candidates],
+            ('title', 'description', 'category', 'keywords', 'source_name'),
+        )
 
         if not articles_text:
             return {
@@ -270,7 +275,7 @@ class AINewsFetcher:
             }
 
         try:
-            response = client.chat.completions.create(
+            response = get_llm_executor().complete_sync(
                 model=self.openai_model,
                 messages=[
                     {"role": "system", "content": """You are an AI news curator specializing in AI technology news. 
@@ -305,7 +310,8 @@ class AINewsFetcher:
                 ],
                 temperature=0.7,
                 max_tokens=1000,
-                response_format={ "type": "json_object" }
+                response_format={ "type": "json_object" },
+                topic='AI'
             )
 
             result = json.loads(response.choices[0].message.content)
@@ -362,7 +368,7 @@ class AINewsFetcher:
 
     def store_newsletter(self, title, content, email_content, topic_id, subscription_ids):
         try:
-            with psycopg2.connect(self.db_url) as conn:
+            with pooled_connection() as conn:
                 with conn.cursor() as cur:
                     insert_query = sql.SQL("""
                         INSERT INTO newsletters (title, content, email_content, topic_id, subscription_ids)
@@ -379,48 +385,28 @@ class AINewsFetcher:
             logger.error(f"Error storing newsletter in database: {e}")
             return None
 
+def _article_record(article):
+    title = article.get('title') or ''
+    description = article.get('description') or ''
+    return ArticleRecord(
+        raw=article,
+        title=title,
+        description=description,
+        url=article.get('url') or '',
+        image_url=article.get('urlToImage') or '',
+        text=f"{title} {description}".lower(),
+        categories=[article.get('category', 'General')],
+    )
+
 def generate_html_content(dynamic_title, summary, highlights, articles):
-    base_url = os.getenv('BASE_URL', 'https://www.thecuriodaily.com')
-    current_date = datetime.now().strftime("%B %d, %Y")
-    
-    # Generate highlights HTML
-    highlights_html = "<ul class='highlights-list'>\n" + "".join([
-        f"""    <li class="highlight-item">
-        <span class="highlight-text">{text}</span>
-    </li>
-"""
-        for text, category in highlights
-    ]) + "</ul>"
-    
-    
-    # Generate articles HTML
-    articles_html = "<div class='article-grid'>\n" + "".join([
-        f"""    <article class="article">
-        <span class="article-category">{article.get('category', 'General')}</span>
-        <h3>{article.get('title', 'Untitled')}</h3>
-        <img src="{article.get('urlToImage', '/api/placeholder/400/300')}" 
-             alt="Article image" class="article-image">
-        <p>{article.get('description', 'No description available.')}</p>
-        <a href="{article.get('url', '#')}" class="read-more" target="_blank">Read More</a>
-    </article>
-"""
-        for article in articles
-    ]) + "</div>"
-
-    # Read and fill template
-    with open(web_template_path, 'r', encoding='utf-8') as f:
-        template = f.read()
-
-    # Replace placeholders in template
-    template = template.replace('{{dynamic_title}}', dynamic_title)
-    template = template.replace('{{current_date}}', current_date)
-    template = template.replace('{{summary}}', f"<p>{summary}</p>")
-    template = template.replace('{{highlights}}', highlights_html)
-    template = template.replace('{{articles}}', articles_html)
-    template = template.replace('{{base_url}}', base_url)
-    template = template.replace('{{unsubscribe_link}}', '{{unsubscribe_link_placeholder}}')
-
-    return template
+    """Web and email HTML from the shared, autoescaping daily templates."""
+    icon, color, _ = get_topic('AI').fallback_highlight
+    return render_daily(
+        dynamic_title,
+        summary,
+        [(text, icon, color, category) for text, category in highlights],
+        [_article_record(article) for article in articles],
+    )
 
 def store_html_content(html_content, filename):
     try:
@@ -457,17 +443,17 @@ def main():
             
             # Generate HTML content
             logger.info("Generating newsletter content...")
-            html_content = generate_html_content(
+            web_content, email_content = generate_html_content(
                 title,
                 summary,
                 highlights,
                 filtered_articles
             )
             
-            if html_content:
+            if web_content and email_content:
                 # Store HTML file
                 filename = f"AI_Roundup_{today.strftime('%Y%m%d')}.html"
-                if store_html_content(html_content, filename):
+                if store_html_content(web_content, filename):
                     logger.info(f"Newsletter saved as {filename}")
                 
                 # Get active subscriptions
@@ -480,8 +466,8 @@ def main():
                     logger.info("Storing newsletter in database...")
                     inserted_id = fetcher.store_newsletter(
                         title,
-                        html_content,
-                        html_content,  # Using same content for both web and email
+                        web_content,
+                        email_content,
                         1,  # topic_id for AI
                         subscription_ids
                     )
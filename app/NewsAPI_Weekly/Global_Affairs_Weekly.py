@@ -1,35 +1,36 @@
 import os
-import requests
 import json
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 import logging
-from openai import OpenAI
-import psycopg2
-from psycopg2 import sql
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import asyncio
 import aiohttp
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from app.db.session import pooled_connection
+from app.pipeline.dedup import deduplicate
+from app.pipeline.http_client import get_async_session, close_async_session
+from app.pipeline.images import localize_images
+from app.pipeline.llm import get_llm_executor
+from app.pipeline.newsapi import get_everything_async
+from app.pipeline.prompt import pack_articles
+from app.pipeline.render import render_weekly
+from app.pipeline.seen import SeenArticleIndex
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+WEEKLY_TOPIC_ID = 6
+
 # Load environment variables
 load_dotenv()
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
 class GlobalAffairsWeeklyFetcher:
     def __init__(self):
-        self.news_api_key = os.getenv('NEWS_API_KEY_Weekly')
-        if not self.news_api_key:
-            raise ValueError("NEWS_API_KEY not found in environment variables")
-        self.base_url = "https://newsapi.org/v2/everything"
-        self.db_url = os.getenv('DATABASE_URL')
-        if not self.db_url:
-            raise ValueError("DATABASE_URL not found in environment variables")
-
         self.trusted_sources = [
             'reuters.com', 'apnews.com', 'nytimes.com/world', 'bbc.com/news/world',
             'theguardian.com/world', 'foreignpolicy.com', 'economist.com',
@@ -66,12 +67,12 @@ class GlobalAffairsWeeklyFetcher:
             'global development OR international aid'
         ]
 
-        async with aiohttp.ClientSession() as session:
-            tasks = [
-                self._fetch_news_batch(session, query, start_date, end_date)
-                for query in queries
-            ]
-            results = await asyncio.gather(*tasks)
+        session = get_async_session()
+        tasks = [
+            self._fetch_news_batch(session, query, start_date, end_date)
+            for query in queries
+        ]
+        results = await asyncio.gather(*tasks)
             
         seen_titles = set()
         unique_articles = []
@@ -94,46 +95,28 @@ class GlobalAffairsWeeklyFetcher:
             'language': 'en',
             'sortBy': 'relevancy',
             'pageSize': 10,
-            'apiKey': self.news_api_key
         }
 
         try:
-            async with session.get(self.base_url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return data.get('articles', [])
-                return []
+            data = await get_everything_async(params, session)
+            return data.get('articles', [])
         except Exception as e:
             logger.error(f"Error fetching news batch: {e}")
             return []
 
-    def _prepare_articles_for_ai(self, articles: List[Dict[str, Any]]) -> str:
-        """Prepare articles in a compressed format."""
-        return "\n".join([
-            f"[{i}] {a['title']} | {a['description']}"
-            for i, a in enumerate(articles)
-        ])
+    def _prepare_articles_for_ai(self, articles: List[Dict[str, Any]]) -> Tuple[str, List[Dict[str, Any]]]:
+        """Compact article lines that fit the prompt token budget, and the articles they cover."""
+        return pack_articles(articles, ('title', 'description'))
 
     def _prefilter_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Pre-filter articles to reduce input tokens."""
-        filtered = []
-        seen_titles = set()
-        
-        for article in articles:
-            if not article or not article.get('title') or not article.get('description'):
-                continue
-                
-            title = article['title'].lower()
-            if title in seen_titles:
-                continue
-                
-            seen_titles.add(title)
-            filtered.append(article)
-            
-            if len(filtered) >= 15:
-                break
-                
-        return filtered
+        """Drop empty articles and syndicated copies; the prompt builder enforces the token budget."""
+        candidates = [
+            article for article in articles
+            if article and article.get('title') and article.get('description')
+        ]
+
+        # Syndicated copies of the same story collapse to the first one seen
+        return deduplicate(candidates, text=lambda a: f"{a['title']} {a['description']}")
 
     async def process_articles_with_ai(self, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
         if not articles:
@@ -143,7 +126,7 @@ class GlobalAffairsWeeklyFetcher:
         if not filtered_articles:
             return self._get_empty_response()
 
-        articles_text = self._prepare_articles_for_ai(filtered_articles)
+        articles_text, filtered_articles = self._prepare_articles_for_ai(filtered_articles)
 
         try:
             messages = [
@@ -157,13 +140,13 @@ class GlobalAffairsWeeklyFetcher:
                 {"role": "user", "content": f"Select top global affairs news:\n{articles_text}"}
             ]
 
-            response = await asyncio.to_thread(
-                client.chat.completions.create,
+            response = await get_llm_executor().complete(
                 model="gpt-4-1106-preview",
                 messages=messages,
                 temperature=0.7,
                 max_tokens=1000,
-                response_format={"type": "json_object"}
+                response_format={"type": "json_object"},
+                topic='Global_Affairs_Weekly'
             )
 
             return self._process_ai_response(response, filtered_articles)
@@ -224,50 +207,14 @@ class GlobalAffairsWeeklyFetcher:
 
     def generate_html_content(self, title: str, summary: str, highlights: List[Dict[str, Any]], 
                             articles: List[Dict[str, Any]]) -> str:
-        template_path = os.path.join(os.path.dirname(__file__), 'weekly_newsletter_template.html')
-        base_url = os.getenv('BASE_URL', 'https://www.thecuriodaily.com')
-
-        highlights_html = "".join([
-            f"""<li class="highlight-item">
-                <i class="fas fa-circle"></i>
-                <span class="highlight-text">{h['text']}</span>
-            </li>"""
-            for h in highlights
-        ])
-        
-        articles_html = "".join([
-            f"""<article class="article-card">
-                <img src="{article.get('urlToImage', '/api/placeholder/400/300')}" 
-                     alt="Article image" class="article-image">
-                <div class="article-content">
-                    <h3>{article.get('title', '')}</h3>
-                    <p>{article.get('description', '')}</p>
-                    <a href="{article.get('url', '#')}" class="read-more-btn" target="_blank">
-                        Read More
-                    </a>
-                </div>
-            </article>"""
-            for article in articles
-        ])
-
+        """Generate HTML content for the newsletter."""
         try:
-            with open(template_path, "r", encoding="utf-8") as f:
-                template = f.read()
-            
-            return template.replace(
-                '{{title}}', title
-            ).replace(
-                '{{summary}}', summary
-            ).replace(
-                '{{highlights}}', highlights_html
-            ).replace(
-                '{{articles}}', articles_html
-            ).replace(
-                '{{base_url}}', base_url
-            ).replace(
-                '{{topic}}', "Global Affairs Weekly"
-            ).replace(
-                '{{date}}', datetime.now().strftime("%b %d, %Y")
+            return render_weekly(
+                topic="Global Affairs Weekly",
+                title=title,
+                summary=summary,
+                highlights=highlights,
+                articles=articles,
             )
         except Exception as e:
             logger.error(f"Error generating HTML content: {e}")
@@ -275,7 +222,7 @@ class GlobalAffairsWeeklyFetcher:
 
     def store_weekly_newsletter(self, title: str, content: str, highlights: List[Dict[str, Any]]) -> Optional[int]:
         try:
-            with psycopg2.connect(self.db_url) as conn:
+            with pooled_connection() as conn:
                 with conn.cursor() as cur:
                     cur.execute("""
                         INSERT INTO public.weekly_newsletter 
@@ -285,7 +232,7 @@ class GlobalAffairsWeeklyFetcher:
                     """, (
                         title,
                         content,
-                        6,  # Global Affairs Weekly topic ID
+                        WEEKLY_TOPIC_ID,  # Global Affairs Weekly topic ID
                         ", ".join(h['text'] for h in highlights[:3])
                     ))
                     
@@ -305,6 +252,9 @@ async def main():
         logger.info(f"Fetching global affairs news for {start_date.date()} to {end_date.date()}")
         
         articles = await fetcher.fetch_news(start_date, end_date)
+        # Skip stories already featured in earlier weekly issues
+        seen_index = SeenArticleIndex('weekly')
+        articles = seen_index.filter_unseen(articles, WEEKLY_TOPIC_ID)
         if not articles:
             logger.warning("No articles found")
             return
@@ -314,6 +264,9 @@ async def main():
             logger.warning("No articles passed AI filtering")
             return
 
+        # Swap hotlinked originals for cached thumbnails; broken images fall back to the placeholder
+        await localize_images(processed_results['filtered_articles'])
+
         html_content = fetcher.generate_html_content(
             title=processed_results['title'],
             summary=processed_results['summary'],
@@ -334,6 +287,7 @@ async def main():
             
             if newsletter_id:
                 logger.info(f"Newsletter generated and stored. ID: {newsletter_id}")
+                seen_index.mark_seen(processed_results['filtered_articles'], WEEKLY_TOPIC_ID)
             else:
                 logger.error("Failed to store newsletter")
         else:
@@ -342,6 +296,8 @@ async def main():
     except Exception as e:
         logger.error(f"Error in main execution: {e}")
         raise
+    finally:
+        await close_async_session()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -11,6 +11,7 @@ from app.api.endpoints import (
     weekly_newsletter,
     weekly_newsletter_topics,
     blog_posts,
+    images,
 )
 
 
@@ -72,6 +73,15 @@ except Exception as e:
 
 
 
+# Include router for article thumbnails
+try:
+    api_router.include_router(images.router, prefix="/images", tags=["images"])
+    logger.info("Images router included successfully")
+except Exception as e:
+    logger.error(f"Failed to include images router: {str(e)}", exc_info=True)
+
+
+
 # Include router for analytics
 try:
     #api_router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
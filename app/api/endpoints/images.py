@@ -0,0 +1,26 @@
+# app/api/endpoints/images.py
+
+from fastapi import APIRouter, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
+
+from app.pipeline.images import get_thumbnail_server, is_allowed_size
+
+router = APIRouter()
+
+# Thumbnails are content-addressed, so a URL always serves the same bytes
+CACHE_HEADERS = {"Cache-Control": "public, max-age=31536000, immutable"}
+
+
+@router.get("/{digest}/{width}/{height}")
+async def read_thumbnail(digest: str, width: int, height: int):
+    if not is_allowed_size((width, height)):
+        raise HTTPException(status_code=404, detail="Unsupported image size")
+    thumbnail = await run_in_threadpool(get_thumbnail_server().get, digest, (width, height))
+    if thumbnail is None:
+        raise HTTPException(status_code=404, detail="Image not found")
+    return Response(
+        content=thumbnail,
+        media_type="image/jpeg",
+        headers={**CACHE_HEADERS, "ETag": f'"{digest}-{width}x{height}"'},
+    )
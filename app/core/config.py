@@ -15,7 +15,7 @@ def get_secrets() -> Optional[dict[str, str]]:
         project_id = os.getenv('GOOGLE_CLOUD_PROJECT')
 
         secrets = {}
-        secret_ids = ['NEWS_API_KEY','NEWS_API_KEY_1', 'OPENAI_API_KEY', 'DATABASE_URL', 'SECRET_KEY',
+        secret_ids = ['NEWS_API_KEY','NEWS_API_KEY_1', 'NEWS_API_KEY_Weekly', 'OPENAI_API_KEY', 'DATABASE_URL', 'SECRET_KEY',
                       'POSTGRES_SERVER', 'POSTGRES_USER', 'POSTGRES_PASSWORD', 'POSTGRES_DB',
                       'SENDER_EMAIL', 'SENDER_PASSWORD', 'RECIPIENT_EMAIL', 'EMAIL_API','COURSEERA_KEY','COURSEERA_SECRET','GITHUB_TOKEN']
         
@@ -66,12 +66,124 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: SecretStr = Field(default=SecretStr(""))
     NEWS_API_KEY: SecretStr = Field(default=SecretStr(""))
     NEWS_API_KEY_1: SecretStr = Field(default=SecretStr(""))
+    NEWS_API_KEY_Weekly: SecretStr = Field(default=SecretStr(""))
     SECRET_KEY: SecretStr = Field(default=SecretStr(""))
     EMAIL_API: str = Field(default="")
     COURSEERA_KEY: SecretStr = Field(default=SecretStr(""))
     COURSEERA_SECRET: SecretStr = Field(default=SecretStr(""))
     GITHUB_TOKEN: SecretStr = Field(default=SecretStr(""))
 
+    # Shared HTTP client pools used by the news fetchers
+    HTTP_CONNECT_TIMEOUT: float = Field(default=5.0)
+    HTTP_READ_TIMEOUT: float = Field(default=20.0)
+    HTTP_MAX_CONNECTIONS: int = Field(default=32)
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = Field(default=8)
+    HTTP_KEEPALIVE_TIMEOUT: float = Field(default=30.0)
+
+    # NewsAPI request scheduling, shared by every key in the pool
+    NEWS_API_RATE_PER_SECOND: float = Field(default=5.0)
+    NEWS_API_BURST: int = Field(default=10)
+    NEWS_API_DAILY_QUOTA: int = Field(default=100)  # per key
+    NEWS_API_MAX_RETRIES: int = Field(default=3)
+    NEWS_API_BACKOFF_SECONDS: float = Field(default=2.0)
+    NEWS_API_PAGE_SIZE: int = Field(default=50)
+    NEWS_API_MAX_PAGES: int = Field(default=3)
+    # Results NewsAPI serves per query (100 on the developer plan); pages past it are errors
+    NEWS_API_MAX_RESULTS: int = Field(default=100)
+    NEWS_API_EXTRA_PAGES_PER_TOPIC: int = Field(default=5)
+
+    # Local on-disk caches for the news pipeline
+    PIPELINE_CACHE_DIR: str = Field(default="/tmp/curiodaily_cache")
+    NEWS_CACHE_ENABLED: bool = Field(default=True)
+    NEWS_CACHE_TTL_SECONDS: int = Field(default=20 * 60 * 60)
+    NEWS_CACHE_MAX_MB: int = Field(default=200)
+
+    # Shared LLM executor
+    LLM_MAX_CONCURRENCY: int = Field(default=8)
+    LLM_TIMEOUT_SECONDS: float = Field(default=60.0)
+    LLM_MAX_RETRIES: int = Field(default=4)
+    LLM_BACKOFF_SECONDS: float = Field(default=1.0)
+    LLM_MAX_BACKOFF_SECONDS: float = Field(default=60.0)
+    LLM_CACHE_ENABLED: bool = Field(default=True)
+    LLM_CACHE_TTL_SECONDS: int = Field(default=7 * 24 * 60 * 60)
+    LLM_CACHE_MAX_MB: int = Field(default=100)
+    # Estimated input tokens for the article list in curation prompts
+    PROMPT_ARTICLE_TOKEN_BUDGET: int = Field(default=1500)
+
+    # Full-article extraction for the digest prompts
+    EXTRACT_ENABLED: bool = Field(default=True)
+    EXTRACT_MAX_CONCURRENCY: int = Field(default=16)
+    EXTRACT_PER_HOST: int = Field(default=2)
+    EXTRACT_TIMEOUT_SECONDS: float = Field(default=10.0)
+    EXTRACT_MAX_BYTES: int = Field(default=2_000_000)
+    EXTRACT_CACHE_TTL_SECONDS: int = Field(default=7 * 24 * 60 * 60)
+    EXTRACT_CACHE_MAX_MB: int = Field(default=200)
+    EXTRACT_EXCERPT_CHARS: int = Field(default=600)
+
+    # Article image validation and thumbnails
+    IMAGE_VALIDATION_ENABLED: bool = Field(default=True)
+    IMAGE_MAX_CONCURRENCY: int = Field(default=16)
+    IMAGE_TIMEOUT_SECONDS: float = Field(default=10.0)
+    IMAGE_MAX_BYTES: int = Field(default=8_000_000)
+    IMAGE_INDEX_TTL_SECONDS: int = Field(default=30 * 24 * 60 * 60)
+    IMAGE_INDEX_MAX_MB: int = Field(default=20)
+    IMAGE_MEMORY_CACHE_MB: int = Field(default=64)
+    # "database" keeps thumbnails in Postgres, where the web service can read what the
+    # job containers stored; "local" (PIPELINE_CACHE_DIR) only suits a single machine
+    IMAGE_STORE: str = Field(default="database")
+
+    # Candidate ranking: "keywords" sums weighted keyword counts, "tfidf" needs numpy
+    RANKER: str = Field(default="keywords")
+    RANKER_RECENT_ARTICLES: int = Field(default=200)  # recently featured titles in the topic profile
+    RANKER_RECENT_WEIGHT: float = Field(default=0.5)
+    CANDIDATE_FACTOR: int = Field(default=3)  # candidates kept per top_n slot
+
+    # Articles already featured are skipped for this many days
+    SEEN_ARTICLE_RETENTION_DAYS: int = Field(default=30)
+
+    # Per-topic stage checkpoints let a rerun of the same day resume
+    CHECKPOINTS_ENABLED: bool = Field(default=True)
+    CHECKPOINT_RETENTION_DAYS: int = Field(default=7)
+
+    # Time limits for the daily and weekly runs; 0 disables a limit
+    TOPIC_DEADLINE_SECONDS: float = Field(default=600.0)  # running time per topic
+    RUN_DEADLINE_SECONDS: float = Field(default=3000.0)
+    TOPIC_CONCURRENCY: int = Field(default=8)  # topics worked on at once
+
+    # CPU-bound stages (extract, score, rank, dedup, render) listed here run in a
+    # shared process pool instead of the topic threads
+    PROCESS_STAGES: str = Field(default="extract")
+    PROCESS_POOL_SIZE: int = Field(default=0)  # 0 sizes the pool to the container's CPUs
+
+    # Postgres job queue: with it enabled DailyNewsRun enqueues each topic's publish
+    # step and works the queue together with any RUN_SCRIPT=DailyWorker processes
+    JOB_QUEUE_ENABLED: bool = Field(default=False)
+    JOB_MAX_ATTEMPTS: int = Field(default=3)
+    JOB_RETRY_BACKOFF_SECONDS: float = Field(default=30.0)
+    JOB_MAX_BACKOFF_SECONDS: float = Field(default=600.0)
+    JOB_HEARTBEAT_SECONDS: float = Field(default=15.0)
+    JOB_STALE_SECONDS: float = Field(default=90.0)  # running jobs without a heartbeat this long are reclaimed
+    JOB_POLL_SECONDS: float = Field(default=2.0)
+    JOB_WORKER_IDLE_SECONDS: float = Field(default=300.0)  # DailyWorker exits after this long without work
+    JOB_WORKER_CONCURRENCY: int = Field(default=4)  # jobs run at once per worker process
+
+    # Optional in-process scheduler for the web service; only the instance holding
+    # the leader advisory lock runs jobs. Crontab expressions, empty disables a job
+    SCHEDULER_ENABLED: bool = Field(default=False)
+    SCHEDULER_TIMEZONE: str = Field(default="UTC")
+    SCHEDULE_DAILY_NEWS: str = Field(default="0 5 * * *")
+    SCHEDULE_WEEKLY_NEWS: str = Field(default="0 6 * * 1")
+    SCHEDULE_DAILY_EMAIL: str = Field(default="0 7 * * *")
+    SCHEDULER_ELECTION_SECONDS: float = Field(default=30.0)
+    SCHEDULER_JOB_TIMEOUT_SECONDS: float = Field(default=4 * 60 * 60)
+
+    # Connection pool shared by the web app and all job code in a process; size it
+    # for TOPIC_CONCURRENCY topic threads plus the job worker and scheduler threads
+    DB_POOL_SIZE: int = Field(default=10)
+    DB_MAX_OVERFLOW: int = Field(default=10)
+    DB_POOL_TIMEOUT_SECONDS: float = Field(default=30)
+    DB_POOL_RECYCLE_SECONDS: int = Field(default=1800)
+
     # Change this to a regular field without leading underscore
     base_url: str = Field(default="https://localhost:8443")
 
@@ -13,6 +13,11 @@ from app.models.subscription import Subscription
 from app.models.newsletter import Newsletter
 from app.models.weekly_newsletter import WeeklyNewsletter
 from app.models.weekly_newsletter_topic import WeeklyNewsletterTopic
+from app.models.seen_article import SeenArticle
+from app.models.pipeline_checkpoint import PipelineCheckpoint
+from app.models.run_metric import RunMetric
+from app.models.pipeline_job import PipelineJob
+from app.models.article_thumbnail import ArticleThumbnail
 
 
 # Import Base to create the metadata
@@ -1,6 +1,8 @@
 # app/db/session.py
 
 import logging
+import threading
+from contextlib import contextmanager
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
@@ -9,7 +11,16 @@ logger = logging.getLogger(__name__)
 
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+# The one connection pool of the process: the web app, the job scripts and the
+# topic/weekly fetchers all borrow connections from it
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=True,
+)
 
 @event.listens_for(engine, "connect")
 def connect(dbapi_connection, connection_record):
@@ -26,4 +37,29 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+@contextmanager
+def pooled_connection():
+    """A psycopg2 connection borrowed from the engine's pool, for code written against
+    the DBAPI; rolled back on error and returned to the pool on exit."""
+    conn = engine.raw_connection()
+    try:
+        yield conn
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+_created_tables = set()
+_created_tables_lock = threading.Lock()
+
+def ensure_tables(*tables):
+    """Create the given tables if they are missing, once per process. The jobs and
+    workers use their tables before the web app's create_all may ever have run."""
+    with _created_tables_lock:
+        for table in tables:
+            if table.name not in _created_tables:
+                table.create(bind=engine, checkfirst=True)
+                _created_tables.add(table.name)
@@ -29,6 +29,8 @@ from app.api import deps
 from app.crud.crud_topic import seed_initial_topics
 from app import crud
 from app.utils.sitemap_generator import generate_sitemap
+from app.pipeline.images import is_allowed_size, placeholder_image
+from app.pipeline.scheduler import start_scheduler, stop_scheduler
 from markupsafe import Markup
 #from app.api.endpoints import weekly_newsletter, weekly_newsletter_topics
 
@@ -70,8 +72,13 @@ async def lifespan(app: FastAPI):
         logger.error(f"Error seeding initial topics: {str(e)}")
     finally:
         db.close()
+    try:
+        start_scheduler()
+    except Exception as e:
+        logger.error(f"Error starting the job scheduler: {str(e)}")
     yield
     logger.info("Application is shutting down")
+    stop_scheduler()
 
 # Create database tables
 Base.metadata.create_all(bind=engine)
@@ -388,12 +395,14 @@ async def add_security_headers(request: Request, call_next):
     return response
 
 @app.get("/api/placeholder/{width}/{height}")
-async def placeholder_image(width: int, height: int):
-    img = Image.new('RGB', (width, height), color = (73, 109, 137))
-    img_byte_arr = io.BytesIO()
-    img.save(img_byte_arr, format='JPEG')
-    img_byte_arr = img_byte_arr.getvalue()
-    return Response(content=img_byte_arr, media_type="image/jpeg")
+async def placeholder(width: int, height: int):
+    if not is_allowed_size((width, height)):
+        raise HTTPException(status_code=404, detail="Unsupported placeholder size")
+    return Response(
+        content=placeholder_image((width, height)),
+        media_type="image/jpeg",
+        headers={"Cache-Control": "public, max-age=31536000, immutable"},
+    )
 
 #@app.middleware("http")
 #async def add_security_headers(request: Request, call_next):
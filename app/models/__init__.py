@@ -7,6 +7,11 @@ from app.models.user import User
 from app.models.blog_post import BlogPost, BlogPostLike
 from app.models.weekly_newsletter import WeeklyNewsletter
 from app.models.weekly_newsletter_topic import WeeklyNewsletterTopic
+from app.models.seen_article import SeenArticle
+from app.models.pipeline_checkpoint import PipelineCheckpoint
+from app.models.run_metric import RunMetric
+from app.models.pipeline_job import PipelineJob
+from app.models.article_thumbnail import ArticleThumbnail
 
 __all__ = [
     "Topic",
@@ -17,5 +22,10 @@ __all__ = [
     "BlogPost",
     "BlogPostLike",
     "WeeklyNewsletter",
-    "WeeklyNewsletterTopic"
+    "WeeklyNewsletterTopic",
+    "SeenArticle",
+    "PipelineCheckpoint",
+    "RunMetric",
+    "PipelineJob",
+    "ArticleThumbnail"
 ]
\ No newline at end of file
@@ -0,0 +1,11 @@
+# app/models/article_thumbnail.py
+from sqlalchemy import Column, String, LargeBinary, DateTime
+from sqlalchemy.sql import func
+from app.db.base_class import Base
+
+class ArticleThumbnail(Base):
+    __tablename__ = "article_thumbnails"
+
+    digest = Column(String(64), primary_key=True)  # sha256 of image
+    image = Column(LargeBinary, nullable=False)  # master JPEG thumbnail
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
@@ -0,0 +1,19 @@
+# app/models/pipeline_checkpoint.py
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, UniqueConstraint
+from sqlalchemy.sql import func
+from app.db.base_class import Base
+
+class PipelineCheckpoint(Base):
+    __tablename__ = "pipeline_checkpoints"
+
+    id = Column(Integer, primary_key=True, index=True)
+    edition = Column(String(16), nullable=False)  # 'daily' or 'weekly'
+    run_date = Column(Date, nullable=False)
+    topic = Column(String(64), nullable=False)
+    stage = Column(String(32), nullable=False)
+    payload = Column(Text, nullable=False)  # JSON
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+
+    __table_args__ = (
+        UniqueConstraint('edition', 'run_date', 'topic', 'stage', name='uq_pipeline_checkpoints_stage'),
+    )
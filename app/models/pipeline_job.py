@@ -0,0 +1,30 @@
+# app/models/pipeline_job.py
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, Index, UniqueConstraint
+from sqlalchemy.sql import func
+from app.db.base_class import Base
+
+class PipelineJob(Base):
+    __tablename__ = "pipeline_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    edition = Column(String(16), nullable=False)  # 'daily' or 'weekly'
+    run_date = Column(Date, nullable=False)
+    topic = Column(String(64), nullable=False)
+    kind = Column(String(32), nullable=False)  # handler name, e.g. 'publish'
+    payload = Column(Text, nullable=False)  # JSON
+    status = Column(String(16), nullable=False, default='pending')  # pending, running, done, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    run_after = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    locked_by = Column(String(128))
+    started_at = Column(DateTime(timezone=True))
+    heartbeat_at = Column(DateTime(timezone=True))
+    last_error = Column(Text)
+    result = Column(Text)  # JSON
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    finished_at = Column(DateTime(timezone=True))
+
+    __table_args__ = (
+        UniqueConstraint('edition', 'run_date', 'topic', 'kind', name='uq_pipeline_jobs_topic'),
+        Index('ix_pipeline_jobs_claim', 'status', 'run_after'),
+    )
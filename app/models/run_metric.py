@@ -0,0 +1,23 @@
+# app/models/run_metric.py
+from sqlalchemy import Column, Integer, String, Float, Date, DateTime, Index
+from sqlalchemy.sql import func
+from app.db.base_class import Base
+
+class RunMetric(Base):
+    __tablename__ = "run_metrics"
+
+    id = Column(Integer, primary_key=True, index=True)
+    edition = Column(String(16), nullable=False)  # 'daily' or 'weekly'
+    run_date = Column(Date, nullable=False)
+    topic = Column(String(64), nullable=False)
+    llm_calls = Column(Integer, nullable=False, default=0)
+    cached_calls = Column(Integer, nullable=False, default=0)
+    failed_calls = Column(Integer, nullable=False, default=0)
+    prompt_tokens = Column(Integer, nullable=False, default=0)
+    completion_tokens = Column(Integer, nullable=False, default=0)
+    llm_seconds = Column(Float, nullable=False, default=0.0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index('ix_run_metrics_run', 'edition', 'run_date', 'topic'),
+    )
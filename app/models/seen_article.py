@@ -0,0 +1,21 @@
+# app/models/seen_article.py
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index, UniqueConstraint
+from sqlalchemy.sql import func
+from app.db.base_class import Base
+
+class SeenArticle(Base):
+    __tablename__ = "seen_articles"
+
+    id = Column(Integer, primary_key=True, index=True)
+    edition = Column(String(16), nullable=False)  # 'daily' or 'weekly'
+    topic_id = Column(Integer, nullable=False)
+    url_hash = Column(String(64), nullable=False)
+    fingerprint = Column(String(64), nullable=False)
+    url = Column(Text)
+    title = Column(Text)
+    first_seen_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+
+    __table_args__ = (
+        UniqueConstraint('edition', 'topic_id', 'url_hash', name='uq_seen_articles_url'),
+        Index('ix_seen_articles_fingerprint', 'edition', 'topic_id', 'fingerprint'),
+    )
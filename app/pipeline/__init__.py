@@ -0,0 +1 @@
+# app/pipeline/__init__.py
@@ -0,0 +1,42 @@
+# app/pipeline/articles.py
+#
+# Per-article enrichment computed once when articles are ingested. The record
+# carries everything later stages need (normalized text, keyword hits, score,
+# categories) so the digest prompt, the web and email renders and the
+# newsletter writer all read the same values instead of recomputing them.
+
+from collections import Counter
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List
+
+
+@dataclass
+class ArticleRecord:
+    raw: Dict[str, Any]
+    title: str
+    description: str
+    url: str
+    image_url: str
+    text: str  # lowercased "title description", the text the score is computed on
+    keyword_hits: Counter = field(default_factory=Counter)
+    score: int = 0
+    categories: List[str] = field(default_factory=list)
+    body: str = ''  # extracted article text, filled in only for articles sent to the digest
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form, used by stage checkpoints."""
+        data = {item.name: getattr(self, item.name) for item in fields(self)}
+        data['keyword_hits'] = dict(self.keyword_hits)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ArticleRecord':
+        return cls(**{**data, 'keyword_hits': Counter(data.get('keyword_hits') or {})})
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style access to the original NewsAPI fields."""
+        return self.raw.get(key, default)
+
+    @property
+    def source_name(self) -> str:
+        return (self.raw.get('source') or {}).get('name', '')
@@ -0,0 +1,65 @@
+# app/pipeline/assign.py
+#
+# Run-level article assignment. Topics such as AI, Technology, Gadgets and
+# Business often rank the same story, and a subscriber to several of them
+# would get it repeatedly in one consolidated email. After every topic has
+# ranked its candidates, each story goes to the topic where it scores highest
+# and the other topics fall back to their next candidates. A topic left with
+# too few stories takes its best contested ones back so no newsletter ends up
+# empty. Everything is a constant number of passes over the candidates.
+
+import logging
+from typing import Dict, List, Tuple
+
+from app.pipeline.articles import ArticleRecord
+from app.pipeline.seen import article_keys
+
+logger = logging.getLogger(__name__)
+
+MIN_ARTICLES = 5
+
+
+def _story_key(record: ArticleRecord):
+    keys = article_keys(record)
+    return keys[0] if keys else id(record)
+
+
+def assign_articles(candidates: Dict[str, List[ArticleRecord]], top_n: Dict[str, int],
+                    min_articles: int = MIN_ARTICLES) -> Dict[str, List[ArticleRecord]]:
+    """Pick each topic's articles from its ranked ``candidates`` so stories are not repeated.
+
+    ``candidates`` maps topic name to records ordered best first. Ties go to the
+    topic listed first.
+    """
+    owner: Dict[object, Tuple[int, int, str]] = {}
+    keyed: Dict[str, List[Tuple[object, ArticleRecord]]] = {}
+    for order, (topic, records) in enumerate(candidates.items()):
+        keyed[topic] = [(_story_key(record), record) for record in records]
+        for key, record in keyed[topic]:
+            best = owner.get(key)
+            if best is None or (record.score, -order) > (best[0], best[1]):
+                owner[key] = (record.score, -order, topic)
+
+    assigned: Dict[str, List[ArticleRecord]] = {}
+    contested = 0
+    for topic, records in keyed.items():
+        limit = top_n[topic]
+        chosen = [record for key, record in records if owner[key][2] == topic][:limit]
+        floor = min(min_articles, limit, len(records))
+        if len(chosen) < floor:
+            # Too few stories of its own: reclaim the best shared ones, keeping rank order
+            chosen_ids = {id(record) for record in chosen}
+            reclaim = floor - len(chosen)
+            for key, record in records:
+                if reclaim == 0:
+                    break
+                if id(record) not in chosen_ids:
+                    chosen_ids.add(id(record))
+                    reclaim -= 1
+            chosen = [record for _, record in records if id(record) in chosen_ids]
+        contested += sum(1 for key, _ in records[:limit] if owner[key][2] != topic)
+        assigned[topic] = chosen
+
+    logger.info(f"Article assignment: {len(owner)} distinct stories across {len(candidates)} topics, "
+                f"{contested} top slots handed to a better-matching topic")
+    return assigned
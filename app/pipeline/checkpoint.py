@@ -0,0 +1,158 @@
+# app/pipeline/checkpoint.py
+#
+# Per-topic, per-day stage checkpoints. Each stage of a topic's run (fetch,
+# digest, render, store) saves its result to Postgres once it succeeds; a rerun
+# for the same day loads the saved result instead of repeating the stage, so a
+# failure late in the run keeps the fetched articles and the paid-for LLM
+# generations. A stage that depends on its inputs (the digest and render of a
+# topic's articles) saves a fingerprint of them with its result, and a rerun
+# that assigns the topic different articles computes the stage afresh instead
+# of reusing a result made from the old ones. Checkpoints live in Postgres
+# rather than on local disk because each job execution starts from a fresh
+# container; the table is created on first use, since the jobs can run before
+# the web app has ever created its tables.
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db.session import SessionLocal, ensure_tables
+from app.models.pipeline_checkpoint import PipelineCheckpoint
+from app.pipeline.cache import make_key
+
+logger = logging.getLogger(__name__)
+
+REUSED = 'reused'
+COMPUTED = 'computed'
+
+_LOAD = text("""
+    SELECT payload FROM pipeline_checkpoints
+    WHERE edition = :edition AND run_date = :run_date AND topic = :topic AND stage = :stage
+""")
+
+_SAVE = text("""
+    INSERT INTO pipeline_checkpoints (edition, run_date, topic, stage, payload)
+    VALUES (:edition, :run_date, :topic, :stage, :payload)
+    ON CONFLICT (edition, run_date, topic, stage) DO UPDATE SET payload = EXCLUDED.payload
+""")
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def fingerprint(*parts: Any) -> str:
+    """Key for a stage's inputs, e.g. the ordered URLs of the articles it summarizes."""
+    return make_key('checkpoint-inputs', *parts)
+
+
+class RunCheckpoints:
+    """Checkpoints for one edition and run date, plus a report of which stages were reused."""
+
+    def __init__(self, edition: str, run_date: date, enabled: Optional[bool] = None):
+        self.edition = edition
+        self.run_date = run_date
+        self.enabled = settings.CHECKPOINTS_ENABLED if enabled is None else enabled
+        self.report: Dict[str, Dict[str, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def ensure_table(self):
+        """Create pipeline_checkpoints if missing, so runs can start before the web app has run."""
+        ensure_tables(PipelineCheckpoint.__table__)
+
+    def _params(self, topic: str, stage: str) -> dict:
+        return {"edition": self.edition, "run_date": self.run_date, "topic": topic, "stage": stage}
+
+    def load(self, topic: str, stage: str) -> Optional[Any]:
+        if not self.enabled:
+            return None
+        try:
+            self.ensure_table()
+            with SessionLocal() as db:
+                row = db.execute(_LOAD, self._params(topic, stage)).fetchone()
+        except Exception as e:
+            logger.error(f"Error loading {stage} checkpoint for {topic}: {e}")
+            return None
+        return json.loads(row[0]) if row else None
+
+    def save(self, topic: str, stage: str, payload: Any, db=None):
+        """Save a stage result; with ``db`` it joins the caller's transaction and errors propagate."""
+        if not self.enabled:
+            return
+        if db is not None:
+            self.ensure_table()
+            db.execute(_SAVE, {**self._params(topic, stage), "payload": json.dumps(payload)})
+            return
+        try:
+            self.ensure_table()
+            with SessionLocal() as db:
+                db.execute(_SAVE, {**self._params(topic, stage), "payload": json.dumps(payload)})
+                db.commit()
+        except Exception as e:
+            logger.error(f"Error saving {stage} checkpoint for {topic}: {e}")
+
+    def has(self, topic: str, stage: str) -> bool:
+        return self.load(topic, stage) is not None
+
+    def stage(self, topic: str, stage: str, compute: Callable[[], Any],
+              encode: Callable[[Any], Any] = _identity, decode: Callable[[Any], Any] = _identity,
+              keep: Callable[[Any], bool] = lambda result: True, inputs: Optional[str] = None) -> Any:
+        """Result of ``stage`` for ``topic``: the saved one if present, otherwise ``compute()``.
+
+        A computed result is saved only when ``keep(result)`` holds, so fallbacks
+        and failures are retried on the next run instead of being frozen in.
+        With ``inputs`` (a fingerprint), a saved result is reused only if it was
+        computed from the same inputs.
+        """
+        saved = self.load(topic, stage)
+        if saved is not None and inputs is not None:
+            if isinstance(saved, dict) and saved.get('inputs') == inputs:
+                saved = saved['result']
+            else:
+                logger.info(f"Recomputing {stage} for {topic}: its checkpoint was made from other inputs")
+                saved = None
+        if saved is not None:
+            self._record(topic, stage, REUSED)
+            return decode(saved)
+        result = compute()
+        if keep(result):
+            payload = encode(result)
+            self.save(topic, stage, payload if inputs is None else {'inputs': inputs, 'result': payload})
+        self._record(topic, stage, COMPUTED)
+        return result
+
+    def _record(self, topic: str, stage: str, outcome: str):
+        with self._lock:
+            self.report.setdefault(topic, OrderedDict())[stage] = outcome
+
+    def log_report(self):
+        if not self.enabled:
+            return
+        with self._lock:
+            report = {topic: dict(stages) for topic, stages in self.report.items()}
+        reused = sum(1 for stages in report.values() for outcome in stages.values() if outcome == REUSED)
+        logger.info(f"Checkpoints for {self.edition} {self.run_date}: {reused} stages reused")
+        for topic, stages in report.items():
+            logger.info(f"  {topic}: " + ', '.join(f"{stage} {outcome}" for stage, outcome in stages.items()))
+
+    def prune(self, retention_days: Optional[int] = None) -> int:
+        retention_days = retention_days or settings.CHECKPOINT_RETENTION_DAYS
+        cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+        try:
+            self.ensure_table()
+            with SessionLocal() as db:
+                deleted = db.execute(
+                    text("DELETE FROM pipeline_checkpoints WHERE created_at < :cutoff"),
+                    {"cutoff": cutoff},
+                ).rowcount
+                db.commit()
+        except Exception as e:
+            logger.error(f"Error pruning pipeline checkpoints: {e}")
+            return 0
+        return deleted
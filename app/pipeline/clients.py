@@ -0,0 +1,18 @@
+# app/pipeline/clients.py
+#
+# Process-wide clients shared by every topic in a run. They are created lazily
+# on first use so importing the pipeline stays cheap.
+
+from app.pipeline.extract import close_extractor
+from app.pipeline.http_client import close_http_session
+from app.pipeline.images import close_image_cache
+from app.pipeline.llm import close_llm_executor
+from app.pipeline.stages import close_process_pool
+
+
+def close_clients():
+    close_llm_executor()
+    close_extractor()
+    close_process_pool()
+    close_image_cache()
+    close_http_session()
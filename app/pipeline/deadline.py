@@ -0,0 +1,48 @@
+# app/pipeline/deadline.py
+#
+# Time budgets for a run and for each topic in it. Topic work runs in worker
+# threads, which cannot be interrupted from outside, so a Deadline is passed
+# down and checked between stages; calls onto the shared background loops
+# (LLM, extraction, images) wait at most the remaining time and cancel the
+# coroutine when it runs out. A topic's deadline never outlives its run's.
+
+import threading
+import time
+from typing import Optional
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a topic or run has used up its time or was cancelled."""
+
+
+class Deadline:
+    def __init__(self, seconds: Optional[float] = None, parent: Optional['Deadline'] = None):
+        self.parent = parent
+        self.expires_at = time.monotonic() + seconds if seconds else None
+        if parent is not None and parent.expires_at is not None:
+            self.expires_at = min(self.expires_at or parent.expires_at, parent.expires_at)
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set() or (self.parent is not None and self.parent.cancelled)
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left, or None when there is no time limit."""
+        if self.cancelled:
+            return 0.0
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    def check(self, stage: str = ''):
+        if self.expired():
+            reason = 'cancelled' if self.cancelled else 'deadline exceeded'
+            raise DeadlineExceeded(f"{reason} before {stage}" if stage else reason)
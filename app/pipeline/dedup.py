@@ -0,0 +1,134 @@
+# app/pipeline/dedup.py
+#
+# Near-duplicate clustering for syndicated stories. Each article's normalized
+# text is cut into character shingles and summarized with a MinHash signature
+# (one-permutation hashing, so a signature costs a single pass over the text);
+# locality-sensitive hashing over signature bands proposes candidate pairs, so
+# only articles that already look alike are compared. Candidates whose
+# estimated Jaccard similarity reaches the threshold are merged into one
+# cluster and the best article of each cluster is kept. Work grows roughly
+# linearly with the number of articles.
+
+import re
+import zlib
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+DEFAULT_THRESHOLD = 0.6
+SHINGLE_SIZE = 5
+NUM_PERM = 64
+
+_BIN_BITS = 6  # NUM_PERM == 1 << _BIN_BITS
+_EMPTY = 1 << 32
+_NON_WORD = re.compile(r'[^a-z0-9]+')
+
+
+def normalize_text(text: str) -> str:
+    return _NON_WORD.sub(' ', (text or '').lower()).strip()
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[int]:
+    normalized = normalize_text(text)
+    if len(normalized) <= size:
+        return {zlib.crc32(normalized.encode('utf-8'))} if normalized else set()
+    return {
+        zlib.crc32(normalized[i:i + size].encode('utf-8'))
+        for i in range(len(normalized) - size + 1)
+    }
+
+
+def minhash(shingle_set: Set[int]) -> Tuple[int, ...]:
+    """One-permutation MinHash: each shingle hash lands in one of NUM_PERM bins.
+
+    Every bin keeps its smallest value, which costs one pass over the shingles
+    instead of one per permutation. Empty bins borrow from the next non-empty
+    bin (rotation densification) so similar short texts still agree.
+    """
+    bins = [_EMPTY] * NUM_PERM
+    for shingle in shingle_set:
+        slot = shingle & (NUM_PERM - 1)
+        value = shingle >> _BIN_BITS
+        if value < bins[slot]:
+            bins[slot] = value
+    if _EMPTY in bins and shingle_set:
+        for slot in range(NUM_PERM):
+            offset = 1
+            while bins[slot] == _EMPTY:
+                candidate = bins[(slot + offset) % NUM_PERM]
+                if candidate != _EMPTY:
+                    bins[slot] = candidate + offset * _EMPTY
+                offset += 1
+    return tuple(bins)
+
+
+def _bands_for(threshold: float) -> int:
+    """Number of LSH bands whose S-curve midpoint sits just below ``threshold``."""
+    best, best_gap = 1, float('inf')
+    for bands in range(1, NUM_PERM + 1):
+        if NUM_PERM % bands:
+            continue
+        rows = NUM_PERM // bands
+        midpoint = (1 / bands) ** (1 / rows)
+        # Aim slightly low so true near-duplicates are rarely missed
+        gap = abs(midpoint - (threshold - 0.1))
+        if gap < best_gap:
+            best, best_gap = bands, gap
+    return best
+
+
+def _similarity(left: Tuple[int, ...], right: Tuple[int, ...]) -> float:
+    return sum(1 for x, y in zip(left, right) if x == y) / NUM_PERM
+
+
+def cluster(texts: Sequence[str], threshold: float = DEFAULT_THRESHOLD) -> List[List[int]]:
+    """Group indices of ``texts`` whose estimated Jaccard similarity is at least ``threshold``."""
+    signatures = [minhash(shingles(text)) for text in texts]
+    bands = _bands_for(threshold)
+    rows = NUM_PERM // bands
+
+    parent = list(range(len(texts)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for band in range(bands):
+        buckets: Dict[Tuple[int, ...], List[int]] = {}
+        for index, signature in enumerate(signatures):
+            buckets.setdefault(signature[band * rows:(band + 1) * rows], []).append(index)
+        for members in buckets.values():
+            for position, left in enumerate(members):
+                for right in members[position + 1:]:
+                    root_left, root_right = find(left), find(right)
+                    if root_left != root_right and _similarity(signatures[left], signatures[right]) >= threshold:
+                        parent[max(root_left, root_right)] = min(root_left, root_right)
+
+    groups: Dict[int, List[int]] = {}
+    for index in range(len(texts)):
+        groups.setdefault(find(index), []).append(index)
+    return list(groups.values())
+
+
+def deduplicate(items: Iterable, text: Callable[[object], str],
+                key: Optional[Callable[[object], float]] = None,
+                threshold: Optional[float] = None) -> List:
+    """Keep one item per near-duplicate cluster, preserving input order.
+
+    The kept item is the one with the highest ``key`` (the earliest on ties, or
+    simply the earliest when no key is given).
+    """
+    items = list(items)
+    return keep_best(items, cluster([text(item) for item in items], threshold or DEFAULT_THRESHOLD), key)
+
+
+def keep_best(items: Sequence, groups: Iterable[List[int]],
+              key: Optional[Callable[[object], float]] = None) -> List:
+    """The best item of each group of indices from ``cluster``, in input order."""
+    keep = set()
+    for members in groups:
+        if key is None:
+            keep.add(members[0])
+        else:
+            keep.add(max(members, key=lambda index: (key(items[index]), -index)))
+    return [item for index, item in enumerate(items) if index in keep]
@@ -0,0 +1,153 @@
+# app/pipeline/digest.py
+#
+# One structured LLM call per topic. The model returns the highlights (with
+# icon, color and category), the newsletter title and the summary as a single
+# JSON object; every field is validated on its own so one bad field falls back
+# to the topic default instead of discarding the whole response.
+
+import json
+import logging
+import re
+from typing import Dict, List, Tuple
+
+from app.core.config import settings
+from app.pipeline.prompt import compact
+from app.pipeline.topics import TopicConfig
+
+logger = logging.getLogger(__name__)
+
+HIGHLIGHT_COUNT = 5
+ERROR_SUMMARY = "Error generating summary."
+
+_HEX_COLOR = re.compile(r'^#(?:[0-9a-fA-F]{3}){1,2}$')
+_ICON_NAME = re.compile(r'^[a-z0-9][a-z0-9-]*$')
+
+
+def _describe(index: int, article) -> str:
+    text = (f"[{index}] Title: {article.get('title', 'Untitled Article')}\n"
+            f"Description: {article.get('description', '')}")
+    body = getattr(article, 'body', '')
+    if body:
+        text += f"\nExcerpt: {compact(body, settings.EXTRACT_EXCERPT_CHARS)}"
+    return text
+
+
+def build_digest_messages(config: TopicConfig, articles: List[dict]) -> List[Dict[str, str]]:
+    if config.min_highlight_length:
+        length_rule = f"between {config.min_highlight_length} and {config.max_highlight_length} characters"
+    else:
+        length_rule = f"of maximum {config.max_highlight_length} characters"
+
+    articles_text = "\n\n".join(
+        _describe(index, article) for index, article in enumerate(articles[:HIGHLIGHT_COUNT])
+    )
+
+    system = f"""You are an AI assistant that curates {config.label} news. You write concise highlights,
+    suggest relevant icons and colors, and create engaging titles and summaries.
+
+    Output format must be valid JSON:
+    {{
+        "highlights": [
+            {{
+                "index": article number,
+                "text": "highlight {length_rule}",
+                "icon": "simple Font Awesome icon name",
+                "color": "vibrant hexadecimal color code",
+                "category": "one of: {', '.join(config.highlight_categories)}"
+            }}
+        ],
+        "title": "{config.title_format}",
+        "summary": "4-line overview"
+    }}"""
+
+    user = f"""For each of these {config.label} articles, rephrase it into one highlight:
+
+    {articles_text}
+
+    Then, based on the highlights:
+    1. Generate a catchy and informative title that summarizes the main themes or most significant
+       developments. The title should be engaging and specific to {config.title_focus} mentioned in
+       the highlights, in the format "{config.title_format}" (for example: "{config.title_example}").
+    2. Create a 4-line overview in a human tone that is engaging and summarizes the main themes
+       or developments in {config.summary_focus}."""
+
+    return [
+        {"role": "system", "content": system},
+        {"role": "user", "content": user},
+    ]
+
+
+def fit_highlight(config: TopicConfig, text: str) -> str:
+    max_length = config.max_highlight_length
+    if len(text) > max_length:
+        return text[:max_length - 3] + "..."
+    return text.ljust(config.min_highlight_length)
+
+
+def fallback_digest(config: TopicConfig, articles: List[dict]) -> Tuple[List[tuple], str, str]:
+    highlights = [
+        (fit_highlight(config, article.get('title', 'Untitled Article')), *config.fallback_highlight)
+        for article in articles[:HIGHLIGHT_COUNT]
+    ]
+    return highlights, config.default_title, ERROR_SUMMARY
+
+
+def parse_digest(config: TopicConfig, content: str, articles: List[dict]) -> Tuple[List[tuple], str, str]:
+    """Validate the model's JSON and fill any missing or malformed field from the topic defaults."""
+    try:
+        result = json.loads(content)
+        if not isinstance(result, dict):
+            raise ValueError("Digest response is not a JSON object")
+    except ValueError as e:
+        logger.error(f"Invalid digest response for {config.name}: {e}")
+        return fallback_digest(config, articles)
+
+    default_icon, default_color, default_category = config.fallback_highlight
+    by_index = {}
+    raw_highlights = result.get('highlights')
+    if not isinstance(raw_highlights, list):
+        logger.warning(f"Digest for {config.name} has no highlights list")
+        raw_highlights = []
+
+    slots = range(min(len(articles), HIGHLIGHT_COUNT))
+    for item in raw_highlights:
+        if not isinstance(item, dict):
+            continue
+        text = item.get('text')
+        if not isinstance(text, str) or not text.strip():
+            continue
+        index = item.get('index')
+        if not isinstance(index, int) or index not in slots or index in by_index:
+            # Missing or clashing index: take the first article without a highlight
+            index = next((slot for slot in slots if slot not in by_index), None)
+            if index is None:
+                break
+        icon = item.get('icon')
+        if not isinstance(icon, str) or not _ICON_NAME.match(icon.strip().lower()):
+            icon = default_icon
+        color = item.get('color')
+        if not isinstance(color, str) or not _HEX_COLOR.match(color.strip()):
+            color = default_color
+        category = item.get('category')
+        if category not in config.highlight_categories:
+            category = default_category
+        by_index[index] = (fit_highlight(config, text.strip()), icon.strip().lower(), color.strip(), category)
+
+    highlights = []
+    for index, article in enumerate(articles[:HIGHLIGHT_COUNT]):
+        if index in by_index:
+            highlights.append(by_index[index])
+        else:
+            highlights.append((fit_highlight(config, article.get('title', 'Untitled Article')), *config.fallback_highlight))
+
+    title = result.get('title')
+    if not isinstance(title, str) or not title.strip():
+        title = config.default_title
+    summary = result.get('summary')
+    if isinstance(summary, list):
+        summary = '\n'.join(str(line) for line in summary)
+    if not isinstance(summary, str) or not summary.strip():
+        summary = ERROR_SUMMARY
+
+    return highlights, title.strip().strip('"'), summary.strip()
+
@@ -0,0 +1,205 @@
+# app/pipeline/extract.py
+#
+# Full-article text extraction for the digest prompts. Pages are downloaded on
+# a background event loop with a global and a per-host concurrency cap, a
+# timeout and a size limit, so one slow or huge site cannot stall a run. HTML
+# is parsed with lxml as the 'extract' stage (app/pipeline/stages.py), in the
+# shared process pool by default, to keep parsing off the event loop and
+# outside the GIL; the extracted text is cached on disk by URL so reruns and
+# articles shared between topics are only downloaded once.
+
+import asyncio
+import logging
+import os
+import re
+import threading
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from app.core.config import settings
+from app.pipeline.cache import DiskCache, make_key
+from app.pipeline.deadline import Deadline
+from app.pipeline.http_client import close_async_session, get_async_session
+from app.pipeline.loop import BackgroundLoop
+from app.pipeline.stages import run_stage_async
+
+try:
+    import lxml.html
+except ImportError:  # pragma: no cover - lxml is in requirements.txt
+    lxml = None
+
+logger = logging.getLogger(__name__)
+
+_BOILERPLATE_TAGS = ('script', 'style', 'noscript', 'nav', 'footer', 'header', 'aside', 'form')
+_CONTENT_TAGS = ('article', 'main', 'body')
+_WHITESPACE = re.compile(r'\s+')
+_CHUNK_SIZE = 64 * 1024
+
+
+def _extract_with_lxml(body: bytes) -> str:
+    document = lxml.html.document_fromstring(body)
+    for element in list(document.iter(*_BOILERPLATE_TAGS)):
+        element.drop_tree()
+    for tag in _CONTENT_TAGS:
+        found = document.find(f'.//{tag}') if tag != 'body' else document.body
+        if found is not None:
+            return ' '.join(found.itertext())
+    return ' '.join(document.itertext())
+
+
+def _extract_with_bs4(body: bytes) -> str:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(body, 'html.parser')
+    for element in soup(list(_BOILERPLATE_TAGS)):
+        element.decompose()
+    content = soup.find('article') or soup.find('main') or soup.find('body') or soup
+    return content.get_text(' ')
+
+
+def extract_text(body: bytes) -> str:
+    """Readable text of an HTML page's main content, whitespace collapsed.
+
+    May run in the stage process pool, so it must stay a picklable top-level
+    function.
+    """
+    if not body:
+        return ''
+    try:
+        text = _extract_with_lxml(body) if lxml is not None else _extract_with_bs4(body)
+    except Exception:
+        return ''
+    return _WHITESPACE.sub(' ', text).strip()
+
+
+class ArticleExtractor:
+    def __init__(self, max_concurrency: int, per_host: int, timeout: float, max_bytes: int,
+                 cache: Optional[DiskCache] = None):
+        self.per_host = per_host
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.max_bytes = max_bytes
+        self.cache = cache
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._stats = {'fetched': 0, 'cached': 0, 'failed': 0, 'too_large': 0}
+
+        self._runner = BackgroundLoop('article-extractor')
+        # Created on the extractor loop so it is bound to it
+        self._runner.run(self._setup(max_concurrency))
+
+    async def _setup(self, max_concurrency: int):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        # Only touched from the extractor loop, so no lock is needed
+        host = urlsplit(url).netloc.lower()
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._host_semaphores[host] = asyncio.Semaphore(self.per_host)
+        return semaphore
+
+    async def _download(self, url: str) -> Optional[bytes]:
+        session = get_async_session()
+        async with self._semaphore, self._host_semaphore(url):
+            async with session.get(url, timeout=self.timeout) as response:
+                if response.status != 200:
+                    return None
+                content_type = response.headers.get('Content-Type', '')
+                if content_type and 'html' not in content_type:
+                    return None
+                if (response.content_length or 0) > self.max_bytes:
+                    self._stats['too_large'] += 1
+                    return None
+                body = bytearray()
+                async for chunk in response.content.iter_chunked(_CHUNK_SIZE):
+                    body.extend(chunk)
+                    if len(body) > self.max_bytes:
+                        self._stats['too_large'] += 1
+                        return None
+                return bytes(body)
+
+    async def _extract_one(self, url: str) -> str:
+        key = make_key('article-text', url) if self.cache is not None else None
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self._stats['cached'] += 1
+                return cached.decode('utf-8')
+
+        try:
+            body = await self._download(url)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"Error fetching full content from {url}: {type(e).__name__} {e}")
+            body = None
+        if not body:
+            self._stats['failed'] += 1
+            return ''
+
+        text = await run_stage_async('extract', extract_text, body)
+        self._stats['fetched'] += 1
+        if key is not None and text:
+            self.cache.set(key, text.encode('utf-8'))
+        return text
+
+    async def _extract(self, urls: Iterable[str]) -> Dict[str, str]:
+        urls = list(dict.fromkeys(url for url in urls if url))
+        texts = await asyncio.gather(*(self._extract_one(url) for url in urls))
+        return dict(zip(urls, texts))
+
+    def extract(self, urls: Iterable[str], deadline: Optional[Deadline] = None) -> Dict[str, str]:
+        """Article text by URL (empty when a page could not be fetched or parsed)."""
+        return self._runner.run(self._extract(urls), deadline)
+
+    async def extract_async(self, urls: Iterable[str]) -> Dict[str, str]:
+        return await self._runner.run_async(self._extract(urls))
+
+    def stats(self) -> dict:
+        stats = dict(self._stats)
+        if self.cache is not None:
+            stats['cache'] = self.cache.stats()
+        return stats
+
+    def close(self):
+        self._runner.run(close_async_session())
+        self._runner.close()
+        if self.cache is not None:
+            self.cache.close()
+
+
+_lock = threading.Lock()
+_extractor = None
+
+
+def get_extractor() -> ArticleExtractor:
+    global _extractor
+    if _extractor is None:
+        with _lock:
+            if _extractor is None:
+                cache = DiskCache(
+                    os.path.join(settings.PIPELINE_CACHE_DIR, 'extract.sqlite'),
+                    ttl_seconds=settings.EXTRACT_CACHE_TTL_SECONDS,
+                    max_bytes=settings.EXTRACT_CACHE_MAX_MB * 1024 * 1024,
+                )
+                _extractor = ArticleExtractor(
+                    max_concurrency=settings.EXTRACT_MAX_CONCURRENCY,
+                    per_host=settings.EXTRACT_PER_HOST,
+                    timeout=settings.EXTRACT_TIMEOUT_SECONDS,
+                    max_bytes=settings.EXTRACT_MAX_BYTES,
+                    cache=cache,
+                )
+                logger.info(f"Created article extractor (concurrency {settings.EXTRACT_MAX_CONCURRENCY})")
+    return _extractor
+
+
+def log_extract_stats():
+    if _extractor is not None:
+        logger.info(f"Article extraction: {_extractor.stats()}")
+
+
+def close_extractor():
+    global _extractor
+    with _lock:
+        if _extractor is not None:
+            _extractor.close()
+            _extractor = None
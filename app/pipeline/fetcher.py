@@ -0,0 +1,448 @@
+# app/pipeline/fetcher.py
+#
+# Shared daily fetcher engine. Everything that used to be copy-pasted into each
+# app/NewsAPI/<Topic>.py module lives here; the per-topic data comes from a
+# TopicConfig in app/pipeline/topics.py.
+
+import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import Optional
+
+import requests
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.pipeline.articles import ArticleRecord
+from app.pipeline.checkpoint import RunCheckpoints, fingerprint
+from app.pipeline.deadline import Deadline, DeadlineExceeded
+from app.pipeline.dedup import DEFAULT_THRESHOLD, cluster, keep_best
+from app.pipeline.digest import (
+    ERROR_SUMMARY, HIGHLIGHT_COUNT, build_digest_messages, fallback_digest, parse_digest,
+)
+from app.pipeline.extract import get_extractor
+from app.pipeline.http_client import get_http_session
+from app.pipeline.images import get_image_cache, thumbnail_url
+from app.pipeline.llm import get_llm_executor
+from app.pipeline.newsapi import NewsApiError, get_everything
+from app.pipeline.newsletters import NewsletterBatch, PendingNewsletter
+from app.pipeline.paging import PageBudget, TopKTracker
+from app.pipeline.ranking import TfidfRanker, build_profile, tfidf_available, top_k
+from app.pipeline.ratelimit import QuotaExhausted
+from app.pipeline.render import render_daily
+from app.pipeline.seen import SeenArticleIndex
+from app.pipeline.stages import rank_articles, run_stage, score_articles, topic_keywords
+from app.pipeline.topics import TopicConfig, get_topic
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_query(query):
+    """Collapse whitespace so trivially different spellings of a query share one request."""
+    return ' '.join(query.split())
+
+
+def iter_query_pages(query, date, language='en', sort_by='relevancy', session=None, budget=None):
+    """Yield one list of articles per NewsAPI page until results run out.
+
+    The first page is always requested; later pages need the query to still have
+    pages left (NEWS_API_MAX_PAGES, and within the plan's NEWS_API_MAX_RESULTS
+    and the query's totalResults) and, when given, a token from ``budget``.
+    Callers stop early simply by not asking for the next page.
+    """
+    page_size = settings.NEWS_API_PAGE_SIZE
+    # A page starting past the plan's result cap is refused but still costs a request
+    max_pages = min(settings.NEWS_API_MAX_PAGES, -(-settings.NEWS_API_MAX_RESULTS // page_size))
+    params = {
+        'q': normalize_query(query),
+        'from': date.isoformat(),
+        'to': (date + timedelta(days=1)).isoformat(),
+        'language': language,
+        'sortBy': sort_by,
+        'pageSize': page_size,
+    }
+
+    for page in range(1, max(max_pages, 1) + 1):
+        if page > 1:
+            if budget is not None and not budget.take():
+                return
+            params['page'] = page
+
+        try:
+            data = get_everything(params, session=session)
+        except (NewsApiError, QuotaExhausted) as e:
+            logger.error(f"Error fetching news for {query!r}: {e}")
+            return
+        except requests.RequestException as e:
+            logger.error(f"Error fetching news: {e}")
+            if hasattr(e, 'response') and e.response is not None:
+                logger.error(f"Response content: {e.response.content}")
+            return
+
+        articles = data.get('articles', [])
+        yield articles
+        if len(articles) < page_size or page * page_size >= data.get('totalResults', 0):
+            return
+
+
+def fetch_query(query, date, language='en', sort_by='relevancy', session=None):
+    """First page of results for ``query``."""
+    return next(iter_query_pages(query, date, language, sort_by, session), [])
+
+
+def _analysis_text(article):
+    """(title + description, content): the texts a NewsAPI article is scored and categorized on."""
+    text = f"{article.get('title') or ''} {article.get('description') or ''}"
+    return text, article.get('content') or ''
+
+
+def is_usable(article):
+    return bool(article.get('title') and article.get('description') and article.get('urlToImage'))
+
+
+class TopicFetcher:
+    def __init__(self, config: TopicConfig, http_session=None, llm=None):
+        self.config = config
+        self.openai_model = settings.OPENAI_MODEL
+        self.http = http_session or get_http_session()
+        self.llm = llm or get_llm_executor()
+        self.seen = SeenArticleIndex('daily')
+        self.keywords = topic_keywords(config)
+        self.scorer = self.keywords.scorer
+        self._ranker = None
+
+    def get_active_subscriptions(self):
+        try:
+            with SessionLocal() as db:
+                result = db.execute(text("""
+                    SELECT s.id, s.email
+                    FROM public.subscriptions s
+                    JOIN public.subscription_topic st ON s.id = st.subscription_id
+                    WHERE s.is_active = true AND st.topic_id = :topic_id
+                """), {"topic_id": self.config.topic_id})
+                return [{"id": str(row[0]), "email": row[1]} for row in result.fetchall()]
+        except Exception as e:
+            logger.error(f"Error fetching active subscriptions for {self.config.name}: {e}")
+            return []
+
+    def fetch_news(self, date, language='en', sort_by='relevancy', prefetched=None):
+        """Top articles for the topic. ``prefetched`` maps query -> the topic's articles from a QueryPlan."""
+        return self.fetch_candidates(date, language, sort_by, prefetched)[:self.config.top_n]
+
+    def fetch_candidates(self, date, language='en', sort_by='relevancy', prefetched=None,
+                         deadline: Optional[Deadline] = None):
+        """Every usable, deduplicated article for the topic, best first."""
+        all_articles = []
+
+        if prefetched is not None:
+            for query in self.config.queries:
+                all_articles.extend(prefetched.get(normalize_query(query), []))
+        else:
+            tracker = TopKTracker(self.config.top_n)
+            budget = PageBudget(settings.NEWS_API_EXTRA_PAGES_PER_TOPIC)
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                future_to_query = {
+                    executor.submit(self._fetch_news, query, date, language, sort_by, tracker, budget): query
+                    for query in self.config.queries
+                }
+                for future in as_completed(future_to_query):
+                    query = future_to_query[future]
+                    try:
+                        all_articles.extend(future.result())
+                    except Exception as exc:
+                        logger.error(f'{query} generated an exception: {exc}')
+
+        # Filter out articles without content or images
+        filtered_articles = [article for article in all_articles if is_usable(article)]
+        # Skip stories this topic already featured on earlier days
+        filtered_articles = self.seen.filter_unseen(filtered_articles, self.config.topic_id)
+
+        return self.attach_thumbnails(self.filter_and_sort_articles(filtered_articles), deadline)
+
+    def _fetch_news(self, query, date, language, sort_by, tracker=None, budget=None):
+        """Stream pages for one query, stopping once a page no longer improves the topic's top-k."""
+        articles = []
+        for page in iter_query_pages(query, date, language, sort_by, session=self.http, budget=budget):
+            records = self.score_page(page)
+            articles.extend(records)
+            if tracker is None or not tracker.offer(record.score for record in records):
+                break
+        return articles
+
+    def score_page(self, page):
+        """Records for a page's usable articles, scored the way the topic ranks them.
+
+        The scores only decide whether a page improves the topic's top-k; with
+        RANKER=tfidf the candidates are scored again as one batch once fetched.
+        """
+        records = self.enrich_all([article for article in page if is_usable(article)])
+        ranker = self.get_ranker()
+        if ranker is not None and records:
+            scores = run_stage('rank', rank_articles, ranker.profile, [record.text for record in records])
+            for record, score in zip(records, scores):
+                record.score = score
+        return records
+
+    def filter_and_sort_articles(self, articles):
+        """Deduplicated records, best first, cut to ``top_n * CANDIDATE_FACTOR``."""
+        records = self.enrich_all(articles)
+        ranker = self.get_ranker()
+        if ranker is not None:
+            # TF-IDF relevance replaces the keyword count score for the whole batch
+            scores = run_stage('rank', rank_articles, ranker.profile, [record.text for record in records])
+            for record, score in zip(records, scores):
+                record.score = score
+        records = self.remove_duplicates(records)
+
+        limit = self.config.top_n * settings.CANDIDATE_FACTOR
+        if ranker is not None:
+            return [records[index] for index in top_k([record.score for record in records], limit)]
+        return sorted(records, key=lambda record: record.score, reverse=True)[:limit]
+
+    def get_ranker(self):
+        """The topic's TfidfRanker when RANKER=tfidf and numpy is installed; None means keyword scores."""
+        if settings.RANKER != 'tfidf':
+            return None
+        if self._ranker is None:
+            if not tfidf_available():
+                logger.warning("RANKER=tfidf requires numpy; using keyword scores")
+                return None
+            recent = self.seen.recent_titles(self.config.topic_id, settings.RANKER_RECENT_ARTICLES)
+            self._ranker = TfidfRanker(build_profile(self.scorer.weights, recent, settings.RANKER_RECENT_WEIGHT))
+        return self._ranker
+
+    def enrich(self, article):
+        """Build the ArticleRecord for a NewsAPI article; records pass through unchanged."""
+        if isinstance(article, ArticleRecord):
+            return article
+        return self._record(article, self.keywords.analyze(*_analysis_text(article)))
+
+    def enrich_all(self, articles):
+        """enrich() for a batch, with the keyword analysis run as one 'score' stage."""
+        pending = [article for article in articles if not isinstance(article, ArticleRecord)]
+        if not pending:
+            return list(articles)
+        analyses = iter(run_stage('score', score_articles, self.config, [_analysis_text(article) for article in pending]))
+        return [
+            article if isinstance(article, ArticleRecord) else self._record(article, next(analyses))
+            for article in articles
+        ]
+
+    def _record(self, article, analysis):
+        hits, score, categories = analysis
+        title = article.get('title') or ''
+        description = article.get('description') or ''
+        return ArticleRecord(
+            raw=article,
+            title=title,
+            description=description,
+            url=article.get('url') or '',
+            image_url=article.get('urlToImage') or '',
+            text=f"{title} {description}".lower(),
+            keyword_hits=hits,
+            score=score,
+            categories=categories,
+        )
+
+    def remove_duplicates(self, articles):
+        """Collapse syndicated copies of a story, keeping the highest scoring one."""
+        texts = [f"{article.get('title') or ''} {article.get('description') or ''}" for article in articles]
+        groups = run_stage('dedup', cluster, texts, self.config.similarity_threshold or DEFAULT_THRESHOLD)
+        return keep_best(articles, groups, key=lambda article: self.enrich(article).score)
+
+    def generate_digest(self, articles, deadline: Optional[Deadline] = None):
+        """Highlights, title and summary for the top articles from a single JSON-mode LLM call."""
+        request = dict(
+            model=self.openai_model,
+            messages=build_digest_messages(self.config, articles),
+            max_tokens=900,
+            temperature=0.7,
+            response_format={"type": "json_object"},
+        )
+        try:
+            response = self.llm.complete_sync(topic=self.config.name, deadline=deadline, **request)
+            digest = parse_digest(self.config, response.choices[0].message.content, articles)
+            if digest[2] == ERROR_SUMMARY:
+                # Unusable response: make the retry on the next run ask the model again
+                self.llm.evict(**request)
+            return digest
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            logger.error(f"Error generating {self.config.name} digest with OpenAI: {e}")
+            return fallback_digest(self.config, articles)
+
+    def store_newsletter(self, title, web_content, email_content, topic_id, subscription_ids):
+        try:
+            with SessionLocal() as db:
+                result = db.execute(text("""
+                    INSERT INTO newsletters (title, content, email_content, topic_id, subscription_ids)
+                    VALUES (:title, :content, :email_content, :topic_id, :subscription_ids)
+                    RETURNING id
+                """), {
+                    "title": title,
+                    "content": web_content,
+                    "email_content": email_content,
+                    "topic_id": topic_id,
+                    "subscription_ids": ','.join(subscription_ids),
+                })
+                inserted_id = result.scalar()
+                db.commit()
+                logger.info(f"Newsletter stored in database with ID: {inserted_id}")
+                return inserted_id
+        except Exception as e:
+            logger.error(f"Error storing newsletter in database: {e}")
+            return None
+
+    def attach_thumbnails(self, records, deadline: Optional[Deadline] = None):
+        """Keep records with a usable image, pointing them at the cached thumbnail."""
+        if not settings.IMAGE_VALIDATION_ENABLED:
+            return records
+        digests = get_image_cache().thumbnails((record.image_url for record in records), deadline)
+        usable = []
+        for record in records:
+            digest = digests.get(record.image_url)
+            if digest:
+                record.image_url = thumbnail_url(digest)
+                usable.append(record)
+        if len(usable) < len(records):
+            logger.info(f"Dropped {len(records) - len(usable)} {self.config.name} articles with unusable images")
+        return usable
+
+    def fetch_full_content(self, url):
+        return get_extractor().extract([url]).get(url) or None
+
+    def attach_bodies(self, articles, deadline: Optional[Deadline] = None):
+        """Fill in ``body`` for records that are sent to the digest prompt."""
+        if not settings.EXTRACT_ENABLED:
+            return
+        records = [article for article in articles if isinstance(article, ArticleRecord) and article.url]
+        bodies = get_extractor().extract((article.url for article in records), deadline)
+        for article in records:
+            article.body = bodies.get(article.url, '')
+
+    def categorize_article(self, article):
+        return self.enrich(article).categories
+
+
+def render_newsletter(fetcher, dynamic_title, summary, highlights, articles):
+    """(web_content, email_content) for the topic's selected articles."""
+    try:
+        # The templates only read the display fields, so the rest is not shipped to the render stage
+        records = [
+            replace(record, raw={}, text='', keyword_hits=Counter(), body='')
+            for record in fetcher.enrich_all(articles)
+        ]
+        return run_stage('render', render_daily, dynamic_title, summary, highlights, records)
+    except Exception as e:
+        logger.error(f"Error rendering {fetcher.config.name} newsletter: {e}")
+        return None, None
+
+
+def run_topic(config: TopicConfig, date=None, prefetched=None):
+    """Fetch, summarize, render and store one topic's newsletter (the old per-module main())."""
+    fetcher = TopicFetcher(config)
+
+    if date is None:
+        date = datetime.now().date() - timedelta(days=1)
+
+    logger.info(f"Fetching top {config.top_n} {config.name} news articles for {date}...")
+    articles = fetcher.fetch_news(date, prefetched=prefetched)
+    return publish_topic(fetcher, articles, date)
+
+
+def publish_topic(fetcher: TopicFetcher, articles, date, checkpoints: Optional[RunCheckpoints] = None,
+                  deadline: Optional[Deadline] = None, batch: Optional[NewsletterBatch] = None):
+    """Summarize, render and store a newsletter from already selected articles.
+
+    With ``checkpoints``, each stage's result is saved once it succeeds and a
+    rerun for the same day resumes after the last completed stage. With
+    ``deadline``, DeadlineExceeded is raised instead of starting a stage after
+    it has run out, so an abandoned topic never stores a newsletter late.
+    With ``batch``, the newsletter is added to it instead of being stored and
+    None is returned; the batch's flush stores it and saves the store checkpoint.
+    """
+    if deadline is None:
+        deadline = Deadline()
+    config = fetcher.config
+    if not articles:
+        logger.info(f"No {config.name} articles found for {date}.")
+        return None
+    if checkpoints is None:
+        checkpoints = RunCheckpoints('daily', date, enabled=False)
+    # A rerun that assigns this topic other articles must not reuse their digest or HTML
+    inputs = fingerprint([article.url for article in articles])
+
+    def digest():
+        deadline.check('digest')
+        fetcher.attach_bodies(articles[:HIGHLIGHT_COUNT], deadline)
+        return fetcher.generate_digest(articles, deadline)
+
+    def render():
+        highlights, dynamic_title, summary = checkpoints.stage(
+            config.name, 'digest', digest,
+            decode=lambda saved: ([tuple(highlight) for highlight in saved[0]], saved[1], saved[2]),
+            # A fallback digest is not saved so the next run retries the LLM
+            keep=lambda result: result[2] != ERROR_SUMMARY,
+            inputs=inputs,
+        )
+        logger.info(f"Highlights: {highlights}")
+        logger.info(f"Summary: {summary}")
+        logger.info(f"Dynamic Title: {dynamic_title}")
+        return (dynamic_title, *render_newsletter(fetcher, dynamic_title, summary, highlights, articles))
+
+    def store():
+        dynamic_title, web_content, email_content = checkpoints.stage(
+            config.name, 'render', render, decode=tuple, keep=lambda result: bool(result[1] and result[2]),
+            inputs=inputs,
+        )
+        if not (web_content and email_content):
+            logger.error("Failed to generate HTML content")
+            return None
+
+        deadline.check('store')
+        subscriptions = fetcher.get_active_subscriptions()
+        subscription_ids = [sub['id'] for sub in subscriptions]
+
+        if batch is not None:
+            batch.add(PendingNewsletter(
+                config.name, dynamic_title, web_content, email_content, config.topic_id, subscription_ids, articles
+            ))
+            logger.info(f"Newsletter for {config.name} added to the run's batch")
+            return None
+
+        logger.info("Storing newsletter for all active subscriptions...")
+        inserted_id = fetcher.store_newsletter(
+            dynamic_title, web_content, email_content, config.topic_id, subscription_ids
+        )
+        if inserted_id:
+            logger.info(f"Newsletter stored successfully with ID: {inserted_id}")
+            fetcher.seen.mark_seen(articles, config.topic_id)
+        else:
+            logger.error("Failed to store newsletter")
+        return inserted_id
+
+    # A stored newsletter is never stored twice, even if later stages are rerun
+    inserted_id = checkpoints.stage(config.name, 'store', store, keep=bool)
+
+    logger.info(f"Found {len(articles)} unique {config.name} articles for {date}.")
+    return inserted_id
+
+
+def publish_job(job, deadline: Deadline):
+    """Queue handler for a topic's 'publish' job (app/pipeline/jobs.py); raises so the job is retried."""
+    config = get_topic(job.topic)
+    if config is None:
+        raise ValueError(f"No registered fetcher for topic {job.topic}")
+    articles = [ArticleRecord.from_dict(article) for article in job.payload['articles']]
+    checkpoints = RunCheckpoints(job.edition, job.run_date)
+    inserted_id = publish_topic(TopicFetcher(config), articles, job.run_date, checkpoints, deadline)
+    if not inserted_id:
+        raise RuntimeError(f"No {config.name} newsletter was stored")
+    return {'newsletter_id': inserted_id}
+
+
+JOB_HANDLERS = {'publish': publish_job}
@@ -0,0 +1,100 @@
+# app/pipeline/http_client.py
+#
+# Connection-pooled HTTP clients shared by the daily and weekly fetchers.
+# The thread-based daily fetchers use one requests session; the asyncio-based
+# weekly fetchers use one aiohttp session per event loop. Both keep
+# connections alive between requests, cap connections per host and apply
+# default timeouts.
+
+import asyncio
+import logging
+import threading
+import weakref
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "CurioDaily/1.0 (+https://www.thecuriodaily.com)"
+
+_lock = threading.Lock()
+_http_session = None
+_async_sessions = weakref.WeakKeyDictionary()
+
+
+class TimeoutSession(requests.Session):
+    """requests.Session that applies a default timeout to every request."""
+
+    def __init__(self, timeout):
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+def _build_http_session() -> requests.Session:
+    session = TimeoutSession((settings.HTTP_CONNECT_TIMEOUT, settings.HTTP_READ_TIMEOUT))
+    # pool_block makes threads wait for a free connection instead of opening
+    # extra ones, so MAX_CONNECTIONS_PER_HOST is a hard per-host cap.
+    adapter = HTTPAdapter(
+        pool_connections=max(1, settings.HTTP_MAX_CONNECTIONS // settings.HTTP_MAX_CONNECTIONS_PER_HOST),
+        pool_maxsize=settings.HTTP_MAX_CONNECTIONS_PER_HOST,
+        pool_block=True,
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['User-Agent'] = USER_AGENT
+    return session
+
+
+def get_http_session() -> requests.Session:
+    global _http_session
+    if _http_session is None:
+        with _lock:
+            if _http_session is None:
+                _http_session = _build_http_session()
+                logger.info("Created shared HTTP session")
+    return _http_session
+
+
+def close_http_session():
+    global _http_session
+    with _lock:
+        if _http_session is not None:
+            _http_session.close()
+            _http_session = None
+
+
+def get_async_session() -> aiohttp.ClientSession:
+    """Return the pooled aiohttp session for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    session = _async_sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=settings.HTTP_MAX_CONNECTIONS,
+            limit_per_host=settings.HTTP_MAX_CONNECTIONS_PER_HOST,
+            keepalive_timeout=settings.HTTP_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=300,
+        )
+        timeout = aiohttp.ClientTimeout(
+            total=settings.HTTP_CONNECT_TIMEOUT + settings.HTTP_READ_TIMEOUT,
+            connect=settings.HTTP_CONNECT_TIMEOUT,
+        )
+        session = aiohttp.ClientSession(
+            connector=connector, timeout=timeout, headers={'User-Agent': USER_AGENT}
+        )
+        _async_sessions[loop] = session
+        logger.info("Created shared async HTTP session")
+    return session
+
+
+async def close_async_session():
+    session = _async_sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
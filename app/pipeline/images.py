@@ -0,0 +1,350 @@
+# app/pipeline/images.py
+#
+# Article image validation and thumbnails. During ingest every candidate image
+# URL is downloaded concurrently (with a size cap), decoded with Pillow and
+# recompressed into a small JPEG thumbnail; URLs that do not point at a usable
+# image are dropped instead of shipping a broken <img> to readers. Thumbnails
+# are content-addressed (key = sha256 of the thumbnail) and stored in Postgres,
+# because the jobs that create them and the web service that serves them at
+# /api/images run in different containers; /api/images resizes them to a
+# whitelisted size and keeps recently served variants in an in-memory LRU.
+
+import asyncio
+import hashlib
+import io
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+
+import aiohttp
+from PIL import Image, ImageOps
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db.session import SessionLocal, ensure_tables
+from app.models.article_thumbnail import ArticleThumbnail
+from app.pipeline.cache import DiskCache, make_key
+from app.pipeline.deadline import Deadline
+from app.pipeline.http_client import close_async_session, get_async_session
+from app.pipeline.loop import BackgroundLoop
+from app.pipeline.render import base_url
+
+logger = logging.getLogger(__name__)
+
+# Sizes the image endpoints will render; anything else is rejected
+THUMBNAIL_SIZES = ((400, 300), (200, 150), (800, 600))
+DEFAULT_SIZE = (400, 300)
+MASTER_SIZE = max(THUMBNAIL_SIZES)
+MIN_DIMENSION = 100  # smaller images are tracking pixels or icons
+JPEG_QUALITY = 80
+PLACEHOLDER_COLOR = (73, 109, 137)
+
+_DIGEST = re.compile(r'^[0-9a-f]{64}$')
+_CHUNK_SIZE = 64 * 1024
+_INVALID = b''
+
+
+def _encode_jpeg(image: Image.Image) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format='JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+
+def make_thumbnail(body: bytes) -> Optional[bytes]:
+    """Master thumbnail (MASTER_SIZE, center-cropped JPEG), or None if ``body`` is not a usable image."""
+    try:
+        with Image.open(io.BytesIO(body)) as image:
+            if image.width < MIN_DIMENSION or image.height < MIN_DIMENSION:
+                return None
+            # Lets the JPEG decoder downscale while decoding
+            image.draft('RGB', MASTER_SIZE)
+            image = ImageOps.exif_transpose(image).convert('RGB')
+            return _encode_jpeg(ImageOps.fit(image, MASTER_SIZE, Image.LANCZOS))
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return None
+
+
+def resize_thumbnail(master: bytes, size: Tuple[int, int]) -> bytes:
+    if size == MASTER_SIZE:
+        return master
+    with Image.open(io.BytesIO(master)) as image:
+        return _encode_jpeg(ImageOps.fit(image.convert('RGB'), size, Image.LANCZOS))
+
+
+@lru_cache(maxsize=len(THUMBNAIL_SIZES))
+def placeholder_image(size: Tuple[int, int]) -> bytes:
+    return _encode_jpeg(Image.new('RGB', size, color=PLACEHOLDER_COLOR))
+
+
+def is_allowed_size(size: Tuple[int, int]) -> bool:
+    return size in THUMBNAIL_SIZES
+
+
+def thumbnail_url(digest: str, size: Tuple[int, int] = DEFAULT_SIZE) -> str:
+    return f"{base_url()}/api/images/{digest}/{size[0]}/{size[1]}"
+
+
+class ThumbnailStore:
+    """Content-addressed thumbnail files under ``directory``; visible to this machine only."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, digest: str) -> str:
+        return os.path.join(self.directory, digest[:2], f'{digest}.jpg')
+
+    def exists(self, digest: str) -> bool:
+        return bool(_DIGEST.match(digest)) and os.path.exists(self.path(digest))
+
+    def read(self, digest: str) -> Optional[bytes]:
+        if not _DIGEST.match(digest):
+            return None
+        try:
+            with open(self.path(digest), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def write(self, thumbnail: bytes) -> str:
+        digest = hashlib.sha256(thumbnail).hexdigest()
+        path = self.path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temporary = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(temporary, 'wb') as f:
+                f.write(thumbnail)
+            os.replace(temporary, path)
+        return digest
+
+
+class DatabaseThumbnailStore:
+    """Content-addressed thumbnails in the article_thumbnails table."""
+
+    def __init__(self):
+        ensure_tables(ArticleThumbnail.__table__)
+
+    def exists(self, digest: str) -> bool:
+        if not _DIGEST.match(digest):
+            return False
+        with SessionLocal() as db:
+            return db.execute(
+                text("SELECT 1 FROM article_thumbnails WHERE digest = :digest"), {"digest": digest}
+            ).first() is not None
+
+    def read(self, digest: str) -> Optional[bytes]:
+        if not _DIGEST.match(digest):
+            return None
+        with SessionLocal() as db:
+            row = db.execute(
+                text("SELECT image FROM article_thumbnails WHERE digest = :digest"), {"digest": digest}
+            ).first()
+        return bytes(row[0]) if row else None
+
+    def write(self, thumbnail: bytes) -> str:
+        digest = hashlib.sha256(thumbnail).hexdigest()
+        with SessionLocal() as db:
+            db.execute(text("""
+                INSERT INTO article_thumbnails (digest, image) VALUES (:digest, :image)
+                ON CONFLICT (digest) DO NOTHING
+            """), {"digest": digest, "image": thumbnail})
+            db.commit()
+        return digest
+
+
+class ThumbnailServer:
+    """Thumbnails at whitelisted sizes, with an LRU memory tier in front of the store."""
+
+    def __init__(self, store, max_bytes: int):
+        self.store = store
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[Tuple[str, Tuple[int, int]], bytes]' = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, digest: str, size: Tuple[int, int]) -> Optional[bytes]:
+        key = (digest, size)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                return cached
+
+        master = self.store.read(digest)
+        if master is None:
+            return None
+        thumbnail = resize_thumbnail(master, size)
+
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = thumbnail
+                self._size += len(thumbnail)
+                while self._size > self.max_bytes and len(self._entries) > 1:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._size -= len(evicted)
+        return thumbnail
+
+
+class ImageCache:
+    """Validates image URLs and stores their thumbnails; remembers the outcome per URL."""
+
+    def __init__(self, store, index: DiskCache, max_concurrency: int,
+                 timeout: float, max_bytes: int):
+        self.store = store
+        self.index = index
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.max_bytes = max_bytes
+        self._stats = {'stored': 0, 'cached': 0, 'invalid': 0, 'failed': 0}
+
+        self._runner = BackgroundLoop('image-cache')
+        # Created on the image loop so it is bound to it
+        self._runner.run(self._setup(max_concurrency))
+
+    async def _setup(self, max_concurrency: int):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _download(self, url: str) -> bytes:
+        """Image bytes, or _INVALID when the URL does not serve an image within the size cap."""
+        session = get_async_session()
+        async with self._semaphore:
+            async with session.get(url, timeout=self.timeout) as response:
+                content_type = response.headers.get('Content-Type', '')
+                if response.status != 200 or not content_type.startswith('image/'):
+                    return _INVALID
+                if (response.content_length or 0) > self.max_bytes:
+                    return _INVALID
+                body = bytearray()
+                async for chunk in response.content.iter_chunked(_CHUNK_SIZE):
+                    body.extend(chunk)
+                    if len(body) > self.max_bytes:
+                        return _INVALID
+                return bytes(body)
+
+    async def _thumbnail(self, url: str) -> Optional[str]:
+        key = make_key('image', url)
+        loop = asyncio.get_running_loop()
+        cached = self.index.get(key)
+        if cached is not None:
+            digest = cached.decode('ascii')
+            # The index can outlive thumbnails removed from the store
+            if not digest or await loop.run_in_executor(None, self.store.exists, digest):
+                self._stats['cached'] += 1
+                return digest or None
+
+        try:
+            body = await self._download(url)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            # Transient failures are not remembered, so the next run retries the URL
+            logger.warning(f"Error fetching image {url}: {type(e).__name__} {e}")
+            self._stats['failed'] += 1
+            return None
+
+        # Pillow releases the GIL while decoding and resizing, so a thread is enough
+        thumbnail = await loop.run_in_executor(None, make_thumbnail, body) if body else None
+        if thumbnail is None:
+            self._stats['invalid'] += 1
+            self.index.set(key, _INVALID)
+            return None
+        try:
+            digest = await loop.run_in_executor(None, self.store.write, thumbnail)
+        except Exception as e:
+            logger.error(f"Error storing thumbnail for {url}: {e}")
+            self._stats['failed'] += 1
+            return None
+        self.index.set(key, digest.encode('ascii'))
+        self._stats['stored'] += 1
+        return digest
+
+    async def _thumbnails(self, urls: Iterable[str]) -> Dict[str, Optional[str]]:
+        urls = list(dict.fromkeys(url for url in urls if url))
+        digests = await asyncio.gather(*(self._thumbnail(url) for url in urls))
+        return dict(zip(urls, digests))
+
+    def thumbnails(self, urls: Iterable[str], deadline: Optional[Deadline] = None) -> Dict[str, Optional[str]]:
+        """Thumbnail digest by image URL; None when the URL is not a usable image."""
+        return self._runner.run(self._thumbnails(urls), deadline)
+
+    async def thumbnails_async(self, urls: Iterable[str]) -> Dict[str, Optional[str]]:
+        return await self._runner.run_async(self._thumbnails(urls))
+
+    def stats(self) -> dict:
+        return {**self._stats, 'index': self.index.stats()}
+
+    def close(self):
+        self._runner.run(close_async_session())
+        self._runner.close()
+        self.index.close()
+
+
+async def localize_images(articles, field: str = 'urlToImage'):
+    """Point each article dict's image at its thumbnail, or blank it when the image is unusable.
+
+    Used by the weekly fetchers; the templates show the placeholder for blank images.
+    """
+    if not settings.IMAGE_VALIDATION_ENABLED:
+        return articles
+    digests = await get_image_cache().thumbnails_async(article.get(field) for article in articles)
+    for article in articles:
+        digest = digests.get(article.get(field))
+        article[field] = thumbnail_url(digest) if digest else ''
+    return articles
+
+
+_lock = threading.Lock()
+_image_cache = None
+_thumbnail_server = None
+
+
+def get_thumbnail_store():
+    if settings.IMAGE_STORE == 'local':
+        return ThumbnailStore(os.path.join(settings.PIPELINE_CACHE_DIR, 'thumbnails'))
+    return DatabaseThumbnailStore()
+
+
+def get_image_cache() -> ImageCache:
+    global _image_cache
+    if _image_cache is None:
+        with _lock:
+            if _image_cache is None:
+                index = DiskCache(
+                    os.path.join(settings.PIPELINE_CACHE_DIR, 'images.sqlite'),
+                    ttl_seconds=settings.IMAGE_INDEX_TTL_SECONDS,
+                    max_bytes=settings.IMAGE_INDEX_MAX_MB * 1024 * 1024,
+                )
+                _image_cache = ImageCache(
+                    get_thumbnail_store(),
+                    index,
+                    max_concurrency=settings.IMAGE_MAX_CONCURRENCY,
+                    timeout=settings.IMAGE_TIMEOUT_SECONDS,
+                    max_bytes=settings.IMAGE_MAX_BYTES,
+                )
+                logger.info(f"Created image cache (concurrency {settings.IMAGE_MAX_CONCURRENCY})")
+    return _image_cache
+
+
+def get_thumbnail_server() -> ThumbnailServer:
+    global _thumbnail_server
+    if _thumbnail_server is None:
+        with _lock:
+            if _thumbnail_server is None:
+                _thumbnail_server = ThumbnailServer(
+                    get_thumbnail_store(), max_bytes=settings.IMAGE_MEMORY_CACHE_MB * 1024 * 1024
+                )
+    return _thumbnail_server
+
+
+def log_image_stats():
+    if _image_cache is not None:
+        logger.info(f"Image cache: {_image_cache.stats()}")
+
+
+def close_image_cache():
+    global _image_cache
+    with _lock:
+        if _image_cache is not None:
+            _image_cache.close()
+            _image_cache = None
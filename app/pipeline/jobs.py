@@ -0,0 +1,307 @@
+# app/pipeline/jobs.py
+#
+# Postgres-backed queue for per-topic pipeline work, so several processes or
+# Cloud Run job tasks (RUN_SCRIPT=DailyWorker) can split a run's topics.
+# DailyNewsRun enqueues one job per topic; workers claim jobs with SELECT ...
+# FOR UPDATE SKIP LOCKED, so concurrent workers never take the same job and
+# never wait on each other's row locks. While a job runs its heartbeat is
+# refreshed from a side thread; a job whose heartbeat goes stale (its worker
+# died) becomes claimable again. Failures are retried with exponential
+# backoff up to the job's max_attempts. A worker that finds its claim taken
+# over cancels the job's Deadline, so it stops before storing anything.
+
+import json
+import logging
+import os
+import random
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db.session import SessionLocal, ensure_tables
+from app.models.pipeline_job import PipelineJob
+from app.pipeline.deadline import Deadline
+
+logger = logging.getLogger(__name__)
+
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+# A finished or in-flight job is left alone; only a failed one is reset
+_ENQUEUE = text("""
+    INSERT INTO pipeline_jobs (edition, run_date, topic, kind, payload, status, attempts, max_attempts, run_after)
+    VALUES (:edition, :run_date, :topic, :kind, :payload, 'pending', 0, :max_attempts, now())
+    ON CONFLICT (edition, run_date, topic, kind) DO UPDATE SET
+        payload = EXCLUDED.payload, status = 'pending', attempts = 0, max_attempts = EXCLUDED.max_attempts,
+        run_after = now(), locked_by = NULL, last_error = NULL, result = NULL, finished_at = NULL
+    WHERE pipeline_jobs.status = 'failed'
+""")
+
+_CLAIM = text("""
+    UPDATE pipeline_jobs
+    SET status = 'running', attempts = attempts + 1, locked_by = :worker,
+        started_at = now(), heartbeat_at = now()
+    WHERE id = (
+        SELECT id FROM pipeline_jobs
+        WHERE ((status = 'pending' AND run_after <= now())
+               OR (status = 'running' AND heartbeat_at < now() - make_interval(secs => :stale_seconds)))
+          AND (CAST(:edition AS VARCHAR) IS NULL OR edition = :edition)
+          AND (CAST(:run_date AS DATE) IS NULL OR run_date = :run_date)
+        ORDER BY run_after, id
+        LIMIT 1
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING id, edition, run_date, topic, kind, payload, attempts, max_attempts
+""")
+
+_HEARTBEAT = text("""
+    UPDATE pipeline_jobs SET heartbeat_at = now()
+    WHERE id = :id AND locked_by = :worker AND status = 'running'
+""")
+
+_COMPLETE = text("""
+    UPDATE pipeline_jobs
+    SET status = 'done', result = :result, last_error = NULL, locked_by = NULL, finished_at = now()
+    WHERE id = :id AND locked_by = :worker AND status = 'running'
+""")
+
+_FAIL = text("""
+    UPDATE pipeline_jobs
+    SET status = :status, last_error = :error, locked_by = NULL,
+        run_after = now() + make_interval(secs => :delay),
+        finished_at = CASE WHEN :status = 'failed' THEN now() END
+    WHERE id = :id AND locked_by = :worker AND status = 'running'
+""")
+
+_COUNTS = text("""
+    SELECT status, count(*) FROM pipeline_jobs
+    WHERE edition = :edition AND run_date = :run_date
+    GROUP BY status
+""")
+
+_RESULTS = text("""
+    SELECT topic, kind, status, attempts, last_error, result, started_at, finished_at
+    FROM pipeline_jobs
+    WHERE edition = :edition AND run_date = :run_date
+    ORDER BY topic, kind
+""")
+
+
+@dataclass
+class Job:
+    id: int
+    edition: str
+    run_date: date
+    topic: str
+    kind: str
+    payload: Any
+    attempts: int
+    max_attempts: int
+
+
+@dataclass
+class JobResult:
+    topic: str
+    kind: str
+    status: str
+    attempts: int
+    error: Optional[str]
+    result: Any
+    duration: Optional[float]
+
+
+def retry_delay(attempts: int) -> float:
+    backoff = settings.JOB_RETRY_BACKOFF_SECONDS * 2 ** max(attempts - 1, 0)
+    return min(backoff, settings.JOB_MAX_BACKOFF_SECONDS) * random.uniform(0.8, 1.2)
+
+
+class JobQueue:
+    def __init__(self, worker_id: Optional[str] = None):
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+
+    def ensure_table(self):
+        """Create pipeline_jobs if missing, so workers can start before the web app has run."""
+        ensure_tables(PipelineJob.__table__)
+
+    def enqueue(self, edition: str, run_date: date, topic: str, kind: str, payload: Any,
+                max_attempts: Optional[int] = None) -> bool:
+        """Add a job; False when the same job is already queued, running or done for this run."""
+        with SessionLocal() as db:
+            inserted = db.execute(_ENQUEUE, {
+                "edition": edition,
+                "run_date": run_date,
+                "topic": topic,
+                "kind": kind,
+                "payload": json.dumps(payload),
+                "max_attempts": max_attempts or settings.JOB_MAX_ATTEMPTS,
+            }).rowcount
+            db.commit()
+        return bool(inserted)
+
+    def claim(self, edition: Optional[str] = None, run_date: Optional[date] = None) -> Optional[Job]:
+        with SessionLocal() as db:
+            row = db.execute(_CLAIM, {
+                "worker": self.worker_id,
+                "stale_seconds": settings.JOB_STALE_SECONDS,
+                "edition": edition,
+                "run_date": run_date,
+            }).fetchone()
+            db.commit()
+        if row is None:
+            return None
+        return Job(row[0], row[1], row[2], row[3], row[4], json.loads(row[5]), row[6], row[7])
+
+    def _update(self, statement, params: dict) -> bool:
+        with SessionLocal() as db:
+            updated = db.execute(statement, {"worker": self.worker_id, **params}).rowcount
+            db.commit()
+        return bool(updated)
+
+    def heartbeat(self, job: Job) -> bool:
+        """Extend the claim on ``job``; False when another worker has taken it over."""
+        return self._update(_HEARTBEAT, {"id": job.id})
+
+    def complete(self, job: Job, result: Any = None) -> bool:
+        return self._update(_COMPLETE, {"id": job.id, "result": json.dumps(result)})
+
+    def fail(self, job: Job, error: str, retry: bool = True) -> str:
+        """Record a failed attempt; the job is retried after a backoff until it runs out of attempts."""
+        retry = retry and job.attempts < job.max_attempts
+        status = PENDING if retry else FAILED
+        delay = retry_delay(job.attempts) if retry else 0.0
+        self._update(_FAIL, {"id": job.id, "status": status, "error": error[:2000], "delay": delay})
+        return status
+
+    def counts(self, edition: str, run_date: date) -> Dict[str, int]:
+        with SessionLocal() as db:
+            rows = db.execute(_COUNTS, {"edition": edition, "run_date": run_date}).fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def results(self, edition: str, run_date: date) -> List[JobResult]:
+        with SessionLocal() as db:
+            rows = db.execute(_RESULTS, {"edition": edition, "run_date": run_date}).fetchall()
+        return [
+            JobResult(
+                topic=row[0], kind=row[1], status=row[2], attempts=row[3], error=row[4],
+                result=json.loads(row[5]) if row[5] else None,
+                duration=(row[7] - row[6]).total_seconds() if row[6] and row[7] else None,
+            )
+            for row in rows
+        ]
+
+
+class JobWorker:
+    """Claims and runs jobs with ``handlers[job.kind](job, deadline)``, several at a time.
+
+    A handler signals failure by raising; whatever it returns is stored as the
+    job's JSON result.
+    """
+
+    def __init__(self, queue: JobQueue, handlers: Mapping[str, Callable[[Job, Deadline], Any]],
+                 concurrency: Optional[int] = None):
+        self.queue = queue
+        self.handlers = dict(handlers)
+        self.concurrency = concurrency or settings.JOB_WORKER_CONCURRENCY
+        self.runs: Set[Tuple[str, date]] = set()
+        self._stats = {'done': 0, 'retried': 0, 'failed': 0}
+        self._lock = threading.Lock()
+
+    def _count(self, outcome: str, job: Job):
+        with self._lock:
+            self._stats[outcome] += 1
+            self.runs.add((job.edition, job.run_date))
+
+    def run_job(self, job: Job, run_deadline: Optional[Deadline] = None):
+        """Run one claimed job under the topic budget, never past ``run_deadline``."""
+        if job.attempts > job.max_attempts:
+            # Reclaimed after its worker stopped heartbeating on the last attempt
+            self.queue.fail(job, "worker stopped heartbeating", retry=False)
+            self._count('failed', job)
+            return
+
+        deadline = Deadline(settings.TOPIC_DEADLINE_SECONDS, parent=run_deadline)
+        stopped = threading.Event()
+
+        def beat():
+            while not stopped.wait(settings.JOB_HEARTBEAT_SECONDS):
+                try:
+                    alive = self.queue.heartbeat(job)
+                except Exception as e:
+                    logger.warning(f"Heartbeat for job {job.id} failed: {e}")
+                    continue
+                if not alive:
+                    logger.warning(f"Job {job.id} ({job.topic}) was claimed by another worker; stopping it")
+                    deadline.cancel()
+                    return
+
+        heartbeat = threading.Thread(target=beat, name=f'job-{job.id}-heartbeat', daemon=True)
+        heartbeat.start()
+        started = time.monotonic()
+        logger.info(f"Running {job.kind} job {job.id} for {job.topic} ({job.run_date}, attempt {job.attempts})")
+        try:
+            handler = self.handlers.get(job.kind)
+            if handler is None:
+                raise ValueError(f"No handler for job kind {job.kind!r}")
+            result = handler(job, deadline)
+        except Exception as e:
+            status = self.queue.fail(job, f"{type(e).__name__}: {e}")
+            self._count('retried' if status == PENDING else 'failed', job)
+            logger.error(f"Job {job.id} ({job.topic}) failed on attempt {job.attempts}: {e}"
+                         + ("; will retry" if status == PENDING else "; giving up"))
+        else:
+            if not self.queue.complete(job, result):
+                logger.warning(f"Job {job.id} ({job.topic}) finished after its claim was taken over")
+            self._count('done', job)
+            logger.info(f"Job {job.id} ({job.topic}) done in {time.monotonic() - started:.1f}s")
+        finally:
+            stopped.set()
+            heartbeat.join()
+
+    def _loop(self, edition: Optional[str], run_date: Optional[date], drain: bool,
+              idle_seconds: float, deadline: Deadline):
+        idle_since = time.monotonic()
+        while not deadline.expired():
+            try:
+                job = self.queue.claim(edition, run_date)
+                if job is not None:
+                    self.run_job(job, deadline)
+                    idle_since = time.monotonic()
+                    continue
+                # Jobs waiting out a retry backoff, or running elsewhere, may still need a worker
+                counts = self.queue.counts(edition, run_date) if drain else None
+            except Exception as e:
+                logger.error(f"Job queue error: {e}")
+                time.sleep(settings.JOB_POLL_SECONDS)
+                continue
+            if drain:
+                if not counts.get(PENDING) and not counts.get(RUNNING):
+                    return
+            elif time.monotonic() - idle_since >= idle_seconds:
+                return
+            time.sleep(settings.JOB_POLL_SECONDS)
+
+    def run(self, edition: Optional[str] = None, run_date: Optional[date] = None, drain: bool = False,
+            idle_seconds: Optional[float] = None, deadline: Optional[Deadline] = None) -> dict:
+        """Work the queue until it is idle for ``idle_seconds`` or, with ``drain``, until every
+        job of ``edition``/``run_date`` is done or failed; returns job counts by outcome."""
+        idle_seconds = settings.JOB_WORKER_IDLE_SECONDS if idle_seconds is None else idle_seconds
+        deadline = deadline or Deadline()
+        loops = [
+            threading.Thread(target=self._loop, args=(edition, run_date, drain, idle_seconds, deadline),
+                             name=f'job-worker-{index}')
+            for index in range(self.concurrency)
+        ]
+        for loop in loops:
+            loop.start()
+        for loop in loops:
+            loop.join()
+        logger.info(f"Job worker {self.queue.worker_id}: {self._stats}")
+        return dict(self._stats)
@@ -0,0 +1,103 @@
+# app/pipeline/keywords.py
+#
+# Case-insensitive substring matching for many keywords at once. All keywords
+# are compiled into one lookahead alternation so a single scan of the text
+# finds every position where some keyword starts; keywords that are prefixes
+# of the longest match at a position are credited too. Like str.count, a
+# keyword's occurrences do not overlap each other (an occurrence starting
+# inside the previous one is skipped), so the counts match one
+# ``text.count(keyword)`` per keyword without rescanning the text for each.
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+
+
+class KeywordMatcher:
+    def __init__(self, keywords: Iterable[str]):
+        unique = {keyword.lower() for keyword in keywords if keyword}
+        # Longest first so the alternation reports the longest keyword at each position
+        self.keywords = sorted(unique, key=lambda keyword: (-len(keyword), keyword))
+        self._pattern = None
+        if self.keywords:
+            self._pattern = re.compile('(?=(' + '|'.join(map(re.escape, self.keywords)) + '))')
+        self._also_matches: Dict[str, List[str]] = {
+            keyword: [other for other in self.keywords if other != keyword and keyword.startswith(other)]
+            for keyword in self.keywords
+        }
+
+    def counts(self, text: str) -> Counter:
+        """Occurrences of every keyword in ``text``; keywords that do not occur are absent."""
+        hits = Counter()
+        if self._pattern is None or not text:
+            return hits
+        next_start: Dict[str, int] = {}  # where each keyword's next counted occurrence may begin
+        for match in self._pattern.finditer(text.lower()):
+            position = match.start()
+            longest = match.group(1)
+            for keyword in (longest, *self._also_matches[longest]):
+                if position >= next_start.get(keyword, 0):
+                    hits[keyword] += 1
+                    next_start[keyword] = position + len(keyword)
+        return hits
+
+
+class WeightedKeywordScorer:
+    """Sum of ``weight * occurrences`` over weighted keyword groups, in one pass."""
+
+    def __init__(self, groups: Sequence[tuple]):
+        # groups: (weight, keywords) pairs; a keyword in several groups gets every weight
+        self.weights: Dict[str, int] = Counter()
+        for weight, keywords in groups:
+            for keyword in keywords:
+                self.weights[keyword.lower()] += weight
+        self.matcher = KeywordMatcher(self.weights)
+
+    def score(self, text: str) -> int:
+        return self.score_hits(self.matcher.counts(text))
+
+    def score_hits(self, hits: Mapping[str, int]) -> int:
+        """Score from counts already produced by any matcher that covers these keywords."""
+        return sum(self.weights.get(keyword, 0) * count for keyword, count in hits.items())
+
+
+class KeywordCategorizer:
+    """Every category with at least one keyword in the text, in declaration order."""
+
+    def __init__(self, categories: Mapping[str, Iterable[str]]):
+        self.categories = list(categories)
+        self._categories_for: Dict[str, List[str]] = {}
+        for category, keywords in categories.items():
+            for keyword in keywords:
+                self._categories_for.setdefault(keyword.lower(), []).append(category)
+        self.matcher = KeywordMatcher(self._categories_for)
+
+    @property
+    def keywords(self) -> List[str]:
+        return list(self._categories_for)
+
+    def categorize(self, text: str) -> List[str]:
+        return self.categorize_hits(self.matcher.counts(text))
+
+    def categorize_hits(self, hits: Mapping[str, int]) -> List[str]:
+        matched = {category for keyword in hits for category in self._categories_for.get(keyword, ())}
+        return [category for category in self.categories if category in matched]
+
+
+class TopicKeywords:
+    """A topic's relevance scorer and categorizer, sharing one matcher so each text is scanned once."""
+
+    def __init__(self, priority_topics: Iterable[str], companies: Iterable[str],
+                 categories: Mapping[str, Iterable[str]], default_category: str):
+        # Priority topics weigh twice as much as companies in the relevance score
+        self.scorer = WeightedKeywordScorer([(2, priority_topics), (1, companies)])
+        self.categorizer = KeywordCategorizer(categories)
+        self.matcher = KeywordMatcher(list(self.scorer.weights) + self.categorizer.keywords)
+        self.default_category = default_category
+
+    def analyze(self, text: str, content: str = '') -> Tuple[Counter, int, List[str]]:
+        """(keyword hits, score, categories) for ``text``; categories also look at ``content``."""
+        hits = self.matcher.counts(text)
+        category_hits = hits + self.matcher.counts(content) if content else hits
+        categories = self.categorizer.categorize_hits(category_hits) or [self.default_category]
+        return hits, self.scorer.score_hits(hits), categories
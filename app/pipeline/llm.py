@@ -0,0 +1,291 @@
+# app/pipeline/llm.py
+#
+# Shared chat-completion executor for the daily and weekly pipelines. All calls
+# run on one background event loop with a single AsyncOpenAI client, so a
+# single semaphore bounds concurrency across every topic and thread in the
+# process. Rate-limited and transient failures are retried with backoff that
+# honours the API's retry headers, and every call's latency and token usage is
+# recorded for the end-of-run report. Complete responses are cached on disk,
+# keyed by everything that determines the output, so reruns and retried
+# topics reuse earlier generations instead of paying for them again; truncated
+# or unparseable JSON-mode responses are not cached, so a retry asks again.
+
+import asyncio
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import openai
+from openai import AsyncOpenAI
+from openai.types.chat import ChatCompletion
+
+from app.core.config import settings
+from app.pipeline.cache import DiskCache, make_key
+from app.pipeline.deadline import Deadline
+from app.pipeline.loop import BackgroundLoop
+
+logger = logging.getLogger(__name__)
+
+_RETRYABLE = (openai.RateLimitError, openai.APITimeoutError, openai.APIConnectionError, openai.InternalServerError)
+_DURATION_PART = re.compile(r'(\d+(?:\.\d+)?)(ms|s|m|h)')
+_DURATION_UNITS = {'ms': 0.001, 's': 1.0, 'm': 60.0, 'h': 3600.0}
+_CACHE_KEY_FIELDS = ('model', 'messages', 'temperature', 'response_format', 'max_tokens')
+
+
+@dataclass
+class CallMetric:
+    model: str
+    latency: float
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    attempts: int = 1
+    ok: bool = True
+    cached: bool = False
+    topic: str = ''
+
+
+def _parse_duration(value: Optional[str]) -> Optional[float]:
+    """Seconds from a Retry-After value or an OpenAI reset header such as '1m30s' or '250ms'."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    response = getattr(error, 'response', None)
+    headers = response.headers if response is not None else {}
+    delay = _parse_duration(headers.get('retry-after-ms'))
+    if delay is not None:
+        delay /= 1000
+    else:
+        delay = _parse_duration(headers.get('retry-after'))
+    # The reset headers describe the rate-limit window: a retry hint only for a 429
+    if delay is None and getattr(response, 'status_code', None) == 429:
+        for header in ('x-ratelimit-reset-requests', 'x-ratelimit-reset-tokens'):
+            delay = _parse_duration(headers.get(header))
+            if delay is not None:
+                break
+    if delay is not None:
+        return min(delay, settings.LLM_MAX_BACKOFF_SECONDS)
+    backoff = settings.LLM_BACKOFF_SECONDS * 2 ** attempt
+    return min(backoff, settings.LLM_MAX_BACKOFF_SECONDS) * random.uniform(0.8, 1.2)
+
+
+def cache_key(kwargs: dict) -> str:
+    return make_key('chat.completions', {field: kwargs.get(field) for field in _CACHE_KEY_FIELDS})
+
+
+def cacheable(response: Any, kwargs: dict) -> bool:
+    """Whether every choice finished normally and, in JSON mode, holds a JSON object."""
+    choices = getattr(response, 'choices', None) or []
+    if not choices or any(choice.finish_reason != 'stop' for choice in choices):
+        return False
+    if (kwargs.get('response_format') or {}).get('type') == 'json_object':
+        try:
+            return all(isinstance(json.loads(choice.message.content or ''), dict) for choice in choices)
+        except ValueError:
+            return False
+    return True
+
+
+class LLMExecutor:
+    def __init__(self, max_concurrency: int, timeout: float, max_retries: int,
+                 cache: Optional[DiskCache] = None):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.cache = cache
+        self.metrics: List[CallMetric] = []
+        self._metrics_lock = threading.Lock()
+
+        self._runner = BackgroundLoop('llm-executor')
+        # Created on the executor loop so they are bound to it
+        self._runner.run(self._setup())
+
+    async def _setup(self):
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        # Retries are handled here so they respect the shared semaphore
+        self._client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY.get_secret_value(),
+            timeout=self.timeout,
+            max_retries=0,
+        )
+
+    async def _complete(self, use_cache: bool = True, topic: str = '', **kwargs) -> Any:
+        model = kwargs.get('model', '')
+        started = time.monotonic()
+        key = cache_key(kwargs) if self.cache is not None and use_cache else None
+        if key is not None:
+            cached = self.cache.get_json(key)
+            if cached is not None:
+                self._record(CallMetric(model, time.monotonic() - started, cached=True, topic=topic))
+                return ChatCompletion.model_validate(cached)
+
+        response = await self._request(topic, started, **kwargs)
+        if key is not None:
+            if cacheable(response, kwargs):
+                self.cache.set_json(key, response.model_dump(mode='json'))
+            else:
+                logger.warning(f"Not caching incomplete or malformed LLM response for {topic or model}")
+        return response
+
+    async def _request(self, topic: str, started: float, **kwargs) -> Any:
+        model = kwargs.get('model', '')
+        attempt = 0
+        while True:
+            try:
+                async with self._semaphore:
+                    response = await asyncio.wait_for(
+                        self._client.chat.completions.create(**kwargs), timeout=self.timeout
+                    )
+            except (asyncio.TimeoutError, *_RETRYABLE) as e:
+                if attempt >= self.max_retries:
+                    self._record(CallMetric(model, time.monotonic() - started, attempts=attempt + 1, ok=False,
+                                            topic=topic))
+                    raise
+                delay = _retry_delay(e, attempt)
+                attempt += 1
+                logger.warning(f"LLM call failed ({type(e).__name__}); retry {attempt} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+            except Exception:
+                self._record(CallMetric(model, time.monotonic() - started, attempts=attempt + 1, ok=False,
+                                        topic=topic))
+                raise
+
+            usage = getattr(response, 'usage', None)
+            self._record(CallMetric(
+                model,
+                time.monotonic() - started,
+                prompt_tokens=getattr(usage, 'prompt_tokens', 0) or 0,
+                completion_tokens=getattr(usage, 'completion_tokens', 0) or 0,
+                attempts=attempt + 1,
+                topic=topic,
+            ))
+            return response
+
+    async def complete(self, use_cache: bool = True, topic: str = '', **kwargs) -> Any:
+        """Awaitable chat completion from any event loop; takes chat.completions.create kwargs.
+
+        Pass ``use_cache=False`` to skip the response cache for this call, and
+        ``topic`` to attribute its tokens and latency in the run metrics.
+        """
+        return await self._runner.run_async(self._complete(use_cache, topic, **kwargs))
+
+    def complete_sync(self, use_cache: bool = True, topic: str = '', deadline: Optional[Deadline] = None,
+                      **kwargs) -> Any:
+        """Blocking chat completion for thread-based callers such as the daily TopicFetcher."""
+        return self._runner.run(self._complete(use_cache, topic, **kwargs), deadline)
+
+    def evict(self, **kwargs):
+        """Drop the cached response for these chat.completions.create kwargs, e.g. when the
+        caller could not use it, so the next call asks the model again."""
+        if self.cache is not None:
+            self.cache.delete(cache_key(kwargs))
+
+    def _record(self, metric: CallMetric):
+        with self._metrics_lock:
+            self.metrics.append(metric)
+
+    def stats(self) -> dict:
+        with self._metrics_lock:
+            metrics = list(self.metrics)
+        cached = sum(1 for metric in metrics if metric.cached)
+        metrics = [metric for metric in metrics if not metric.cached]
+        stats = {'cached': cached}
+        if self.cache is not None:
+            stats['cache'] = self.cache.stats()
+        if not metrics:
+            return {'calls': 0, **stats}
+        latencies = sorted(metric.latency for metric in metrics)
+        return {
+            **stats,
+            'calls': len(metrics),
+            'failed': sum(1 for metric in metrics if not metric.ok),
+            'retries': sum(metric.attempts - 1 for metric in metrics),
+            'prompt_tokens': sum(metric.prompt_tokens for metric in metrics),
+            'completion_tokens': sum(metric.completion_tokens for metric in metrics),
+            'latency_avg': round(sum(latencies) / len(latencies), 2),
+            'latency_p95': round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 2),
+        }
+
+    def topic_stats(self) -> Dict[str, dict]:
+        """Per-topic call counts, tokens and summed latency, for the run-metrics table."""
+        with self._metrics_lock:
+            metrics = list(self.metrics)
+        stats: Dict[str, dict] = {}
+        for metric in metrics:
+            topic = stats.setdefault(metric.topic, {
+                'calls': 0, 'cached': 0, 'failed': 0, 'retries': 0,
+                'prompt_tokens': 0, 'completion_tokens': 0, 'latency': 0.0,
+            })
+            topic['calls'] += 1
+            topic['cached'] += metric.cached
+            topic['failed'] += not metric.ok
+            topic['retries'] += metric.attempts - 1
+            topic['prompt_tokens'] += metric.prompt_tokens
+            topic['completion_tokens'] += metric.completion_tokens
+            topic['latency'] += metric.latency
+        return stats
+
+    def close(self):
+        self._runner.run(self._client.close())
+        self._runner.close()
+        if self.cache is not None:
+            self.cache.close()
+
+
+_lock = threading.Lock()
+_executor = None
+
+
+def get_llm_executor() -> LLMExecutor:
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                cache = None
+                if settings.LLM_CACHE_ENABLED:
+                    cache = DiskCache(
+                        os.path.join(settings.PIPELINE_CACHE_DIR, 'llm.sqlite'),
+                        ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+                        max_bytes=settings.LLM_CACHE_MAX_MB * 1024 * 1024,
+                    )
+                _executor = LLMExecutor(
+                    max_concurrency=settings.LLM_MAX_CONCURRENCY,
+                    timeout=settings.LLM_TIMEOUT_SECONDS,
+                    max_retries=settings.LLM_MAX_RETRIES,
+                    cache=cache,
+                )
+                logger.info(f"Created shared LLM executor (concurrency {settings.LLM_MAX_CONCURRENCY})")
+    return _executor
+
+
+def log_llm_stats():
+    if _executor is not None:
+        logger.info(f"LLM usage: {_executor.stats()}")
+
+
+def llm_topic_stats() -> Dict[str, dict]:
+    return _executor.topic_stats() if _executor is not None else {}
+
+
+def close_llm_executor():
+    global _executor
+    with _lock:
+        if _executor is not None:
+            _executor.close()
+            _executor = None
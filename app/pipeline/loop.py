@@ -0,0 +1,44 @@
+# app/pipeline/loop.py
+#
+# A private asyncio event loop running in a daemon thread. Services that keep
+# loop-bound state (semaphores, aiohttp/AsyncOpenAI clients) run all of their
+# coroutines on one of these, so worker threads and other event loops can
+# share them and their concurrency limits really are process-wide.
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Awaitable, Optional
+
+from app.pipeline.deadline import Deadline, DeadlineExceeded
+
+
+class BackgroundLoop:
+    def __init__(self, name: str):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name=name, daemon=True)
+        self._thread.start()
+
+    def run(self, coro: Awaitable, deadline: Optional[Deadline] = None) -> Any:
+        """Run ``coro`` on the background loop and block until it finishes.
+
+        With ``deadline``, waits at most its remaining time; the coroutine is
+        cancelled and DeadlineExceeded raised when it runs out.
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        # Wait separately from result(): a coroutine's own asyncio.TimeoutError is the
+        # same class as the wait timeout on 3.11+ and must not pass for a deadline
+        done, _ = concurrent.futures.wait([future], deadline.remaining() if deadline is not None else None)
+        if not done:
+            future.cancel()
+            raise DeadlineExceeded("deadline exceeded waiting for the background loop")
+        return future.result()
+
+    async def run_async(self, coro: Awaitable) -> Any:
+        """Await ``coro`` on the background loop from a different event loop."""
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self.loop))
+
+    def close(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
@@ -0,0 +1,63 @@
+# app/pipeline/metrics.py
+#
+# Per-topic run metrics. At the end of a run the LLM usage recorded by the
+# shared executor is grouped by topic, logged slowest first and written to the
+# run_metrics table, one row per topic per run, so slow or expensive topics
+# can be tracked over time. The table is created on first use, like the other
+# pipeline tables.
+
+import logging
+from datetime import date
+
+from sqlalchemy import text
+
+from app.db.session import SessionLocal, ensure_tables
+from app.models.run_metric import RunMetric
+from app.pipeline.llm import llm_topic_stats
+
+logger = logging.getLogger(__name__)
+
+_INSERT = text("""
+    INSERT INTO run_metrics (edition, run_date, topic, llm_calls, cached_calls, failed_calls,
+                             prompt_tokens, completion_tokens, llm_seconds)
+    VALUES (:edition, :run_date, :topic, :llm_calls, :cached_calls, :failed_calls,
+            :prompt_tokens, :completion_tokens, :llm_seconds)
+""")
+
+
+def record_run_metrics(edition: str, run_date: date):
+    stats = llm_topic_stats()
+    if not stats:
+        return
+
+    rows = [
+        {
+            "edition": edition,
+            "run_date": run_date,
+            "topic": topic or 'untagged',
+            "llm_calls": topic_stats['calls'],
+            "cached_calls": topic_stats['cached'],
+            "failed_calls": topic_stats['failed'],
+            "prompt_tokens": topic_stats['prompt_tokens'],
+            "completion_tokens": topic_stats['completion_tokens'],
+            "llm_seconds": round(topic_stats['latency'], 3),
+        }
+        for topic, topic_stats in stats.items()
+    ]
+    rows.sort(key=lambda row: row['llm_seconds'], reverse=True)
+
+    logger.info(f"Run metrics for {edition} {run_date} (slowest first):")
+    for row in rows:
+        logger.info(
+            f"  {row['topic']}: {row['llm_calls']} calls ({row['cached_calls']} cached, "
+            f"{row['failed_calls']} failed), {row['prompt_tokens']} prompt + "
+            f"{row['completion_tokens']} completion tokens, {row['llm_seconds']}s"
+        )
+
+    try:
+        ensure_tables(RunMetric.__table__)
+        with SessionLocal() as db:
+            db.execute(_INSERT, rows)
+            db.commit()
+    except Exception as e:
+        logger.error(f"Error recording run metrics: {e}")
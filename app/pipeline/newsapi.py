@@ -0,0 +1,159 @@
+# app/pipeline/newsapi.py
+#
+# NewsAPI /v2/everything requests for the daily and weekly fetchers. Every
+# request goes through its edition's ApiKeyPool, so callers never pass apiKey.
+# The daily and weekly jobs draw on separate keys: quota is only tracked within
+# a process, so a shared key could be spent by one job behind the other's back.
+# Successful responses are kept in an on-disk cache keyed by the request
+# parameters, so reruns for the same date window cost no quota.
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.pipeline.cache import DiskCache, make_key
+from app.pipeline.http_client import get_async_session, get_http_session
+from app.pipeline.ratelimit import ApiKeyPool
+
+logger = logging.getLogger(__name__)
+
+NEWS_API_URL = "https://newsapi.org/v2/everything"
+NEWS_API_KEY_NAMES = {
+    'daily': ('NEWS_API_KEY', 'NEWS_API_KEY_1'),
+    'weekly': ('NEWS_API_KEY_Weekly',),
+}
+
+_lock = threading.Lock()
+_key_pools: Dict[str, ApiKeyPool] = {}
+_response_cache = None
+
+
+class NewsApiError(Exception):
+    pass
+
+
+def get_key_pool(edition: str = 'daily') -> ApiKeyPool:
+    key_pool = _key_pools.get(edition)
+    if key_pool is None:
+        with _lock:
+            key_pool = _key_pools.get(edition)
+            if key_pool is None:
+                keys, seen = [], set()
+                for name in NEWS_API_KEY_NAMES[edition]:
+                    value = getattr(settings, name).get_secret_value()
+                    if value and value not in seen:
+                        seen.add(value)
+                        keys.append((name, value))
+                if not keys:
+                    raise ValueError(f"No {edition} NewsAPI key found in environment variables")
+                key_pool = _key_pools[edition] = ApiKeyPool(
+                    keys,
+                    daily_quota=settings.NEWS_API_DAILY_QUOTA,
+                    rate=settings.NEWS_API_RATE_PER_SECOND,
+                    burst=settings.NEWS_API_BURST,
+                    backoff_seconds=settings.NEWS_API_BACKOFF_SECONDS,
+                )
+                logger.info(f"NewsAPI {edition} key pool: {[name for name, _ in keys]}")
+    return key_pool
+
+
+def get_response_cache() -> Optional[DiskCache]:
+    global _response_cache
+    if not settings.NEWS_CACHE_ENABLED:
+        return None
+    if _response_cache is None:
+        with _lock:
+            if _response_cache is None:
+                _response_cache = DiskCache(
+                    os.path.join(settings.PIPELINE_CACHE_DIR, 'newsapi.sqlite'),
+                    ttl_seconds=settings.NEWS_CACHE_TTL_SECONDS,
+                    max_bytes=settings.NEWS_CACHE_MAX_MB * 1024 * 1024,
+                )
+    return _response_cache
+
+
+def _cache_key(params: Dict[str, Any]) -> str:
+    # Covers q, from, to, language, sortBy, pageSize (and page); never the key
+    return make_key('everything', {k: v for k, v in params.items() if k != 'apiKey'})
+
+
+def log_key_stats():
+    for edition, key_pool in list(_key_pools.items()):
+        logger.info(f"NewsAPI {edition} key usage: {key_pool.stats()} "
+                    f"(rate-limit wait {key_pool.waited_seconds:.1f}s)")
+    if _response_cache is not None:
+        logger.info(f"NewsAPI response cache: {_response_cache.stats()}")
+
+
+def get_everything(params: Dict[str, Any], session=None, edition: str = 'daily') -> Dict[str, Any]:
+    """GET /v2/everything from a thread, retrying 429s on whichever of the edition's keys is free next."""
+    cache = get_response_cache()
+    if cache is not None:
+        cached = cache.get_json(_cache_key(params))
+        if cached is not None:
+            return cached
+
+    pool = get_key_pool(edition)
+    session = session or get_http_session()
+
+    for _ in range(settings.NEWS_API_MAX_RETRIES + 1):
+        key, delay = pool.acquire()
+        if delay:
+            time.sleep(delay)
+        response = session.get(NEWS_API_URL, params={**params, 'apiKey': key.value})
+        error_code = _error_code(response.json) if response.status_code >= 400 else None
+        pool.release(key, response.status_code, error_code, response.headers.get('Retry-After'))
+        if response.status_code == 429 or key.disabled:
+            continue
+        response.raise_for_status()
+        data = response.json()
+        if cache is not None and data.get('status') == 'ok':
+            cache.set_json(_cache_key(params), data)
+        return data
+
+    raise NewsApiError(f"NewsAPI request for {params.get('q')!r} failed after retries")
+
+
+async def get_everything_async(params: Dict[str, Any], session=None, edition: str = 'weekly') -> Dict[str, Any]:
+    """Async twin of get_everything for the aiohttp-based weekly fetchers."""
+    cache = get_response_cache()
+    if cache is not None:
+        cached = cache.get_json(_cache_key(params))
+        if cached is not None:
+            return cached
+
+    pool = get_key_pool(edition)
+    session = session or get_async_session()
+
+    for _ in range(settings.NEWS_API_MAX_RETRIES + 1):
+        key, delay = pool.acquire()
+        if delay:
+            await asyncio.sleep(delay)
+        async with session.get(NEWS_API_URL, params={**params, 'apiKey': key.value}) as response:
+            # Error bodies may be HTML or empty, so only they are parsed leniently
+            error_code = None
+            if response.status >= 400:
+                body = await response.text()
+                error_code = _error_code(lambda: json.loads(body))
+            pool.release(key, response.status, error_code, response.headers.get('Retry-After'))
+            if response.status == 429 or key.disabled:
+                continue
+            response.raise_for_status()
+            data = await response.json(content_type=None)
+            if cache is not None and data.get('status') == 'ok':
+                cache.set_json(_cache_key(params), data)
+            return data
+
+    raise NewsApiError(f"NewsAPI request for {params.get('q')!r} failed after retries")
+
+
+def _error_code(json_loader) -> Optional[str]:
+    try:
+        return json_loader().get('code')
+    except Exception:
+        return None
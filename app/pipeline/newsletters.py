@@ -0,0 +1,118 @@
+# app/pipeline/newsletters.py
+#
+# End-of-run persistence for the daily newsletters. Topic threads add their
+# rendered newsletter to a NewsletterBatch instead of each opening a session
+# and committing its own INSERT; once the publish phase is over the run writes
+# every topic's row with one multi-row INSERT ... RETURNING (execute_values),
+# together with the topics' store checkpoints and seen-article rows, in a
+# single transaction on one pooled connection. A newsletter is therefore
+# stored exactly when its articles are marked as featured and its store
+# checkpoint is saved. If the batch fails, every newsletter is retried in its
+# own transaction, so a single bad topic loses only its own newsletter and
+# leaves nothing half-written for the rerun to trip over.
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+from psycopg2.extras import execute_values
+
+from app.db.session import SessionLocal
+from app.pipeline.checkpoint import RunCheckpoints
+from app.pipeline.seen import SeenArticleIndex
+
+logger = logging.getLogger(__name__)
+
+_INSERT = """
+    INSERT INTO newsletters (title, content, email_content, topic_id, subscription_ids)
+    VALUES %s
+    RETURNING id, topic_id, title
+"""
+
+
+@dataclass
+class PendingNewsletter:
+    topic: str
+    title: str
+    web_content: str
+    email_content: str
+    topic_id: int
+    subscription_ids: List[str]
+    articles: List[Any] = field(default_factory=list)
+
+
+class NewsletterBatch:
+    """Newsletters rendered during a run, written together by ``flush()``."""
+
+    def __init__(self, checkpoints: Optional[RunCheckpoints] = None, seen: Optional[SeenArticleIndex] = None):
+        self.checkpoints = checkpoints
+        self.seen = seen
+        self._pending: Dict[str, PendingNewsletter] = {}
+        self._lock = threading.Lock()
+
+    def add(self, newsletter: PendingNewsletter):
+        with self._lock:
+            self._pending[newsletter.topic] = newsletter
+
+    def has(self, topic: str) -> bool:
+        with self._lock:
+            return topic in self._pending
+
+    def flush(self, topics: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """Store the pending newsletters; newsletter ids by topic, for those that were stored.
+
+        With ``topics``, only those topics' newsletters are stored and the rest are
+        dropped, e.g. those of topics that timed out after rendering. If the batch
+        transaction fails, each newsletter is retried in a transaction of its own,
+        so one topic's failure does not lose the others.
+        """
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        if topics is not None:
+            topics = set(topics)
+            pending = [newsletter for newsletter in pending if newsletter.topic in topics]
+        if not pending:
+            return {}
+
+        try:
+            stored = self._store(pending)
+        except Exception as e:
+            logger.error(f"Error storing {len(pending)} newsletters in one batch, storing them one by one: {e}")
+        else:
+            logger.info(f"Stored {len(stored)} newsletters in one batch: {stored}")
+            return stored
+
+        stored = {}
+        for newsletter in pending:
+            try:
+                stored.update(self._store([newsletter]))
+            except Exception as e:
+                logger.error(f"Error storing the {newsletter.topic} newsletter in database: {e}")
+        lost = [newsletter.topic for newsletter in pending if newsletter.topic not in stored]
+        logger.info(f"Stored {len(stored)} newsletters one by one: {stored}")
+        if lost:
+            logger.error(f"Newsletters not stored: {lost}")
+        return stored
+
+    def _store(self, pending: List[PendingNewsletter]) -> Dict[str, int]:
+        """Insert ``pending`` with their checkpoints and seen articles in one transaction."""
+        rows = [
+            (newsletter.title, newsletter.web_content, newsletter.email_content,
+             newsletter.topic_id, ','.join(newsletter.subscription_ids))
+            for newsletter in pending
+        ]
+        with SessionLocal() as db:
+            with db.connection().connection.cursor() as cursor:
+                returned = execute_values(cursor, _INSERT, rows, page_size=len(rows), fetch=True)
+            # RETURNING does not promise VALUES order, so ids are matched by the returned columns
+            ids = {(topic_id, title): inserted_id for inserted_id, topic_id, title in returned}
+            stored = {newsletter.topic: ids[(newsletter.topic_id, newsletter.title)] for newsletter in pending}
+            for newsletter in pending:
+                if self.checkpoints is not None:
+                    self.checkpoints.save(newsletter.topic, 'store', stored[newsletter.topic], db=db)
+                if self.seen is not None:
+                    self.seen.mark_seen(newsletter.articles, newsletter.topic_id, db=db)
+            db.commit()
+        return stored
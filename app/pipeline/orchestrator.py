@@ -0,0 +1,191 @@
+# app/pipeline/orchestrator.py
+#
+# Runs a job's topics as asyncio tasks with a time limit per topic and for the
+# whole run. Topic work is blocking (requests, SQLAlchemy, the sync wrappers of
+# the shared background-loop clients), so each task runs its topic in a worker
+# thread from a bounded pool and hands it a Deadline; a topic that overruns is
+# recorded as timed out and its Deadline is cancelled, so the thread stops at
+# its next stage boundary instead of storing a newsletter late. When the run
+# deadline passes, topics still running or waiting are cancelled the same way.
+# Every topic ends with an outcome and a duration in the run summary.
+
+import asyncio
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional
+
+from app.core.config import settings
+from app.pipeline.deadline import Deadline, DeadlineExceeded
+
+logger = logging.getLogger(__name__)
+
+OK = 'ok'
+EMPTY = 'empty'
+FAILED = 'failed'
+TIMEOUT = 'timeout'
+CANCELLED = 'cancelled'
+
+
+@dataclass
+class TopicOutcome:
+    topic: str
+    status: str = OK
+    duration: float = 0.0
+    phases: Dict[str, float] = field(default_factory=dict)  # seconds spent per phase
+    articles: int = 0
+    newsletter_id: Optional[int] = None
+    error: str = ''
+
+
+@dataclass
+class RunSummary:
+    edition: str
+    run_date: date
+    duration: float = 0.0
+    topics: Dict[str, TopicOutcome] = field(default_factory=dict)
+
+    def counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for outcome in self.topics.values():
+            counts[outcome.status] = counts.get(outcome.status, 0) + 1
+        return counts
+
+    def to_dict(self) -> dict:
+        topics = []
+        for outcome in self.topics.values():
+            entry = asdict(outcome)
+            entry['duration'] = round(outcome.duration, 3)
+            entry['phases'] = {phase: round(seconds, 3) for phase, seconds in outcome.phases.items()}
+            topics.append(entry)
+        return {
+            'edition': self.edition,
+            'run_date': self.run_date.isoformat(),
+            'duration': round(self.duration, 3),
+            'counts': self.counts(),
+            'topics': topics,
+        }
+
+    def log(self):
+        logger.info(f"Run summary for {self.edition} {self.run_date}: {self.counts()} in {self.duration:.1f}s")
+        for outcome in sorted(self.topics.values(), key=lambda outcome: outcome.duration, reverse=True):
+            phases = ', '.join(f"{phase} {seconds:.1f}s" for phase, seconds in outcome.phases.items())
+            error = f" - {outcome.error}" if outcome.error else ''
+            logger.info(f"  {outcome.topic}: {outcome.status} in {outcome.duration:.1f}s ({phases}){error}")
+        # One machine-readable line for log-based metrics
+        logger.info(f"run_summary {json.dumps(self.to_dict(), default=str)}")
+
+
+def _discard_result(future: asyncio.Future):
+    # The thread of an abandoned topic still finishes, usually with DeadlineExceeded
+    if not future.cancelled():
+        future.exception()
+
+
+class TopicOrchestrator:
+    """Runs per-topic phases for one run, enforcing the topic and run deadlines.
+
+    Each topic gets ``topic_seconds`` of running time in total across phases;
+    time spent queued for a worker does not count against it.
+    """
+
+    def __init__(self, edition: str, run_date: date, topics: Iterable[str],
+                 topic_seconds: Optional[float] = None, run_seconds: Optional[float] = None,
+                 max_concurrency: Optional[int] = None):
+        self.topic_seconds = topic_seconds if topic_seconds is not None else settings.TOPIC_DEADLINE_SECONDS
+        self.run_deadline = Deadline(run_seconds if run_seconds is not None else settings.RUN_DEADLINE_SECONDS)
+        self.max_concurrency = max_concurrency or settings.TOPIC_CONCURRENCY
+        self.summary = RunSummary(edition, run_date, topics={topic: TopicOutcome(topic) for topic in topics})
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='topic')
+        self._started = time.monotonic()
+
+    def finish(self, topic: str, status: str, error: str = ''):
+        outcome = self.summary.topics[topic]
+        outcome.status = status
+        outcome.error = error
+
+    def _budget(self, outcome: TopicOutcome) -> Deadline:
+        if not self.topic_seconds:
+            return Deadline(parent=self.run_deadline)
+        # A topic that already used up its time gets a deadline that is already expired
+        remaining = max(self.topic_seconds - outcome.duration, 1e-6)
+        return Deadline(remaining, parent=self.run_deadline)
+
+    async def _run_topic(self, phase: str, topic: str, job: Callable[[Deadline], Any],
+                         semaphore: asyncio.Semaphore, status: Callable[[Any], str]) -> Any:
+        outcome = self.summary.topics[topic]
+        async with semaphore:
+            deadline = self._budget(outcome)
+            started = time.monotonic()
+            future = asyncio.get_running_loop().run_in_executor(self._executor, job, deadline)
+            try:
+                # shield: cancelling a thread's future does not stop the thread, the Deadline does
+                result = await asyncio.wait_for(asyncio.shield(future), deadline.remaining())
+                self.finish(topic, status(result))
+                return result
+            except asyncio.CancelledError:
+                deadline.cancel()
+                future.add_done_callback(_discard_result)
+                self.finish(topic, CANCELLED, f"run deadline reached during {phase}")
+                raise
+            except (asyncio.TimeoutError, DeadlineExceeded) as e:
+                deadline.cancel()
+                future.add_done_callback(_discard_result)
+                if self.run_deadline.expired():
+                    self.finish(topic, CANCELLED, f"run deadline reached during {phase}")
+                else:
+                    self.finish(topic, TIMEOUT, f"topic deadline reached during {phase}")
+                logger.warning(f"Topic {topic} stopped in {phase}: {outcome.error} {e}".rstrip())
+            except Exception as e:
+                self.finish(topic, FAILED, f"{phase}: {type(e).__name__}: {e}")
+                logger.error(f"Error in {phase} for topic {topic}: {e}")
+            finally:
+                elapsed = time.monotonic() - started
+                outcome.phases[phase] = outcome.phases.get(phase, 0.0) + elapsed
+                outcome.duration += elapsed
+        return None
+
+    async def run_phase(self, phase: str, jobs: Mapping[str, Callable[[Deadline], Any]],
+                        status: Callable[[Any], str] = lambda result: OK) -> Dict[str, Any]:
+        """Run ``jobs[topic](deadline)`` for every still-active topic; results of topics that finished ok.
+
+        ``status`` maps a finished job's result to the topic's outcome, e.g.
+        EMPTY when a fetch found nothing.
+        """
+        jobs = {topic: job for topic, job in jobs.items() if self.summary.topics[topic].status == OK}
+        if self.run_deadline.expired():
+            for topic in jobs:
+                self.finish(topic, CANCELLED, f"run deadline reached before {phase}")
+            return {}
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks = {
+            topic: asyncio.create_task(self._run_topic(phase, topic, job, semaphore, status))
+            for topic, job in jobs.items()
+        }
+        if not tasks:
+            return {}
+        # Topic deadlines never outlast the run's, so this only catches tasks still queued
+        _, pending = await asyncio.wait(tasks.values(), timeout=self.run_deadline.remaining())
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        for topic, task in tasks.items():
+            if task in pending and self.summary.topics[topic].status == OK:
+                self.finish(topic, CANCELLED, f"run deadline reached before {phase}")
+
+        return {
+            topic: task.result() for topic, task in tasks.items()
+            if self.summary.topics[topic].status == OK and not task.cancelled()
+        }
+
+    def close(self) -> RunSummary:
+        """Wait for abandoned topic threads to stop and finalize the summary."""
+        # Threads of timed-out topics stop at their next deadline check; they must be
+        # gone before the shared clients are closed underneath them
+        self._executor.shutdown(wait=True)
+        self.summary.duration = time.monotonic() - self._started
+        return self.summary
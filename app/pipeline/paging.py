@@ -0,0 +1,54 @@
+# app/pipeline/paging.py
+#
+# Bookkeeping for paginated NewsAPI ingestion. Pages are streamed one at a
+# time; a TopKTracker remembers the best scores a topic has seen so far so a
+# query can stop as soon as a page no longer improves the topic's top-k, and a
+# PageBudget caps how many extra pages a topic may request in one run.
+
+import heapq
+import threading
+from typing import Iterable, List
+
+
+class TopKTracker:
+    def __init__(self, k: int):
+        self.k = k
+        self._heap: List[float] = []
+        self._lock = threading.Lock()
+
+    def offer(self, scores: Iterable[float]) -> bool:
+        """Add a page's scores; True if any of them made it into the current top-k."""
+        improved = False
+        with self._lock:
+            for score in scores:
+                if len(self._heap) < self.k:
+                    heapq.heappush(self._heap, score)
+                    improved = True
+                elif score > self._heap[0]:
+                    heapq.heapreplace(self._heap, score)
+                    improved = True
+        return improved
+
+
+class PageBudget:
+    def __init__(self, limit: int):
+        self.remaining = limit
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        with self._lock:
+            if self.remaining <= 0:
+                return False
+            self.remaining -= 1
+            return True
+
+
+class SharedBudget:
+    """Budget for a query several topics share: each page is charged to every listed topic."""
+
+    def __init__(self, budgets: Iterable[PageBudget]):
+        self.budgets = list(budgets)
+
+    def take(self) -> bool:
+        # A list, not a generator, so every topic with budget left pays for the page
+        return any([budget.take() for budget in self.budgets])
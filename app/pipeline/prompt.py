@@ -0,0 +1,67 @@
+# app/pipeline/prompt.py
+#
+# Token-budgeted article lists for LLM prompts. Articles are given best first;
+# each one is rendered as a single compact line ("[i] title | description |
+# ...") with every field whitespace-collapsed and cut to a per-field length,
+# and lines are added until the next one would exceed the input token budget.
+# Token counts are estimated from characters, which is close enough for
+# budgeting English news text without pulling in a tokenizer.
+
+import math
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+
+CHARS_PER_TOKEN = 4
+ELLIPSIS = '…'
+# Longest text kept per field; fields not listed use DEFAULT_FIELD_CHARS
+FIELD_CHARS: Dict[str, int] = {'title': 150, 'description': 220, 'keywords': 80}
+DEFAULT_FIELD_CHARS = 40
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def compact(value: Any, max_chars: int) -> str:
+    """``value`` as one line of at most ``max_chars`` characters, cut at a word boundary."""
+    if isinstance(value, (list, tuple, set)):
+        value = ', '.join(str(item) for item in value)
+    text = _WHITESPACE.sub(' ', str(value or '')).strip()
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars - len(ELLIPSIS)]
+    if ' ' in cut:
+        cut = cut.rsplit(' ', 1)[0]
+    return cut.rstrip(' ,.;:') + ELLIPSIS
+
+
+def format_article(index: int, article, fields: Sequence[str]) -> str:
+    values = (compact(article.get(field), FIELD_CHARS.get(field, DEFAULT_FIELD_CHARS)) for field in fields)
+    return f"[{index}] " + ' | '.join(value for value in values if value)
+
+
+def pack_articles(articles: Sequence, fields: Sequence[str], budget_tokens: Optional[int] = None,
+                  max_articles: Optional[int] = None) -> Tuple[str, List]:
+    """(prompt text, included articles) for the best articles that fit ``budget_tokens``.
+
+    Articles are taken in order and packing stops at the first one that does
+    not fit, so the included articles are always a prefix of ``articles`` and
+    the ``[i]`` labels index into it. The first article is always included.
+    """
+    budget = budget_tokens or settings.PROMPT_ARTICLE_TOKEN_BUDGET
+    lines: List[str] = []
+    used = 0
+    for index, article in enumerate(articles):
+        if max_articles is not None and index >= max_articles:
+            break
+        line = format_article(index, article, fields)
+        cost = estimate_tokens(line) + 1  # the newline
+        if lines and used + cost > budget:
+            break
+        lines.append(line)
+        used += cost
+    return '\n'.join(lines), list(articles[:len(lines)])
@@ -0,0 +1,113 @@
+# app/pipeline/queryplan.py
+#
+# Many topics issue overlapping NewsAPI queries (AI, Technology and Business
+# all ask about OpenAI/Google/Microsoft). A QueryPlan collects every topic's
+# queries up front, runs each distinct query once and hands the shared
+# results back to each topic that asked for it. Given per-topic scorers, each
+# page is turned into every subscribing topic's scored ArticleRecords (so the
+# topic's RANKER decides), and a query keeps paging only while some
+# subscribing topic's top-k still improves and that topic has page budget left.
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Sequence
+
+from app.core.config import settings
+from app.pipeline.articles import ArticleRecord
+from app.pipeline.fetcher import fetch_query, iter_query_pages, normalize_query
+from app.pipeline.http_client import get_http_session
+from app.pipeline.paging import PageBudget, SharedBudget, TopKTracker
+from app.pipeline.topics import TopicConfig
+
+logger = logging.getLogger(__name__)
+
+
+class QueryPlan:
+    def __init__(self, topics: Sequence[TopicConfig],
+                 scorers: Optional[Dict[str, Callable[[List[dict]], List[ArticleRecord]]]] = None):
+        self.topics = list(topics)
+        self.scorers = scorers
+        self.trackers = {topic.name: TopKTracker(topic.top_n) for topic in self.topics}
+        self.budgets = {
+            topic.name: PageBudget(settings.NEWS_API_EXTRA_PAGES_PER_TOPIC) for topic in self.topics
+        }
+        # normalized query -> names of the topics that asked for it
+        self.subscribers: Dict[str, List[str]] = {}
+        self.requested = 0
+        for topic in self.topics:
+            for query in topic.queries:
+                self.requested += 1
+                self.subscribers.setdefault(normalize_query(query), []).append(topic.name)
+        self.results: Dict[str, List[dict]] = {}
+        # topic -> normalized query -> the topic's scored records, when there are scorers
+        self.records: Dict[str, Dict[str, List[ArticleRecord]]] = {topic.name: {} for topic in self.topics}
+
+    @property
+    def unique(self) -> int:
+        return len(self.subscribers)
+
+    def execute(self, date, language='en', sort_by='relevancy', max_workers=5) -> Dict[str, List[dict]]:
+        session = get_http_session()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_query = {
+                executor.submit(self._fetch, query, date, language, sort_by, session): query
+                for query in self.subscribers
+            }
+            for future in as_completed(future_to_query):
+                query = future_to_query[future]
+                try:
+                    self.results[query] = future.result()
+                except Exception as exc:
+                    logger.error(f'{query} generated an exception: {exc}')
+                    self.results[query] = []
+        return self.results
+
+    def _fetch(self, query, date, language, sort_by, session) -> List[dict]:
+        if not self.scorers:
+            return fetch_query(query, date, language, sort_by, session)
+
+        subscribers = self.subscribers[query]
+        active = list(subscribers)
+        budget = SharedBudget(self.budgets[name] for name in active)
+        articles = []
+        for page in iter_query_pages(query, date, language, sort_by, session, budget=budget):
+            articles.extend(page)
+            scored = {name: self.scorers[name](page) for name in subscribers}
+            for name, records in scored.items():
+                self.records[name].setdefault(query, []).extend(records)
+            active = [
+                name for name in active
+                if self.trackers[name].offer(record.score for record in scored[name])
+            ]
+            if not active:
+                break
+            budget.budgets = [self.budgets[name] for name in active]
+        return articles
+
+    def for_topic(self, name: str) -> Dict[str, list]:
+        """Normalized query -> articles for one topic: its scored records when the plan had scorers."""
+        records = self.records.get(name, {})
+        return {
+            query: records.get(query, articles) for query, articles in self.results.items()
+            if name in self.subscribers[query]
+        }
+
+    def stats(self) -> dict:
+        shared = {query: names for query, names in self.subscribers.items() if len(names) > 1}
+        return {
+            'topics': len(self.topics),
+            'requested': self.requested,
+            'unique': self.unique,
+            'saved': self.requested - self.unique,
+            'shared_queries': len(shared),
+        }
+
+    def log_stats(self):
+        stats = self.stats()
+        logger.info(
+            f"Query plan: {stats['requested']} queries across {stats['topics']} topics, "
+            f"{stats['unique']} unique, {stats['saved']} requests saved"
+        )
+        for query, names in self.subscribers.items():
+            if len(names) > 1:
+                logger.debug(f"Shared query {query!r}: {names}")
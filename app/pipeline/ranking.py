@@ -0,0 +1,142 @@
+# app/pipeline/ranking.py
+#
+# Optional TF-IDF relevance ranking (RANKER=tfidf). Article text is split on
+# word boundaries into word n-grams, so 'Meta' no longer matches 'metadata'
+# and 'AI' no longer matches inside other words. All of a topic's candidates
+# are vectorized in one batch as flat (document, term, count) arrays; idf,
+# document norms and the dot product with the topic's profile vector are a
+# few NumPy reductions over those arrays. The profile combines the topic's
+# weighted keywords with terms common to recently featured articles. Ties are
+# broken by input order, so the ranking is deterministic.
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Mapping, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+_TOKEN = re.compile(r'[a-z0-9]+(?:\.[a-z0-9]+)*')
+MAX_NGRAM = 4
+# Only used when building the profile from recent articles; idf handles the batch side
+_STOPWORDS = frozenset(
+    'a an and are as at be by for from has have in into is it its new of on or over says '
+    'than that the their this to up was will with after about more how what why who'.split()
+)
+
+
+def tfidf_available() -> bool:
+    return np is not None
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall((text or '').lower())
+
+
+def terms(text: str, max_ngram: int = MAX_NGRAM) -> List[str]:
+    """Word n-grams of ``text`` up to ``max_ngram`` words, joined with single spaces."""
+    tokens = tokenize(text)
+    found = list(tokens)
+    for size in range(2, max_ngram + 1):
+        found.extend(' '.join(tokens[i:i + size]) for i in range(len(tokens) - size + 1))
+    return found
+
+
+def build_profile(keyword_weights: Mapping[str, float], recent_texts: Sequence[str] = (),
+                  recent_weight: float = 0.5) -> Dict[str, float]:
+    """Topic profile: keyword weights plus terms shared by recently featured articles.
+
+    A recent term's weight is ``recent_weight`` times the share of recent
+    articles containing it; terms found in fewer than two articles are noise
+    and are left out.
+    """
+    profile: Dict[str, float] = {}
+    for keyword, weight in keyword_weights.items():
+        term = ' '.join(tokenize(keyword))
+        if term:
+            profile[term] = profile.get(term, 0.0) + float(weight)
+
+    if recent_texts:
+        document_frequency = Counter()
+        for text in recent_texts:
+            document_frequency.update({
+                term for term in terms(text, 2)
+                if len(term) > 2 and not any(word in _STOPWORDS for word in term.split())
+            })
+        for term, count in sorted(document_frequency.items()):
+            if count >= 2:
+                profile[term] = profile.get(term, 0.0) + recent_weight * count / len(recent_texts)
+    return profile
+
+
+class TfidfRanker:
+    def __init__(self, profile: Mapping[str, float]):
+        if np is None:
+            raise RuntimeError("TfidfRanker requires numpy")
+        self.profile = dict(profile)
+        self.max_ngram = min(MAX_NGRAM, max((term.count(' ') + 1 for term in self.profile), default=1))
+        # Multi-word n-grams only matter when they are profile terms, so only
+        # positions starting one of them are expanded
+        self._phrase_starts = {term.split(' ', 1)[0] for term in self.profile if ' ' in term}
+
+    def _terms(self, text: str) -> List[str]:
+        """Every word of ``text`` plus the multi-word profile terms it contains."""
+        tokens = tokenize(text)
+        found = list(tokens)
+        for index, token in enumerate(tokens):
+            if token in self._phrase_starts:
+                for size in range(2, self.max_ngram + 1):
+                    phrase = ' '.join(tokens[index:index + size])
+                    if phrase in self.profile:
+                        found.append(phrase)
+        return found
+
+    def score(self, texts: Sequence[str]) -> 'np.ndarray':
+        """Cosine-style relevance of each text to the profile (sublinear tf, smoothed idf)."""
+        vocabulary: Dict[str, int] = {}
+        documents, columns, counts = [], [], []
+        for index, text in enumerate(texts):
+            for term, count in Counter(self._terms(text)).items():
+                documents.append(index)
+                columns.append(vocabulary.setdefault(term, len(vocabulary)))
+                counts.append(count)
+
+        size = len(texts)
+        if not counts:
+            return np.zeros(size)
+        documents = np.asarray(documents, dtype=np.int64)
+        columns = np.asarray(columns, dtype=np.int64)
+        counts = np.asarray(counts, dtype=np.float64)
+
+        # Each (document, term) pair appears once, so counting columns gives document frequency
+        document_frequency = np.bincount(columns, minlength=len(vocabulary))
+        idf = np.log((1.0 + size) / (1.0 + document_frequency)) + 1.0
+        weights = (1.0 + np.log(counts)) * idf[columns]
+        norms = np.sqrt(np.bincount(documents, weights=weights * weights, minlength=size))
+
+        query = np.zeros(len(vocabulary))
+        for term, weight in self.profile.items():
+            column = vocabulary.get(term)
+            if column is not None:
+                query[column] = weight
+
+        scores = np.bincount(documents, weights=weights * query[columns], minlength=size)
+        return np.divide(scores, norms, out=np.zeros(size), where=norms > 0)
+
+
+def top_k(scores: Iterable[float], k: int) -> List[int]:
+    """Indices of the ``k`` highest scores, best first; ties keep input order."""
+    scores = np.asarray(scores if isinstance(scores, np.ndarray) else list(scores), dtype=np.float64)
+    if k <= 0 or not scores.size:
+        return []
+    if k < scores.size:
+        # argpartition is not stable, so take every index tied with the k-th score
+        # before ordering; otherwise equal scores could swap between runs
+        threshold = scores[np.argpartition(-scores, k - 1)[k - 1]]
+        candidates = np.flatnonzero(scores >= threshold)
+    else:
+        candidates = np.arange(scores.size)
+    order = np.lexsort((candidates, -scores[candidates]))
+    return candidates[order][:k].tolist()
@@ -0,0 +1,131 @@
+# app/pipeline/ratelimit.py
+#
+# Process-wide request scheduling for NewsAPI. A token bucket caps the overall
+# request rate and an ApiKeyPool spreads requests over every configured key,
+# tracks each key's remaining daily quota and backs a key off after 429s.
+# Both hand out delays instead of sleeping so the same objects work from
+# threads (time.sleep) and from asyncio (await asyncio.sleep).
+
+import logging
+import threading
+import time
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class QuotaExhausted(Exception):
+    """Every key in the pool is out of quota or disabled."""
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class ApiKey:
+    def __init__(self, name: str, value: str, daily_quota: int):
+        self.name = name
+        self.value = value
+        self.daily_quota = daily_quota
+        self.used = 0
+        self.quota_day = date.today()
+        self.cooldown_until = 0.0
+        self.consecutive_429 = 0
+        self.disabled = False
+        self.requests = 0
+        self.rate_limited = 0
+        self.errors = 0
+
+    @property
+    def remaining(self) -> int:
+        if self.quota_day != date.today():
+            self.quota_day = date.today()
+            self.used = 0
+        return 0 if self.disabled else max(0, self.daily_quota - self.used)
+
+
+class ApiKeyPool:
+    def __init__(self, keys: List[Tuple[str, str]], daily_quota: int, rate: float, burst: int,
+                 backoff_seconds: float = 2.0, max_consecutive_429: int = 3):
+        self.keys = [ApiKey(name, value, daily_quota) for name, value in keys]
+        self.bucket = TokenBucket(rate, burst)
+        self.backoff_seconds = backoff_seconds
+        self.max_consecutive_429 = max_consecutive_429
+        self._lock = threading.Lock()
+        self.waited_seconds = 0.0
+
+    def acquire(self) -> Tuple[ApiKey, float]:
+        """Pick the key with the most quota left and return it with the delay to honour first."""
+        with self._lock:
+            usable = [key for key in self.keys if key.remaining > 0]
+            if not usable:
+                raise QuotaExhausted("All NewsAPI keys are out of quota or disabled")
+            now = time.monotonic()
+            ready = [key for key in usable if key.cooldown_until <= now]
+            if ready:
+                key = max(ready, key=lambda k: k.remaining)
+                cooldown = 0.0
+            else:
+                key = min(usable, key=lambda k: k.cooldown_until)
+                cooldown = key.cooldown_until - now
+            key.used += 1
+            key.requests += 1
+            delay = max(cooldown, self.bucket.reserve())
+            self.waited_seconds += delay
+        return key, delay
+
+    def release(self, key: ApiKey, status: int, error_code: Optional[str] = None,
+                retry_after: Optional[str] = None):
+        """Record the outcome of a request made with ``key``."""
+        with self._lock:
+            if status == 429:
+                key.rate_limited += 1
+                key.consecutive_429 += 1
+                if key.consecutive_429 >= self.max_consecutive_429:
+                    # NewsAPI answers 429 both for bursts and for a spent daily quota;
+                    # repeated 429s after backing off mean the quota is gone.
+                    key.used = key.daily_quota
+                    logger.warning(f"NewsAPI key {key.name} keeps returning 429; treating its quota as spent")
+                try:
+                    backoff = float(retry_after)
+                except (TypeError, ValueError):
+                    backoff = self.backoff_seconds * 2 ** (key.consecutive_429 - 1)
+                key.cooldown_until = time.monotonic() + backoff
+                return
+
+            key.consecutive_429 = 0
+            if error_code in ('apiKeyDisabled', 'apiKeyExhausted', 'apiKeyInvalid', 'apiKeyMissing'):
+                key.disabled = True
+                logger.error(f"NewsAPI key {key.name} disabled: {error_code}")
+            if status >= 400:
+                key.errors += 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {
+                key.name: {
+                    'requests': key.requests,
+                    'remaining': key.remaining,
+                    'rate_limited': key.rate_limited,
+                    'errors': key.errors,
+                    'disabled': int(key.disabled),
+                }
+                for key in self.keys
+            }
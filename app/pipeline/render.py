@@ -0,0 +1,98 @@
+# app/pipeline/render.py
+#
+# Newsletter HTML rendering for the daily and weekly pipelines. Templates live
+# in app/pipeline/templates and are compiled once per process by a shared
+# Jinja2 environment; compiled bytecode is also cached on disk so new
+# processes skip parsing. Autoescaping is on, so article titles, descriptions
+# and LLM output cannot break the markup; article links and images go through
+# the safe_url filter, since escaping does not stop a javascript: or data: URL.
+
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, Tuple
+from urllib.parse import urlsplit
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+# Left in the stored email HTML; DailyEmailRun substitutes each subscriber's link
+UNSUBSCRIBE_PLACEHOLDER = '{{unsubscribe_link_placeholder}}'
+SAFE_URL_SCHEMES = ('http', 'https')
+
+_lock = threading.Lock()
+_environment = None
+
+
+def safe_url(url: Any) -> str:
+    """``url`` if it is an http(s) or site-relative URL, otherwise ''."""
+    url = str(url or '').strip()
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return ''
+    if parts.scheme:
+        return url if parts.scheme.lower() in SAFE_URL_SCHEMES else ''
+    return url if url.startswith('/') else ''
+
+
+def get_environment() -> Environment:
+    global _environment
+    if _environment is None:
+        with _lock:
+            if _environment is None:
+                cache_dir = os.path.join(settings.PIPELINE_CACHE_DIR, 'jinja')
+                os.makedirs(cache_dir, exist_ok=True)
+                _environment = Environment(
+                    loader=FileSystemLoader(TEMPLATES_DIR),
+                    autoescape=select_autoescape(['html']),
+                    bytecode_cache=FileSystemBytecodeCache(cache_dir),
+                    auto_reload=False,
+                    trim_blocks=True,
+                    lstrip_blocks=True,
+                )
+                _environment.filters['safe_url'] = safe_url
+    return _environment
+
+
+def render_template(name: str, context: Dict[str, Any]) -> str:
+    return get_environment().get_template(name).render(context)
+
+
+def base_url() -> str:
+    return os.getenv('BASE_URL', 'https://www.thecuriodaily.com')
+
+
+def render_daily(dynamic_title: str, summary: str, highlights, articles) -> Tuple[str, str]:
+    """Web and email HTML for a daily newsletter, both rendered from one context."""
+    context = {
+        'dynamic_title': dynamic_title,
+        'current_date': datetime.now().strftime("%B %d, %Y"),
+        'summary': summary,
+        'highlights': [
+            {'text': text, 'icon': icon.lower().replace(' ', '-'), 'color': color, 'category': category}
+            for text, icon, color, category in highlights
+        ],
+        'articles': [article for article in articles if article.title and article.description and safe_url(article.url)],
+        'base_url': base_url(),
+        'unsubscribe_link': UNSUBSCRIBE_PLACEHOLDER,
+    }
+    return render_template('daily_web.html', context), render_template('daily_email.html', context)
+
+
+def render_weekly(topic: str, title: str, summary: str, highlights, articles, show_metadata: bool = False) -> str:
+    return render_template('weekly.html', {
+        'topic': topic,
+        'title': title,
+        'date': datetime.now().strftime("%b %d, %Y"),
+        'summary': summary,
+        'highlights': highlights,
+        'articles': articles,
+        'base_url': base_url(),
+        'show_metadata': show_metadata,
+    })
@@ -0,0 +1,206 @@
+# app/pipeline/scheduler.py
+#
+# Optional in-process scheduler for the web service (SCHEDULER_ENABLED). It
+# runs the daily news, weekly news and daily email jobs on cron expressions.
+# Every gunicorn worker and instance runs a scheduler, but only the leader
+# starts jobs: the one holding a Postgres session-level advisory lock on a
+# dedicated connection. The lock goes away with the leader's connection or
+# process, and another instance takes over at its next election attempt. Each
+# job also holds its own advisory lock while it runs, so a run that outlasts a
+# change of leader is not started twice. Jobs run as child processes started
+# from scheduler threads, so they add no work to the request event loop and
+# do not compete with it for the GIL.
+
+import hashlib
+import logging
+import os
+import subprocess
+import sys
+import threading
+from typing import Dict, Optional
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.cron import CronTrigger
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db.session import engine
+
+logger = logging.getLogger(__name__)
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'DailyJobs')
+JOB_SCRIPTS = {
+    'daily_news': 'DailyNewsRun.py',
+    'weekly_news': 'WeeklyNewsRun.py',
+    'daily_email': 'DailyEmailRun.py',
+}
+# A run missed by up to this much (e.g. during a leader change) still starts
+MISFIRE_GRACE_SECONDS = 15 * 60
+
+
+def lock_key(name: str) -> int:
+    """Signed 64-bit advisory lock key for ``name``."""
+    return int.from_bytes(hashlib.sha256(f'curiodaily:{name}'.encode('utf-8')).digest()[:8], 'big', signed=True)
+
+
+class AdvisoryLock:
+    """A session-level pg advisory lock, held on its own connection until released."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.key = lock_key(name)
+        self._connection = None
+
+    def acquire(self) -> bool:
+        """Take the lock if it is free; never waits."""
+        if self._connection is not None:
+            return True
+        # Autocommit so the connection does not sit idle in a transaction while holding the lock
+        connection = engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+        try:
+            acquired = connection.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": self.key}).scalar()
+        except Exception:
+            connection.close()
+            raise
+        if not acquired:
+            connection.close()
+            return False
+        self._connection = connection
+        return True
+
+    def held(self) -> bool:
+        """Whether the lock is still held, i.e. its connection is alive."""
+        if self._connection is None:
+            return False
+        try:
+            self._connection.execute(text("SELECT 1"))
+            return True
+        except Exception as e:
+            logger.warning(f"Lost advisory lock {self.name}: {e}")
+            self._discard()
+            return False
+
+    def release(self):
+        if self._connection is None:
+            return
+        try:
+            self._connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self.key})
+            self._connection.close()
+            self._connection = None
+        except Exception as e:
+            logger.warning(f"Error releasing advisory lock {self.name}: {e}")
+            self._discard()
+
+    def _discard(self):
+        # Closing the physical connection is what releases the lock on the server
+        try:
+            self._connection.invalidate()
+        except Exception:
+            pass
+        self._connection = None
+
+
+def run_script(name: str):
+    """Run a job's script to completion in a child process."""
+    script = os.path.join(SCRIPTS_DIR, JOB_SCRIPTS[name])
+    logger.info(f"Starting scheduled job {name}")
+    try:
+        completed = subprocess.run([sys.executable, script], timeout=settings.SCHEDULER_JOB_TIMEOUT_SECONDS)
+    except subprocess.TimeoutExpired:
+        logger.error(f"Scheduled job {name} killed after {settings.SCHEDULER_JOB_TIMEOUT_SECONDS}s")
+        return
+    if completed.returncode:
+        logger.error(f"Scheduled job {name} exited with status {completed.returncode}")
+    else:
+        logger.info(f"Scheduled job {name} finished")
+
+
+class LeaderScheduler:
+    def __init__(self, schedules: Dict[str, str], timezone: str):
+        self._leader = AdvisoryLock('scheduler-leader')
+        self._is_leader = False
+        self._stopping = threading.Event()
+        self._scheduler = BackgroundScheduler(timezone=timezone, job_defaults={
+            'coalesce': True,
+            'max_instances': 1,
+            'misfire_grace_time': MISFIRE_GRACE_SECONDS,
+        })
+        for name, expression in schedules.items():
+            if expression:
+                self._scheduler.add_job(
+                    self.run_job, CronTrigger.from_crontab(expression, timezone=timezone), args=[name], id=name
+                )
+        self._election = threading.Thread(target=self._elect, name='scheduler-election', daemon=True)
+
+    @property
+    def is_leader(self) -> bool:
+        return self._is_leader
+
+    def _elect(self):
+        while not self._stopping.is_set():
+            try:
+                leader = self._leader.held() or self._leader.acquire()
+            except Exception as e:
+                logger.warning(f"Scheduler leader election failed: {e}")
+                leader = False
+            if leader != self._is_leader:
+                logger.info("This instance is now the scheduler leader" if leader else "Lost scheduler leadership")
+            self._is_leader = leader
+            self._stopping.wait(settings.SCHEDULER_ELECTION_SECONDS)
+
+    def run_job(self, name: str):
+        if not self._is_leader:
+            logger.debug(f"Skipping {name}: another instance is the scheduler leader")
+            return
+        lock = AdvisoryLock(f'scheduler-job-{name}')
+        try:
+            if not lock.acquire():
+                logger.warning(f"Skipping {name}: a previous run is still going")
+                return
+        except Exception as e:
+            logger.error(f"Could not lock scheduled job {name}: {e}")
+            return
+        try:
+            run_script(name)
+        finally:
+            lock.release()
+
+    def start(self):
+        self._election.start()
+        self._scheduler.start()
+        for job in self._scheduler.get_jobs():
+            logger.info(f"Scheduled {job.id}: next run at {job.next_run_time}")
+
+    def stop(self):
+        self._stopping.set()
+        # Running child processes are left to finish; the job locks go with this process
+        self._scheduler.shutdown(wait=False)
+        self._election.join()
+        self._leader.release()
+        self._is_leader = False
+
+
+_lock = threading.Lock()
+_scheduler: Optional[LeaderScheduler] = None
+
+
+def start_scheduler():
+    global _scheduler
+    if not settings.SCHEDULER_ENABLED:
+        return
+    with _lock:
+        if _scheduler is None:
+            _scheduler = LeaderScheduler({
+                'daily_news': settings.SCHEDULE_DAILY_NEWS,
+                'weekly_news': settings.SCHEDULE_WEEKLY_NEWS,
+                'daily_email': settings.SCHEDULE_DAILY_EMAIL,
+            }, settings.SCHEDULER_TIMEZONE)
+            _scheduler.start()
+
+
+def stop_scheduler():
+    global _scheduler
+    with _lock:
+        if _scheduler is not None:
+            _scheduler.stop()
+            _scheduler = None
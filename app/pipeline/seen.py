@@ -0,0 +1,174 @@
+# app/pipeline/seen.py
+#
+# Index of articles that have already been featured, so the same story is not
+# picked again on following days (daily) or in following issues (weekly).
+# Articles are matched by canonical URL or by a fingerprint of the normalized
+# title, which also catches the same story republished under a new URL.
+# Lookups are a single batched query per topic and entries older than the
+# retention window are ignored and pruned. The table is created on first use,
+# since the jobs can run before the web app has ever created its tables.
+
+import hashlib
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from sqlalchemy import bindparam, text
+
+from app.core.config import settings
+from app.db.session import SessionLocal, ensure_tables
+from app.models.seen_article import SeenArticle
+from app.pipeline.dedup import normalize_text
+
+logger = logging.getLogger(__name__)
+
+_TRACKING_PARAMS = {'fbclid', 'gclid', 'mc_cid', 'mc_eid', 'ocid', 'cmpid', 'ref', 'smid'}
+
+_LOOKUP = text("""
+    SELECT url_hash, fingerprint
+    FROM seen_articles
+    WHERE edition = :edition AND topic_id = :topic_id AND first_seen_at >= :cutoff
+      AND (url_hash IN :url_hashes OR fingerprint IN :fingerprints)
+""").bindparams(bindparam('url_hashes', expanding=True), bindparam('fingerprints', expanding=True))
+
+_INSERT = text("""
+    INSERT INTO seen_articles (edition, topic_id, url_hash, fingerprint, url, title)
+    VALUES (:edition, :topic_id, :url_hash, :fingerprint, :url, :title)
+    ON CONFLICT (edition, topic_id, url_hash) DO NOTHING
+""")
+
+
+def canonical_url(url: str) -> str:
+    """Lowercased scheme/host without www., fragment, tracking parameters or trailing slash."""
+    parts = urlsplit((url or '').strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query)
+        if not key.lower().startswith('utm_') and key.lower() not in _TRACKING_PARAMS
+    ))
+    return urlunsplit((parts.scheme.lower() or 'https', host, parts.path.rstrip('/'), query, ''))
+
+
+def _digest(value: str) -> str:
+    return hashlib.sha256(value.encode('utf-8')).hexdigest()
+
+
+def article_keys(article) -> Optional[Tuple[str, str, str]]:
+    """(url_hash, fingerprint, url) for an article, or None if it has neither URL nor title."""
+    url = article.get('url') or ''
+    title = normalize_text(article.get('title') or '')
+    if not url and not title:
+        return None
+    canonical = canonical_url(url) if url else ''
+    return _digest(canonical or title), _digest(title or canonical), url
+
+
+class SeenArticleIndex:
+    def __init__(self, edition: str, retention_days: Optional[int] = None):
+        self.edition = edition
+        self.retention_days = retention_days or settings.SEEN_ARTICLE_RETENTION_DAYS
+
+    def ensure_table(self):
+        """Create seen_articles if missing, so runs can start before the web app has run."""
+        ensure_tables(SeenArticle.__table__)
+
+    def _cutoff(self) -> datetime:
+        return datetime.now(timezone.utc) - timedelta(days=self.retention_days)
+
+    def filter_unseen(self, articles: Iterable, topic_id: int) -> List:
+        """Drop articles already featured for ``topic_id`` within the retention window."""
+        articles = list(articles)
+        keyed = [(article, article_keys(article)) for article in articles]
+        url_hashes = sorted({keys[0] for _, keys in keyed if keys})
+        fingerprints = sorted({keys[1] for _, keys in keyed if keys})
+        if not url_hashes:
+            return articles
+
+        try:
+            self.ensure_table()
+            with SessionLocal() as db:
+                rows = db.execute(_LOOKUP, {
+                    "edition": self.edition,
+                    "topic_id": topic_id,
+                    "cutoff": self._cutoff(),
+                    "url_hashes": url_hashes,
+                    "fingerprints": fingerprints,
+                }).fetchall()
+        except Exception as e:
+            logger.error(f"Error reading seen articles for {self.edition} topic {topic_id}: {e}")
+            return articles
+
+        seen_urls = {row[0] for row in rows}
+        seen_fingerprints = {row[1] for row in rows}
+        unseen = [
+            article for article, keys in keyed
+            if not keys or (keys[0] not in seen_urls and keys[1] not in seen_fingerprints)
+        ]
+        if len(unseen) < len(articles):
+            logger.info(f"Skipped {len(articles) - len(unseen)} already featured articles "
+                        f"for {self.edition} topic {topic_id}")
+        return unseen
+
+    def mark_seen(self, articles: Iterable, topic_id: int, db=None):
+        """Record featured articles; with ``db`` it joins the caller's transaction and errors propagate."""
+        rows = []
+        for article in articles:
+            keys = article_keys(article)
+            if keys:
+                url_hash, fingerprint, url = keys
+                rows.append({
+                    "edition": self.edition,
+                    "topic_id": topic_id,
+                    "url_hash": url_hash,
+                    "fingerprint": fingerprint,
+                    "url": url,
+                    "title": article.get('title'),
+                })
+        if not rows:
+            return
+        if db is not None:
+            self.ensure_table()
+            db.execute(_INSERT, rows)
+            return
+
+        try:
+            self.ensure_table()
+            with SessionLocal() as db:
+                db.execute(_INSERT, rows)
+                db.commit()
+        except Exception as e:
+            logger.error(f"Error recording seen articles for {self.edition} topic {topic_id}: {e}")
+
+    def recent_titles(self, topic_id: int, limit: int) -> List[str]:
+        """Titles of the articles most recently featured for ``topic_id``."""
+        try:
+            self.ensure_table()
+            with SessionLocal() as db:
+                rows = db.execute(text("""
+                    SELECT title FROM seen_articles
+                    WHERE edition = :edition AND topic_id = :topic_id AND title IS NOT NULL
+                    ORDER BY first_seen_at DESC, id DESC
+                    LIMIT :limit
+                """), {"edition": self.edition, "topic_id": topic_id, "limit": limit}).fetchall()
+        except Exception as e:
+            logger.error(f"Error reading recent titles for {self.edition} topic {topic_id}: {e}")
+            return []
+        return [row[0] for row in rows]
+
+    def prune(self) -> int:
+        try:
+            self.ensure_table()
+            with SessionLocal() as db:
+                deleted = db.execute(
+                    text("DELETE FROM seen_articles WHERE first_seen_at < :cutoff"),
+                    {"cutoff": self._cutoff()},
+                ).rowcount
+                db.commit()
+        except Exception as e:
+            logger.error(f"Error pruning seen articles: {e}")
+            return 0
+        logger.info(f"Pruned {deleted} seen articles older than {self.retention_days} days")
+        return deleted
@@ -0,0 +1,137 @@
+# app/pipeline/stages.py
+#
+# Where the CPU-bound pipeline stages run. Network I/O stays on the event loops
+# (app/pipeline/loop.py); HTML parsing, keyword scoring, TF-IDF ranking, dedup
+# clustering and template rendering either run inline in the calling topic
+# thread or, for the stages listed in PROCESS_STAGES, in one shared process
+# pool sized to the container's CPU quota, so they are not serialized on the
+# GIL. The stage functions below are top-level (picklable) and take compact
+# payloads: callers send the strings a stage reads rather than whole records,
+# and get back scores, index groups or HTML.
+
+import asyncio
+import logging
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple
+
+from app.core.config import settings
+from app.pipeline.keywords import TopicKeywords
+from app.pipeline.ranking import TfidfRanker
+
+logger = logging.getLogger(__name__)
+
+STAGES = ('extract', 'score', 'rank', 'dedup', 'render')
+
+
+def _cgroup_cpu_quota() -> Optional[float]:
+    """CPU limit from the cgroup (v2, then v1), or None when unlimited."""
+    try:
+        with open('/sys/fs/cgroup/cpu.max') as f:
+            quota, period = f.read().split()[:2]
+        return None if quota == 'max' else int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    try:
+        with open('/sys/fs/cgroup/cpu/cpu.cfs_quota_us') as f:
+            quota = int(f.read())
+        with open('/sys/fs/cgroup/cpu/cpu.cfs_period_us') as f:
+            period = int(f.read())
+        return quota / period if quota > 0 and period > 0 else None
+    except (OSError, ValueError):
+        return None
+
+
+def available_cpus() -> int:
+    """CPUs this process may use: the affinity mask, capped by the container's CPU quota."""
+    try:
+        count = len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS
+        count = os.cpu_count() or 1
+    quota = _cgroup_cpu_quota()
+    if quota:
+        count = min(count, math.ceil(quota))
+    return max(1, count)
+
+
+def process_stages() -> FrozenSet[str]:
+    names = {name.strip().lower() for name in settings.PROCESS_STAGES.split(',') if name.strip()}
+    unknown = names.difference(STAGES)
+    if unknown:
+        logger.warning(f"Ignoring unknown PROCESS_STAGES entries: {sorted(unknown)}")
+    return frozenset(names.intersection(STAGES))
+
+
+_lock = threading.Lock()
+_pool = None
+_stages = None
+
+
+def in_process_pool(stage: str) -> bool:
+    global _stages
+    if _stages is None:
+        _stages = process_stages()
+    return stage in _stages
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        with _lock:
+            if _pool is None:
+                size = settings.PROCESS_POOL_SIZE or available_cpus()
+                # Workers are not forked from this process: it runs event loop and
+                # topic threads whose locks could be copied while held
+                method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+                _pool = ProcessPoolExecutor(max_workers=size, mp_context=multiprocessing.get_context(method))
+                logger.info(f"Created stage process pool ({size} workers) for {sorted(_stages or ())}")
+    return _pool
+
+
+def run_stage(stage: str, fn: Callable, *args) -> Any:
+    """``fn(*args)`` in the process pool when ``stage`` is configured for it, otherwise inline."""
+    if in_process_pool(stage):
+        return get_process_pool().submit(fn, *args).result()
+    return fn(*args)
+
+
+async def run_stage_async(stage: str, fn: Callable, *args) -> Any:
+    """Like run_stage, for event loop callers; inline stages go to the loop's default thread pool."""
+    executor = get_process_pool() if in_process_pool(stage) else None
+    return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+
+
+def close_process_pool():
+    global _pool
+    with _lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
+
+
+# Stage functions. In a worker process the topic keyword matchers are built on
+# first use and kept for the life of the worker.
+
+_topic_keywords: Dict[str, TopicKeywords] = {}
+
+
+def topic_keywords(config) -> TopicKeywords:
+    keywords = _topic_keywords.get(config.name)
+    if keywords is None:
+        keywords = _topic_keywords[config.name] = TopicKeywords(
+            config.priority_topics, config.companies, config.categories, config.default_category
+        )
+    return keywords
+
+
+def score_articles(config, texts: Sequence[Tuple[str, str]]) -> List[Tuple[Dict[str, int], int, List[str]]]:
+    """(keyword hits, score, categories) for each (title + description, content) pair."""
+    keywords = topic_keywords(config)
+    return [keywords.analyze(text, content) for text, content in texts]
+
+
+def rank_articles(profile: Mapping[str, float], texts: Sequence[str]) -> List[float]:
+    return TfidfRanker(profile).score(texts).tolist()
@@ -0,0 +1,1569 @@
+# app/pipeline/topics.py
+#
+# Per-topic data for the daily newsletters. Adding a topic is a new entry in
+# TOPICS (plus a row in the topics table), not a new fetcher module.
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class TopicConfig:
+    name: str  # Must match topics.name (case-insensitive)
+    topic_id: int
+    label: str  # Topic wording used inside the LLM prompts, e.g. "space"
+    queries: List[str]
+    trusted_sources: List[str]
+    # Named entities (companies, organisations, platforms...) scored at weight 1
+    companies: List[str]
+    # Keywords scored at weight 2
+    priority_topics: List[str]
+    topics: List[str]
+    categories: Dict[str, List[str]]
+    default_category: str
+    highlight_categories: List[str]
+    fallback_highlight: Tuple[str, str, str]  # (icon, color, category)
+    title_format: str
+    title_example: str
+    title_focus: str
+    default_title: str
+    summary_focus: str
+    max_highlight_length: int = 70
+    min_highlight_length: int = 20
+    # Near-duplicate (estimated Jaccard) threshold; None uses the dedup default
+    similarity_threshold: Optional[float] = None
+    top_n: int = 10
+
+
+TOPICS: List[TopicConfig] = [
+    TopicConfig(
+        name='AI',
+        topic_id=1,
+        label='AI',
+        queries=[
+            'AI breakthrough OR AI advancement', 'LLM OR large language model OR GPT',
+            'AI ethics OR AI alignment OR AI safety', 'AI research OR AI conference',
+            'AI application OR AI use case',
+            'AI in healthcare OR AI in finance OR AI in education',
+            'AI robotics OR autonomous systems OR computer vision',
+            'OpenAI OR DeepMind OR Google AI OR Microsoft AI OR Anthropic'
+        ],
+        trusted_sources=[
+            'techcrunch.com', 'wired.com', 'technologyreview.com', 'theverge.com',
+            'venturebeat.com', 'zdnet.com', 'arstechnica.com',
+            'forbes.com/ai-machine-learning', 'ai.googleblog.com', 'blogs.microsoft.com/ai',
+            'openai.com/blog', 'deepmind.com/blog', 'research.google/pubs',
+            'ai.facebook.com', 'aws.amazon.com/blogs/machine-learning',
+            'nvidia.com/en-us/deep-learning-ai',
+            'ibm.com/cloud/blog/category/artificial-intelligence', 'arxiv.org',
+            'paperswithcode.com', 'distill.pub', 'jmlr.org', 'neurips.cc', 'icml.cc',
+            'iclr.cc', 'aaai.org', 'aitrends.com', 'analyticsindiamag.com',
+            'machinelearningmastery.com'
+        ],
+        companies=[
+            'OpenAI', 'Anthropic', 'DeepMind', 'Google AI', 'Microsoft AI', 'Meta AI',
+            'NVIDIA AI', 'IBM AI', 'Hugging Face', 'AI21 Labs', 'Cohere', 'Stability AI',
+            'Midjourney', 'Inflection AI', 'Google', 'OpenAI', 'Microsoft', 'Anthropic',
+            'DeepMind', 'IBM', 'NVIDIA', 'Meta', 'Amazon', 'Apple', 'Baidu', 'Tesla',
+            'Intel', 'SenseTime', 'Grok', 'Hugging Face', 'Databricks', 'DataRobot',
+            'C3.ai', 'Scale AI', 'Cohere', 'Runway', 'Stability AI', 'Midjourney',
+            'Inflection AI'
+        ],
+        priority_topics=[
+            'LLM', 'Large Language Model', 'GPT', 'Generative AI', 'GenAI', 'OpenAI',
+            'Anthropic', 'DeepMind', 'Google AI', 'Microsoft AI', 'AI Research',
+            'AI Ethics', 'AI Alignment', 'AI Safety', 'Transformer Model',
+            'Foundation Model', 'Multimodal AI', 'Few-shot Learning', 'Zero-shot Learning',
+            'Prompt Engineering'
+        ],
+        topics=[
+            'Artificial Intelligence', 'Machine Learning', 'Deep Learning',
+            'Neural Networks', 'Natural Language Processing', 'Computer Vision', 'Robotics',
+            'Generative AI', 'Large Language Models', 'Reinforcement Learning', 'AI Ethics',
+            'AI Research', 'AI Applications', 'AI in Healthcare', 'AI in Finance',
+            'AI in Education', 'Transformer Models', 'Few-shot Learning',
+            'Transfer Learning', 'Federated Learning', 'Explainable AI', 'AI Alignment',
+            'Quantum Machine Learning', 'Edge AI', 'AI Chips', 'AI Governance', 'AI Safety',
+            'AI Bias', 'AI Regulation', 'Multimodal AI', 'AI Agents', 'AI Assistants',
+            'Autonomous Systems'
+        ],
+        categories={
+            'AI Research & Development': [
+                'research', 'development', 'breakthrough', 'innovation', 'paper', 'study'
+            ],
+            'Industry News': [
+                'company', 'startup', 'investment', 'partnership', 'product launch'
+            ],
+            'AI Applications': [
+                'application', 'use case', 'implementation', 'deployment', 'in healthcare',
+                'in finance'
+            ],
+            'Ethics & Governance': [
+                'ethics', 'governance', 'regulation', 'policy', 'bias', 'fairness'
+            ],
+            'AI Trends': ['trend', 'forecast', 'prediction', 'future of AI'],
+            'GenAI & LLMs': ['generative AI', 'LLM', 'language model', 'GPT', 'transformer'],
+            'Robotics & Autonomous Systems': [
+                'robotics', 'autonomous', 'robot', 'self-driving'
+            ],
+            'AI Hardware': ['chip', 'processor', 'TPU', 'GPU', 'quantum computing'],
+        },
+        default_category='General AI News',
+        highlight_categories=[
+            'AI', 'Research', 'Business', 'Technology', 'Ethics', 'Innovation'
+        ],
+        max_highlight_length=120,
+        min_highlight_length=0,
+        fallback_highlight=('question', '#333333', 'General'),
+        title_format='AI [Theme]: [Specific Detail]',
+        title_example='AI Breakthrough: New Language Model Surpasses Human Performance',
+        title_focus='AI advancements',
+        default_title="Today's AI Highlights",
+        summary_focus='AI',
+    ),
+    TopicConfig(
+        name='Technology',
+        topic_id=2,
+        label='technology',
+        queries=[
+            'Technology breakthrough OR Technology advancement',
+            '5G OR IoT OR Blockchain OR Quantum Computing',
+            'Robotics OR Virtual Reality OR Augmented Reality',
+            'Cybersecurity OR Cloud Computing OR Edge Computing',
+            'Electric Vehicles OR Renewable Energy OR Green Technology',
+            'Biotechnology OR Nanotechnology OR Space Technology',
+            'Software Development OR Hardware OR Telecommunications',
+            'Fintech OR Healthtech OR Edtech'
+        ],
+        trusted_sources=[
+            'techcrunch.com', 'wired.com', 'technologyreview.com', 'theverge.com',
+            'venturebeat.com', 'zdnet.com', 'arstechnica.com', 'forbes.com/technology',
+            'cnet.com', 'engadget.com', 'macrumors.com', 'gizmodo.com', 'techradar.com',
+            'tomshardware.com', 'anandtech.com', 'slashgear.com', 'thenextweb.com',
+            'digitaltrends.com', 'mashable.com', 'theinformation.com'
+        ],
+        companies=[
+            'Apple', 'Microsoft', 'Google', 'Amazon', 'Meta', 'Tesla', 'NVIDIA', 'Intel',
+            'AMD', 'Qualcomm', 'Samsung', 'Sony', 'LG', 'IBM', 'Oracle', 'Cisco', 'Dell',
+            'HP', 'Lenovo', 'Huawei', 'SpaceX', 'Boston Dynamics', 'Uber', 'Lyft', 'Airbnb',
+            'PayPal', 'Square', 'Stripe', 'Zoom', 'Shopify', 'Adobe', 'Salesforce',
+            'VMware', 'Broadcom', 'TSMC'
+        ],
+        priority_topics=[
+            '5G', 'IoT', 'Blockchain', 'Quantum Computing', 'Robotics', 'Virtual Reality',
+            'Augmented Reality', 'Cybersecurity', 'Cloud Computing', 'Edge Computing',
+            'Big Data', 'Data Analytics', 'Machine Vision', 'Autonomous Vehicles',
+            'Electric Vehicles', 'Renewable Energy', 'Biotechnology', 'Nanotechnology',
+            'Space Technology', '3D Printing'
+        ],
+        topics=[
+            'Software Development', 'Hardware', 'Telecommunications', 'Internet Technology',
+            'Mobile Technology', 'Consumer Electronics', 'Enterprise Technology',
+            'Green Technology', 'Fintech', 'Healthtech', 'Edtech', 'Smart Home',
+            'Wearable Technology', 'Digital Transformation', 'Tech Startups',
+            'Tech Regulation', 'Tech Ethics', 'Social Media', 'E-commerce',
+            'Gaming Technology', 'Streaming Technology', 'Cryptocurrency'
+        ],
+        categories={
+            'Software & Internet': ['software', 'app', 'internet', 'web', 'cloud', 'saas'],
+            'Hardware & Gadgets': [
+                'hardware', 'device', 'gadget', 'smartphone', 'computer', 'laptop'
+            ],
+            'Telecommunications': ['5G', 'network', 'telecom', 'wireless', 'broadband'],
+            'Emerging Tech': [
+                'blockchain', 'VR', 'AR', 'IoT', 'quantum computing', '3D printing'
+            ],
+            'Green Tech': [
+                'renewable', 'sustainable', 'clean energy', 'electric vehicle', 'solar',
+                'wind'
+            ],
+            'Cybersecurity': ['security', 'hack', 'encryption', 'privacy', 'cyber attack'],
+            'Biotech & Health Tech': [
+                'biotech', 'health tech', 'medical technology', 'genomics'
+            ],
+            'Space & Aviation': ['space', 'satellite', 'rocket', 'drone', 'aviation'],
+            'Fintech': ['fintech', 'cryptocurrency', 'digital payment', 'blockchain'],
+            'Enterprise Tech': [
+                'enterprise', 'business software', 'CRM', 'ERP', 'cloud computing'
+            ],
+        },
+        default_category='General Technology',
+        highlight_categories=[
+            'Software', 'Hardware', 'Emerging Tech', 'Green Tech', 'Cybersecurity',
+            'Innovation'
+        ],
+        max_highlight_length=120,
+        min_highlight_length=0,
+        fallback_highlight=('microchip', '#007bff', 'Technology'),
+        title_format='Tech [Theme]: [Specific Detail]',
+        title_example='Tech Breakthrough: Revolutionary Quantum Processor Unveiled',
+        title_focus='technology advancements',
+        default_title="Today's Technology Highlights",
+        summary_focus='technology',
+    ),
+    TopicConfig(
+        name='Business',
+        topic_id=3,
+        label='business',
+        queries=[
+            'business innovation OR business strategy', 'startup OR entrepreneurship',
+            'leadership OR management', 'marketing OR e-commerce',
+            'supply chain OR logistics', 'business technology OR digital transformation',
+            'corporate governance OR business ethics', 'mergers and acquisitions OR IPO',
+            'sustainability in business OR corporate social responsibility',
+            'workplace culture OR remote work'
+        ],
+        trusted_sources=[
+            'forbes.com', 'bloomberg.com', 'businessinsider.com', 'wsj.com', 'ft.com',
+            'hbr.org', 'economist.com', 'cnbc.com', 'reuters.com', 'inc.com',
+            'entrepreneur.com', 'techcrunch.com', 'fastcompany.com', 'fortune.com',
+            'businessweek.com', 'marketwatch.com', 'barrons.com', 'thestreet.com',
+            'fool.com', 'seekingalpha.com'
+        ],
+        companies=[
+            'Apple', 'Microsoft', 'Amazon', 'Alphabet', 'Meta', 'Tesla', 'Walmart',
+            'JPMorgan Chase', 'Johnson & Johnson', 'Visa', 'Procter & Gamble',
+            'UnitedHealth', 'Home Depot', 'Mastercard', 'Bank of America', 'Nvidia',
+            'Chevron', 'Eli Lilly', 'Exxon Mobil', 'Coca-Cola', 'Pfizer', 'AbbVie', 'Merck',
+            'Adobe', 'Cisco'
+        ],
+        priority_topics=[
+            'Startup', 'Entrepreneurship', 'Innovation', 'Leadership', 'Marketing',
+            'E-commerce', 'Digital Transformation', 'Sustainability', 'Supply Chain',
+            'Customer Experience', 'Business Strategy', 'Corporate Governance',
+            'Mergers and Acquisitions', 'IPO', 'Business Technology', 'Workplace Culture',
+            'Remote Work'
+        ],
+        topics=[
+            'Business Strategy', 'Entrepreneurship', 'Marketing', 'Management',
+            'Leadership', 'Innovation', 'E-commerce', 'Supply Chain', 'Human Resources',
+            'Business Technology', 'Sustainability', 'Corporate Social Responsibility',
+            'Business Ethics', 'Globalization', 'Startups', 'Small Business',
+            'Customer Experience', 'Digital Transformation', 'Business Analytics',
+            'Organizational Behavior', 'Project Management', 'Business Law',
+            'Mergers and Acquisitions', 'Corporate Governance', 'Business Intelligence',
+            'Competitive Analysis', 'Market Research', 'Business Development',
+            'Operational Excellence', 'Change Management'
+        ],
+        categories={
+            'Business Strategy': ['strategy', 'planning', 'growth', 'competitive advantage'],
+            'Innovation': ['innovation', 'disruption', 'new product', 'R&D'],
+            'Leadership': ['leadership', 'management', 'CEO', 'executive'],
+            'Marketing': ['marketing', 'branding', 'advertising', 'consumer behavior'],
+            'Operations': ['operations', 'supply chain', 'logistics', 'efficiency'],
+            'Technology': [
+                'technology', 'digital transformation', 'AI in business', 'automation'
+            ],
+            'Entrepreneurship': [
+                'startup', 'entrepreneur', 'venture capital', 'small business'
+            ],
+            'Sustainability': [
+                'sustainability', 'ESG', 'green business', 'corporate responsibility'
+            ],
+            'Global Business': ['global', 'international', 'trade', 'cross-border'],
+            'Workplace': ['workplace', 'employee', 'HR', 'company culture'],
+        },
+        default_category='General Business',
+        highlight_categories=[
+            'Strategy', 'Innovation', 'Marketing', 'Leadership', 'Operations', 'Technology'
+        ],
+        max_highlight_length=120,
+        min_highlight_length=0,
+        fallback_highlight=('briefcase', '#333333', 'General'),
+        title_format='Business [Theme]: [Specific Detail]',
+        title_example='Business Innovation: Tech Giants Reshape Remote Work Landscape',
+        title_focus='business trends',
+        default_title="Today's Business Highlights",
+        summary_focus='business',
+    ),
+    TopicConfig(
+        name='Science',
+        topic_id=4,
+        label='science',
+        queries=[
+            'scientific breakthrough OR scientific discovery',
+            'physics OR chemistry OR biology OR astronomy',
+            'climate change OR sustainability OR environmental science',
+            'neuroscience OR genetics OR biotechnology',
+            'quantum physics OR nanotechnology OR artificial intelligence',
+            'space exploration OR NASA OR ESA OR CERN',
+            'medical research OR public health OR epidemiology',
+            'renewable energy OR clean technology OR green innovation'
+        ],
+        trusted_sources=[
+            'nature.com', 'sciencemag.org', 'scientificamerican.com', 'newscientist.com',
+            'sciencedaily.com', 'phys.org', 'eurekalert.org', 'sciencenews.org', 'pnas.org',
+            'cell.com', 'nasa.gov', 'esa.int', 'cern.ch', 'nationalgeographic.com',
+            'discovermagazine.com', 'livescience.com', 'sciencealert.com', 'space.com',
+            'popsci.com', 'medicalxpress.com', 'chemistryworld.com', 'physicsworld.com',
+            'acs.org', 'iflscience.com'
+        ],
+        companies=[
+            'NASA', 'ESA', 'CERN', 'NIH', 'WHO', 'CDC', 'NSF', 'AAAS', 'Royal Society',
+            'Max Planck Society', 'CSIRO', 'CNRS', 'Helmholtz Association', 'RIKEN',
+            'Chinese Academy of Sciences', 'Indian Space Research Organisation', 'JAXA',
+            'Caltech', 'MIT', 'Stanford', 'Harvard', 'Oxford', 'Cambridge', 'ETH Zurich'
+        ],
+        priority_topics=[
+            'Breakthrough', 'Discovery', 'Innovation', 'Research', 'Experiment', 'Theory',
+            'Observation', 'Technology', 'Climate Change', 'Sustainability', 'Biodiversity',
+            'Quantum', 'Genetics', 'Neuroscience', 'Astronomy'
+        ],
+        topics=[
+            'Physics', 'Chemistry', 'Biology', 'Astronomy', 'Earth Science',
+            'Environmental Science', 'Neuroscience', 'Genetics', 'Biotechnology',
+            'Nanotechnology', 'Quantum Physics', 'Artificial Intelligence',
+            'Climate Science', 'Ecology', 'Oceanography', 'Particle Physics',
+            'Astrophysics', 'Molecular Biology', 'Biochemistry', 'Microbiology',
+            'Immunology', 'Evolutionary Biology', 'Paleontology', 'Geology',
+            'Atmospheric Science', 'Materials Science', 'Robotics', 'Computer Science',
+            'Mathematics', 'Medicine', 'Pharmacology'
+        ],
+        categories={
+            'Physics & Astronomy': [
+                'physics', 'astronomy', 'astrophysics', 'quantum', 'particle', 'space'
+            ],
+            'Chemistry & Materials': [
+                'chemistry', 'material', 'molecule', 'compound', 'reaction'
+            ],
+            'Biology & Medicine': [
+                'biology', 'medicine', 'genetics', 'cell', 'disease', 'health'
+            ],
+            'Earth & Environmental Science': [
+                'earth', 'climate', 'environment', 'geology', 'ocean', 'atmosphere'
+            ],
+            'Technology & Engineering': [
+                'technology', 'engineering', 'robotics', 'AI', 'computer', 'nanotech'
+            ],
+            'Neuroscience & Psychology': [
+                'brain', 'neuroscience', 'psychology', 'cognitive', 'behavior'
+            ],
+            'Ecology & Evolution': [
+                'ecology', 'evolution', 'species', 'ecosystem', 'biodiversity'
+            ],
+        },
+        default_category='General Science',
+        highlight_categories=[
+            'Physics', 'Chemistry', 'Biology', 'Astronomy', 'Earth Science', 'Technology',
+            'Medicine'
+        ],
+        fallback_highlight=('flask', '#4a4a4a', 'General Science'),
+        title_format='Science [Theme]: [Specific Detail]',
+        title_example='Science Breakthrough: New Particle Discovered at CERN',
+        title_focus='scientific advancements',
+        default_title="Today's Science Highlights",
+        summary_focus='AI',
+        similarity_threshold=0.8,
+    ),
+    TopicConfig(
+        name='Politics',
+        topic_id=5,
+        label='political',
+        queries=[
+            'Politics OR Political news', 'Election OR Voting',
+            'Foreign Policy OR International Relations', 'Legislation OR Bill OR Law',
+            'Government OR Administration', 'Political scandal OR controversy',
+            'Political reform OR policy change', 'Diplomacy OR Diplomatic relations'
+        ],
+        trusted_sources=[
+            'bbc.com', 'reuters.com', 'apnews.com', 'npr.org', 'nytimes.com',
+            'washingtonpost.com', 'politico.com', 'thehill.com', 'fivethirtyeight.com',
+            'economist.com', 'foreignpolicy.com', 'cfr.org', 'brookings.edu',
+            'pewresearch.org', 'realclearpolitics.com', 'ballotpedia.org'
+        ],
+        companies=[
+            'United Nations', 'European Union', 'NATO', 'World Bank', 'IMF', 'White House',
+            'Congress', 'Supreme Court', 'State Department', 'Pentagon', 'Kremlin',
+            'Downing Street', 'Élysée Palace', 'United States', 'China', 'Russia', 'India',
+            'United Kingdom', 'France', 'Germany', 'Japan', 'Brazil', 'Canada', 'Australia'
+        ],
+        priority_topics=[
+            'Election', 'Legislation', 'Foreign Policy', 'Diplomacy', 'Trade War',
+            'Climate Policy', 'Economic Policy', 'Healthcare Reform', 'Immigration',
+            'National Security', 'Human Rights', 'Constitutional Crisis',
+            'Political Scandal', 'Impeachment', 'Geopolitical Tensions'
+        ],
+        topics=[
+            'Democracy', 'Authoritarianism', 'Populism', 'Nationalism', 'Globalism',
+            'Civil Rights', 'Voting Rights', 'Campaign Finance', 'Lobbying',
+            'Political Parties', 'Electoral Systems', 'International Relations',
+            'Diplomacy', 'Foreign Policy', 'National Security', 'Defense Policy',
+            'Economic Policy', 'Fiscal Policy', 'Monetary Policy', 'Trade Policy',
+            'Social Policy', 'Healthcare Policy', 'Education Policy',
+            'Environmental Policy', 'Energy Policy', 'Immigration Policy', 'Labor Policy',
+            'Tax Policy', 'Welfare Policy', 'Criminal Justice Policy', 'Constitutional Law',
+            'Political Ideology', 'Political Movements', 'Political Activism'
+        ],
+        categories={
+            'Domestic Policy': ['domestic policy', 'national policy', 'internal affairs'],
+            'International Relations': [
+                'foreign policy', 'diplomacy', 'international', 'global'
+            ],
+            'Elections': ['election', 'voting', 'campaign', 'ballot'],
+            'Legislation': ['law', 'bill', 'legislation', 'congress', 'parliament'],
+            'Political Movements': ['protest', 'movement', 'activism', 'demonstration'],
+            'Governance': [
+                'government', 'administration', 'executive', 'judicial', 'legislative'
+            ],
+        },
+        default_category='General Politics',
+        highlight_categories=[
+            'Domestic Policy', 'International Relations', 'Elections', 'Legislation',
+            'Political Movements', 'Governance'
+        ],
+        fallback_highlight=('flag', '#333333', 'General'),
+        title_format='Politics [Theme]: [Specific Detail]',
+        title_example='Politics Shake-up: Major Legislation Passes in Landmark Vote',
+        title_focus='political events',
+        default_title="Today's Political Highlights",
+        summary_focus='politics',
+    ),
+    TopicConfig(
+        name='Finance',
+        topic_id=6,
+        label='financial',
+        queries=[
+            'Finance OR Financial news', 'Stock market OR Investing',
+            'Economy OR Economic policy', 'Banking OR Financial services',
+            'Cryptocurrency OR Blockchain', 'Personal finance OR Money management',
+            'Corporate finance OR Business finance', 'Financial technology OR Fintech'
+        ],
+        trusted_sources=[
+            'bloomberg.com', 'reuters.com', 'ft.com', 'wsj.com', 'cnbc.com', 'forbes.com',
+            'marketwatch.com', 'investing.com', 'finance.yahoo.com', 'economist.com',
+            'barrons.com', 'morningstar.com', 'seekingalpha.com', 'fool.com',
+            'businessinsider.com', 'thefinancialtimes.com'
+        ],
+        companies=[
+            'Federal Reserve', 'European Central Bank', 'IMF', 'World Bank', 'NYSE',
+            'NASDAQ', 'S&P 500', 'Dow Jones', 'FTSE', 'Nikkei', 'Goldman Sachs',
+            'JPMorgan Chase', 'Bank of America', 'Citigroup', 'Wells Fargo',
+            'Morgan Stanley', 'BlackRock', 'Vanguard', 'Fidelity', 'Charles Schwab'
+        ],
+        priority_topics=[
+            'Stock Market', 'Interest Rates', 'Inflation', 'Cryptocurrency',
+            'Economic Policy', 'Trade War', 'Financial Regulation', 'Banking Crisis',
+            'Tech Stocks', 'Earnings Reports', 'Mergers and Acquisitions', 'IPOs',
+            'Bond Market', 'Commodities', 'Forex'
+        ],
+        topics=[
+            'Investing', 'Personal Finance', 'Corporate Finance', 'Banking', 'Insurance',
+            'Real Estate', 'Taxes', 'Retirement Planning', 'Wealth Management',
+            'Financial Technology', 'Risk Management', 'Accounting', 'Venture Capital',
+            'Private Equity', 'Hedge Funds', 'Derivatives', 'Options Trading',
+            'Mutual Funds', 'ETFs', 'Debt Management', 'Credit Scores', 'Budgeting',
+            'Saving', 'Financial Literacy', 'Economic Indicators', 'Fiscal Policy',
+            'Monetary Policy', 'Financial Markets', 'Global Economy'
+        ],
+        categories={
+            'Markets': ['stock market', 'bonds', 'commodities', 'forex', 'trading'],
+            'Economy': ['gdp', 'inflation', 'employment', 'economic growth', 'recession'],
+            'Personal Finance': ['savings', 'investment', 'retirement', 'taxes', 'budgeting'],
+            'Corporate Finance': [
+                'earnings', 'mergers', 'acquisitions', 'ipo', 'corporate debt'
+            ],
+            'Banking': ['banks', 'loans', 'interest rates', 'financial services', 'credit'],
+            'Investing': ['stocks', 'mutual funds', 'etf', 'portfolio', 'risk management'],
+        },
+        default_category='General Finance',
+        highlight_categories=[
+            'Markets', 'Economy', 'Personal Finance', 'Corporate Finance', 'Banking',
+            'Investing'
+        ],
+        fallback_highlight=('chart-line', '#4CAF50', 'General'),
+        title_format='Finance [Theme]: [Specific Detail]',
+        title_example='Finance Shake-up: Tech Stocks Soar Amid Market Volatility',
+        title_focus='financial events',
+        default_title="Today's Financial Highlights",
+        summary_focus='finance',
+    ),
+    TopicConfig(
+        name='Health',
+        topic_id=7,
+        label='health',
+        queries=[
+            'health breakthrough OR medical advancement', 'COVID-19 OR pandemic OR vaccine',
+            'public health OR healthcare policy', 'medical research OR clinical trial',
+            'mental health OR wellness', 'nutrition OR exercise OR preventive care',
+            'chronic disease OR cancer OR heart disease', 'global health OR health equity'
+        ],
+        trusted_sources=[
+            'who.int', 'nih.gov', 'cdc.gov', 'mayoclinic.org', 'webmd.com',
+            'healthline.com', 'medicalnewstoday.com', 'sciencedaily.com/health',
+            'medscape.com', 'nature.com/subjects/health-sciences', 'thelancet.com',
+            'nejm.org', 'jamanetwork.com', 'bmj.com', 'health.harvard.edu',
+            'hopkinsmedicine.org', 'stanfordhealthcare.org', 'clevelandclinic.org',
+            'health.usnews.com', 'healthaffairs.org'
+        ],
+        companies=[
+            'World Health Organization', 'CDC', 'NIH', 'FDA', 'Mayo Clinic',
+            'Cleveland Clinic', 'Johns Hopkins Medicine', 'American Medical Association',
+            'American Heart Association', 'American Cancer Society', 'UNICEF',
+            'Doctors Without Borders', 'Red Cross', 'Bill & Melinda Gates Foundation',
+            'Pfizer', 'Johnson & Johnson', 'Moderna', 'Roche', 'Novartis', 'Merck'
+        ],
+        priority_topics=[
+            'COVID-19', 'Vaccine', 'Pandemic', 'Public Health', 'Healthcare Policy',
+            'Medical Research', 'Mental Health', 'Chronic Disease', 'Nutrition', 'Exercise',
+            'Preventive Care', 'Telemedicine', 'Global Health', 'Health Equity',
+            'Drug Development', 'Clinical Trials'
+        ],
+        topics=[
+            'Infectious Diseases', 'Cardiology', 'Oncology', 'Neurology', 'Pediatrics',
+            'Geriatrics', 'Immunology', 'Endocrinology', 'Gastroenterology', 'Dermatology',
+            'Orthopedics', 'Psychiatry', 'Obstetrics and Gynecology', 'Urology',
+            'Pharmacology', 'Public Health', 'Epidemiology', 'Nutrition',
+            'Exercise Science', 'Genetics', 'Genomics', 'Biotechnology',
+            'Health Informatics', 'Medical Ethics', 'Healthcare Management',
+            'Health Policy', 'Environmental Health', 'Occupational Health',
+            'Alternative Medicine', 'Personalized Medicine'
+        ],
+        categories={
+            'Medical Research': [
+                'research', 'study', 'clinical trial', 'breakthrough', 'discovery'
+            ],
+            'Public Health': [
+                'public health', 'epidemic', 'pandemic', 'vaccination', 'health policy'
+            ],
+            'Nutrition & Diet': ['nutrition', 'diet', 'food', 'eating', 'obesity'],
+            'Fitness & Exercise': ['exercise', 'fitness', 'workout', 'physical activity'],
+            'Mental Health': [
+                'mental health', 'psychology', 'psychiatry', 'depression', 'anxiety'
+            ],
+            'Chronic Diseases': [
+                'chronic disease', 'cancer', 'diabetes', 'heart disease', 'alzheimer'
+            ],
+            'Healthcare Technology': [
+                'health tech', 'medical device', 'digital health', 'telemedicine'
+            ],
+            'Global Health': ['global health', 'world health', 'international health'],
+        },
+        default_category='General Health News',
+        highlight_categories=[
+            'Research', 'Public Health', 'Nutrition', 'Fitness', 'Mental Health',
+            'Medical Breakthrough'
+        ],
+        fallback_highlight=('heartbeat', '#FF5733', 'General'),
+        title_format='Health [Theme]: [Specific Detail]',
+        title_example='Health Breakthrough: New Cancer Treatment Shows Promise',
+        title_focus='health advancements',
+        default_title="Today's Health Highlights",
+        summary_focus='health and medicine',
+    ),
+    TopicConfig(
+        name='Travel',
+        topic_id=8,
+        label='travel',
+        queries=[
+            'travel trends OR travel innovation', 'sustainable travel OR eco-tourism',
+            'digital nomad OR remote work travel', 'adventure travel OR luxury travel',
+            'budget travel OR solo travel', 'cultural tourism OR food tourism',
+            'travel technology OR travel apps', 'travel restrictions OR travel reopening'
+        ],
+        trusted_sources=[
+            'lonelyplanet.com', 'nationalgeographic.com', 'cntraveler.com',
+            'travelandleisure.com', 'afar.com', 'fodors.com', 'roughguides.com',
+            'bbc.com/travel', 'cnn.com/travel', 'forbes.com/travel',
+            'nytimes.com/section/travel', 'theguardian.com/travel', 'timeout.com',
+            'tripadvisor.com', 'skyscanner.com', 'kayak.com', 'expedia.com', 'booking.com',
+            'airbnb.com', 'hostelworld.com', 'ricksteves.com'
+        ],
+        companies=[
+            'Airbnb', 'Booking.com', 'Expedia', 'TripAdvisor', 'Lonely Planet',
+            'National Geographic', 'Conde Nast Traveler', 'Travel + Leisure', 'AFAR',
+            "Fodor's", 'Rough Guides', 'Skyscanner', 'Kayak', 'Hostelworld', 'Rick Steves',
+            'G Adventures', 'Intrepid Travel', 'Thomas Cook', 'TUI', 'Viator',
+            'GetYourGuide', 'Klook'
+        ],
+        priority_topics=[
+            'Sustainable Travel', 'Eco-Tourism', 'Digital Nomad', 'Remote Work',
+            'Adventure Travel', 'Luxury Travel', 'Budget Travel', 'Solo Travel',
+            'Family Travel', 'Cultural Tourism', 'Food Tourism', 'Wellness Travel',
+            'Off-the-beaten-path', 'Travel Technology', 'Travel Trends'
+        ],
+        topics=[
+            'Travel Destinations', 'Travel Tips', 'Travel Guides', 'Travel Itineraries',
+            'Travel Photography', 'Travel Gear', 'Travel Insurance', 'Visa Information',
+            'Airlines', 'Airports', 'Hotels', 'Resorts', 'Hostels', 'Vacation Rentals',
+            'Cruises', 'Road Trips', 'Backpacking', 'Hiking', 'Camping', 'Beach Vacations',
+            'City Breaks', 'Mountain Getaways', 'Island Escapes', 'Travel Safety',
+            'Travel Budgeting', 'Travel Rewards Programs', 'Travel Apps',
+            'Local Experiences', 'Travel Restrictions', 'Travel Reopening'
+        ],
+        categories={
+            'Destinations': [
+                'destination', 'place', 'country', 'city', 'island', 'beach', 'mountain'
+            ],
+            'Travel Tips': ['tip', 'advice', 'guide', 'how to', 'planning', 'packing'],
+            'Travel Trends': ['trend', 'popular', 'emerging', 'new', 'rising'],
+            'Sustainable Travel': ['sustainable', 'eco-friendly', 'responsible', 'green'],
+            'Travel Technology': ['app', 'gadget', 'tech', 'digital', 'smart'],
+            'Adventure Travel': ['adventure', 'extreme', 'outdoor', 'hiking', 'camping'],
+            'Cultural Tourism': ['culture', 'heritage', 'history', 'local', 'authentic'],
+            'Food Tourism': ['food', 'cuisine', 'culinary', 'gastronomy', 'restaurant'],
+        },
+        default_category='General Travel',
+        highlight_categories=[
+            'Destinations', 'Tips', 'Trends', 'Sustainability', 'Technology', 'Culture'
+        ],
+        fallback_highlight=('plane', '#3498db', 'General'),
+        title_format='Travel [Theme]: [Specific Detail]',
+        title_example='Travel Trends: Sustainable Tourism Takes Center Stage',
+        title_focus='travel trends or destinations',
+        default_title="Today's Travel Highlights",
+        summary_focus='travel',
+    ),
+    TopicConfig(
+        name='Yoga',
+        topic_id=9,
+        label='yoga',
+        queries=[
+            'Yoga practice OR Yoga techniques', 'Yoga health benefits OR Yoga therapy',
+            'Meditation OR Mindfulness', 'Yoga philosophy OR Yoga spirituality',
+            'Yoga events OR Yoga retreats', 'Yoga research OR Yoga science',
+            'Yoga teacher training OR Yoga certification', 'Yoga props OR Yoga equipment',
+            'Yoga styles OR Yoga types'
+        ],
+        trusted_sources=[
+            'yogajournal.com', 'mindbodygreen.com', 'doyouyoga.com',
+            'yogainternational.com', 'gaia.com', 'yogaalliance.org', 'kripalu.org',
+            'sivananda.org', 'iyengar.org', 'ashtanga.com', 'yogitimes.com',
+            'yogabasics.com', 'yogafit.com', 'yogatherapy.health', 'yogauonline.com',
+            'yogicwayoflife.com', 'yogaoutlet.com', 'yogabody.com', 'yogicfoods.com',
+            'yogameditation.com'
+        ],
+        companies=[
+            'Hatha Yoga', 'Vinyasa Yoga', 'Ashtanga Yoga', 'Iyengar Yoga', 'Kundalini Yoga',
+            'Bikram Yoga', 'Yin Yoga', 'Restorative Yoga', 'Power Yoga', 'Aerial Yoga',
+            'Acro Yoga', 'Yoga Nidra', 'Jivamukti Yoga', 'Anusara Yoga', 'Sivananda Yoga'
+        ],
+        priority_topics=[
+            'Yoga Practice', 'Meditation', 'Mindfulness', 'Yoga Philosophy',
+            'Yoga Teacher Training', 'Yoga Therapy', 'Yoga for Health', 'Yoga Research',
+            'Yoga Events', 'Yoga Retreats', 'Yoga Props', 'Yoga Anatomy',
+            'Yoga for Beginners', 'Advanced Yoga', 'Yoga and Spirituality'
+        ],
+        topics=[
+            'Asanas', 'Pranayama', 'Yoga History', 'Yoga Sutras', 'Chakras', 'Ayurveda',
+            'Yoga for Stress Relief', 'Yoga for Flexibility', 'Yoga for Strength',
+            'Yoga and Mental Health', 'Yoga for Kids', 'Prenatal Yoga', 'Yoga for Seniors',
+            'Yoga and Nutrition', 'Yoga Lifestyle', 'Yoga Festivals', 'Yoga Books',
+            'Yoga Clothing', 'Yoga Mats', 'Online Yoga Classes', 'Yoga Studios'
+        ],
+        categories={
+            'Yoga Practice': ['asana', 'pose', 'sequence', 'flow', 'technique'],
+            'Meditation & Mindfulness': ['meditation', 'mindfulness', 'breath', 'pranayama'],
+            'Yoga Philosophy': ['philosophy', 'sutra', 'spiritual', 'yama', 'niyama'],
+            'Health & Wellness': ['health', 'wellness', 'therapy', 'healing', 'benefits'],
+            'Yoga Lifestyle': ['lifestyle', 'diet', 'nutrition', 'ayurveda', 'eco-friendly'],
+            'Yoga Events': ['event', 'retreat', 'workshop', 'conference', 'festival'],
+            'Teacher Training': ['teacher training', 'certification', 'course', 'education'],
+            'Yoga Gear': ['mat', 'prop', 'clothing', 'equipment', 'accessory'],
+        },
+        default_category='General Yoga News',
+        highlight_categories=['Practice', 'Health', 'Philosophy', 'Events', 'Lifestyle'],
+        fallback_highlight=('om', '#333333', 'General'),
+        title_format='Yoga [Theme]: [Specific Detail]',
+        title_example='Yoga Insight: New Study Reveals Mental Health Benefits',
+        title_focus='yoga topics',
+        default_title="Today's Yoga Highlights",
+        summary_focus='yoga',
+    ),
+    TopicConfig(
+        name='Nutrition',
+        topic_id=10,
+        label='nutrition',
+        queries=[
+            'nutrition breakthrough OR nutrition advancement',
+            'superfood OR plant-based diet', 'ketogenic diet OR intermittent fasting',
+            'gut health OR probiotics', 'sustainable nutrition OR personalized nutrition',
+            'nutrition research OR nutrition study',
+            'nutrition technology OR nutrigenomics', 'healthy eating OR balanced diet'
+        ],
+        trusted_sources=[
+            'eatright.org', 'nutritionaction.com', 'nutrition.org',
+            'sciencedaily.com/nutrition', 'healthline.com/nutrition',
+            'medicalnewstoday.com/nutrition', 'nytimes.com/health', 'webmd.com/diet',
+            'mayoclinic.org/healthy-lifestyle/nutrition-and-healthy-eating',
+            'hsph.harvard.edu/nutritionsource', 'cdc.gov/nutrition',
+            'nih.gov/health-information/diet-nutrition', 'who.int/health-topics/nutrition',
+            'fda.gov/food', 'nutrition.gov', 'eufic.org', 'nutraceuticalsworld.com',
+            'foodnavigator.com', 'nutraingredients.com'
+        ],
+        companies=[
+            'Nestlé', 'Danone', 'Herbalife', 'Abbott Nutrition', 'PepsiCo', 'Unilever',
+            "Kellogg's", 'General Mills', 'Kraft Heinz', 'Conagra Brands', 'Mars',
+            'Cargill', 'ADM', 'Beyond Meat', 'Impossible Foods', 'Oatly', 'Chobani', 'Kind',
+            'Soylent', 'Halo Top', 'Vital Proteins', 'Perfect Day', 'Ripple Foods'
+        ],
+        priority_topics=[
+            'Superfood', 'Plant-based diet', 'Ketogenic diet', 'Intermittent fasting',
+            'Micronutrients', 'Gut health', 'Probiotics', 'Antioxidants', 'Omega-3',
+            'Protein supplements', 'Nutrigenomics', 'Functional foods', 'Clean eating',
+            'Sustainable nutrition', 'Personalized nutrition', 'Nutrition tech'
+        ],
+        topics=[
+            'Healthy eating', 'Balanced diet', 'Nutritional supplements',
+            'Vitamins and minerals', 'Protein sources', 'Carbohydrates', 'Healthy fats',
+            'Fiber', 'Hydration', 'Meal planning', 'Weight management', 'Sports nutrition',
+            'Pediatric nutrition', 'Geriatric nutrition', 'Vegan nutrition',
+            'Gluten-free diet', 'Food allergies', 'Organic food', 'GMO', 'Food labeling',
+            'Nutritional deficiencies', 'Malnutrition', 'Eating disorders',
+            'Nutrition education', 'Nutrition policy'
+        ],
+        categories={
+            'Nutrition Research': ['research', 'study', 'scientific', 'discovery', 'findings'],
+            'Diet Trends': ['diet', 'eating pattern', 'food trend', 'nutrition plan'],
+            'Health & Wellness': ['health', 'wellness', 'well-being', 'lifestyle', 'fitness'],
+            'Supplements & Nutraceuticals': [
+                'supplement', 'vitamin', 'mineral', 'nutraceutical'
+            ],
+            'Sustainable Nutrition': [
+                'sustainable', 'eco-friendly', 'plant-based', 'environment'
+            ],
+            'Food Technology': ['food tech', 'nutrition technology', 'innovation', 'startup'],
+            'Policy & Regulation': ['policy', 'regulation', 'guidelines', 'standards', 'law'],
+            'Nutrition Education': [
+                'education', 'awareness', 'literacy', 'teaching', 'learning'
+            ],
+        },
+        default_category='General Nutrition News',
+        highlight_categories=[
+            'Diet', 'Research', 'Health', 'Supplements', 'Technology', 'Sustainability'
+        ],
+        fallback_highlight=('utensils', '#4CAF50', 'General'),
+        title_format='Nutrition [Theme]: [Specific Detail]',
+        title_example='Nutrition Breakthrough: New Superfood Boosts Gut Health',
+        title_focus='nutrition advancements',
+        default_title="Today's Nutrition Highlights",
+        summary_focus='nutrition',
+    ),
+    TopicConfig(
+        name='Fitness',
+        topic_id=11,
+        label='fitness',
+        queries=[
+            'fitness breakthrough OR fitness advancement',
+            'HIIT workout OR weight training', 'cardio exercise OR yoga practice',
+            'functional fitness OR CrossFit', 'fitness technology OR wearable fitness',
+            'group fitness OR personal training', 'sports performance OR recovery methods',
+            'nutrition for athletes OR fitness nutrition'
+        ],
+        trusted_sources=[
+            'runnersworld.com', 'menshealth.com', 'womenshealthmag.com', 'shape.com',
+            'fitness.com', 'acefitness.org', 'bodybuilding.com', 'exercise.com',
+            'health.com/fitness', 'self.com/fitness', 'fitnessmagazine.com',
+            'livestrong.com', 'myfitnesspal.com', 'crossfit.com', 'yogajournal.com',
+            'muscleandfitness.com', 'cdc.gov/physicalactivity',
+            'mayoclinic.org/healthy-lifestyle/fitness',
+            'nih.gov/health-information/physical-activity',
+            'who.int/news-room/fact-sheets/detail/physical-activity'
+        ],
+        companies=[
+            'Nike', 'Adidas', 'Under Armour', 'Peloton', 'Fitbit', 'Garmin', 'Lululemon',
+            'Reebok', 'Asics', 'New Balance', 'Technogym', 'Life Fitness', 'Precor',
+            'MyFitnessPal', 'Strava', 'ClassPass', 'TRX', 'Bowflex', 'Mirror', 'Tonal',
+            'Orangetheory Fitness', 'CrossFit', 'SoulCycle', 'Equinox'
+        ],
+        priority_topics=[
+            'HIIT workout', 'Weight training', 'Cardio exercise', 'Yoga practice',
+            'Functional fitness', 'CrossFit', 'Bodyweight exercises', 'Pilates',
+            'Running techniques', 'Fitness technology', 'Group fitness classes',
+            'Personal training', 'Sports performance', 'Recovery methods',
+            'Nutrition for athletes'
+        ],
+        topics=[
+            'Strength training', 'Endurance training', 'Flexibility exercises',
+            'Balance training', 'Core workouts', 'Aerobic exercises', 'Anaerobic exercises',
+            'Plyometrics', 'Resistance band workouts', 'Kettlebell exercises',
+            'Calisthenics', 'Stretching routines', 'Fitness apps', 'Wearable fitness tech',
+            'Home gym equipment', 'Outdoor workouts', 'Fitness challenges', 'Workout plans',
+            'Exercise science', 'Fitness for seniors', 'Pre/post-natal fitness',
+            'Kids fitness', 'Workplace fitness', 'Mind-body exercises'
+        ],
+        categories={
+            'Workout Trends': ['workout', 'exercise', 'training', 'fitness trend'],
+            'Fitness Technology': ['fitness tech', 'wearable', 'app', 'smart device'],
+            'Nutrition for Fitness': ['nutrition', 'diet', 'supplement', 'meal plan'],
+            'Health & Wellness': ['health', 'wellness', 'well-being', 'lifestyle'],
+            'Equipment & Gear': ['equipment', 'gear', 'accessory', 'fitness product'],
+            'Fitness Research': ['research', 'study', 'scientific', 'findings'],
+            'Personal Training': ['personal trainer', 'coaching', 'instruction'],
+            'Fitness Events': ['competition', 'challenge', 'race', 'tournament'],
+        },
+        default_category='General Fitness News',
+        highlight_categories=[
+            'Workout', 'Equipment', 'Nutrition', 'Technology', 'Health', 'Trends'
+        ],
+        fallback_highlight=('dumbbell', '#4CAF50', 'General'),
+        title_format='Fitness [Theme]: [Specific Detail]',
+        title_example='Fitness Revolution: AI-Powered Workouts Boost Performance',
+        title_focus='fitness advancements',
+        default_title="Today's Fitness Highlights",
+        summary_focus='fitness',
+    ),
+    TopicConfig(
+        name='Mental Health',
+        topic_id=12,
+        label='mental health',
+        queries=[
+            'Mental health breakthrough OR Mental health advancement',
+            'Depression OR Anxiety OR PTSD',
+            'Mental health research OR Mental health study',
+            'Psychotherapy OR Cognitive Behavioral Therapy',
+            'Mental health policy OR Mental health initiative',
+            'Mindfulness OR Stress management',
+            'Suicide prevention OR Mental health crisis',
+            'Child mental health OR Adolescent mental health'
+        ],
+        trusted_sources=[
+            'psychologytoday.com', 'nimh.nih.gov', 'who.int', 'psychiatry.org', 'nami.org',
+            'mentalhealthamerica.net', 'mayoclinic.org', 'apa.org', 'mind.org.uk',
+            'mentalhealth.gov', 'samhsa.gov', 'healthline.com',
+            'sciencedaily.com/health/mental_health', 'medscape.com/psychiatry',
+            'verywellmind.com', 'psychiatrictimes.com', 'ncbi.nlm.nih.gov/pmc'
+        ],
+        companies=[
+            'World Health Organization', 'National Institute of Mental Health',
+            'American Psychiatric Association', 'National Alliance on Mental Illness',
+            'Mental Health America', 'Anxiety and Depression Association of America',
+            'American Psychological Association', 'Mind',
+            'Substance Abuse and Mental Health Services Administration',
+            'Mental Health Foundation', 'International Association for Suicide Prevention',
+            'Brain & Behavior Research Foundation', 'National Eating Disorders Association',
+            'Schizophrenia and Related Disorders Alliance of America'
+        ],
+        priority_topics=[
+            'Mental Health', 'Depression', 'Anxiety', 'PTSD', 'Schizophrenia',
+            'Bipolar Disorder', 'Eating Disorders', 'Addiction', 'Therapy', 'Psychiatry',
+            'Psychology', 'Mental Wellness', 'Mindfulness', 'Stress Management',
+            'Emotional Health', 'Cognitive Behavioral Therapy', 'Mental Health Policy',
+            'Suicide Prevention', 'Mental Health Research'
+        ],
+        topics=[
+            'Mental Health Awareness', 'Depression Treatment', 'Anxiety Management',
+            'PTSD Recovery', 'Schizophrenia Research', 'Bipolar Disorder Management',
+            'Eating Disorder Recovery', 'Addiction Treatment', 'Psychotherapy Techniques',
+            'Psychiatric Medications', 'Child Mental Health', 'Adolescent Mental Health',
+            'Geriatric Mental Health', 'Workplace Mental Health', 'Digital Mental Health',
+            'Mental Health Stigma', 'Trauma-Informed Care', 'Mindfulness Practices',
+            'Stress Reduction Techniques', 'Self-Care for Mental Health',
+            'Mental Health in Education', 'Community Mental Health', 'Global Mental Health',
+            'Mental Health and Technology', 'Mental Health First Aid'
+        ],
+        categories={
+            'Mental Health Research': [
+                'research', 'study', 'finding', 'discovery', 'breakthrough'
+            ],
+            'Treatment & Therapy': [
+                'treatment', 'therapy', 'medication', 'intervention', 'counseling'
+            ],
+            'Mental Health Awareness': [
+                'awareness', 'campaign', 'education', 'stigma', 'understanding'
+            ],
+            'Policy & Advocacy': [
+                'policy', 'legislation', 'advocacy', 'rights', 'access to care'
+            ],
+            'Wellness & Prevention': [
+                'wellness', 'prevention', 'self-care', 'coping', 'resilience'
+            ],
+            'Mental Health Technology': [
+                'app', 'digital', 'online therapy', 'telepsychiatry', 'AI in mental health'
+            ],
+            'Child & Adolescent Mental Health': [
+                'child', 'adolescent', 'youth', 'school', 'pediatric'
+            ],
+            'Workplace Mental Health': [
+                'workplace', 'employee', 'burnout', 'work-life balance',
+                'occupational stress'
+            ],
+            'Community Mental Health': [
+                'community', 'social support', 'outreach', 'local initiatives'
+            ],
+        },
+        default_category='General Mental Health',
+        highlight_categories=[
+            'Research', 'Treatment', 'Awareness', 'Policy', 'Wellness', 'Innovation'
+        ],
+        fallback_highlight=('brain', '#4B0082', 'General'),
+        title_format='Mental Health [Theme]: [Specific Detail]',
+        title_example='Mental Health Breakthrough: New Therapy Shows Promise for Depression',
+        title_focus='mental health advancements',
+        default_title="Today's Mental Health Highlights",
+        summary_focus='mental health',
+    ),
+    TopicConfig(
+        name='Meditation',
+        topic_id=13,
+        label='meditation',
+        queries=[
+            'meditation OR mindfulness', 'meditation techniques OR meditation practices',
+            'meditation research OR mindfulness studies',
+            'meditation for stress OR meditation for anxiety',
+            'guided meditation OR meditation apps',
+            'mindfulness-based stress reduction OR MBSR',
+            'meditation retreat OR mindfulness retreat',
+            'meditation and brain health OR meditation benefits'
+        ],
+        trusted_sources=[
+            'mindful.org', 'psychologytoday.com', 'healthline.com', 'verywellmind.com',
+            'yogajournal.com', 'tricycle.org', 'buddhistdoor.net', 'lionsroar.com',
+            'meditationfinder.com', 'insighttimer.com', 'headspace.com/blog',
+            'calm.com/blog', 'themindfulnessapp.com', 'mentalhealthamerica.net', 'nami.org',
+            'scienceofmeditation.org', 'meditationresearchinstitute.org'
+        ],
+        companies=[
+            'Mindfulness', 'Meditation Techniques', 'Guided Meditation',
+            'Breathing Exercises', 'Stress Reduction', 'Relaxation', 'Meditation Research',
+            'Mindfulness-Based Stress Reduction (MBSR)', 'Transcendental Meditation',
+            'Vipassana Meditation', 'Zen Meditation', 'Loving-Kindness Meditation',
+            'Body Scan Meditation', 'Yoga and Meditation', 'Meditation for Anxiety',
+            'Meditation for Depression', 'Meditation for Sleep', 'Workplace Meditation',
+            'Meditation Apps', 'Meditation Retreats', 'Mindful Eating', 'Mindful Movement',
+            'Meditation and Brain Health', 'Meditation and Emotional Intelligence',
+            'Meditation for Children'
+        ],
+        priority_topics=[],
+        topics=[],
+        categories={
+            'Meditation Techniques': [
+                'technique', 'practice', 'method', 'exercise', 'guided meditation'
+            ],
+            'Mindfulness Research': [
+                'research', 'study', 'science', 'neuroscience', 'psychology'
+            ],
+            'Stress & Anxiety Relief': ['stress', 'anxiety', 'relief', 'relaxation', 'calm'],
+            'Meditation Apps & Tech': ['app', 'technology', 'digital', 'online', 'virtual'],
+            'Mindful Living': [
+                'lifestyle', 'daily practice', 'mindful eating', 'mindful movement'
+            ],
+            'Meditation Retreats': ['retreat', 'workshop', 'course', 'training', 'seminar'],
+            'Workplace Mindfulness': ['work', 'office', 'corporate', 'productivity', 'focus'],
+            'Meditation for Health': ['health', 'wellness', 'healing', 'therapy', 'treatment'],
+        },
+        default_category='General Meditation News',
+        highlight_categories=['Techniques', 'Research', 'Wellness', 'Technology', 'Lifestyle'],
+        fallback_highlight=('om', '#7CB9E8', 'General'),
+        title_format='Meditation [Theme]: [Specific Detail]',
+        title_example='Meditation Breakthrough: New Technique Reduces Stress in Minutes',
+        title_focus='meditation topics',
+        default_title="Today's Meditation Highlights",
+        summary_focus='meditation',
+    ),
+    TopicConfig(
+        name='Sleep Science',
+        topic_id=14,
+        label='sleep science',
+        queries=[
+            'sleep science OR sleep research', 'sleep disorders OR insomnia OR sleep apnea',
+            'sleep technology OR sleep tracking', 'circadian rhythm OR melatonin',
+            'REM sleep OR deep sleep', 'sleep hygiene OR sleep habits',
+            'sleep medicine OR sleep therapy', 'sleep and health OR sleep and performance'
+        ],
+        trusted_sources=[
+            'sleepfoundation.org', 'sleepreviewmag.com', 'sleepresearchsociety.org',
+            'sleepjunkies.com', 'aasm.org', 'sleephealth.org', 'sleepapnea.org', 'tuck.com',
+            'healthline.com/health/sleep',
+            'mayoclinic.org/healthy-lifestyle/adult-health/in-depth/sleep',
+            'sciencedaily.com/news/mind_brain/sleep', 'psychologytoday.com/us/basics/sleep',
+            'medicalnewstoday.com/categories/sleep', 'nature.com/subjects/sleep',
+            'scientificamerican.com/sleep', 'webmd.com/sleep-disorders'
+        ],
+        companies=[
+            'Philips', 'ResMed', 'Tempur Sealy', 'Sleep Number', 'Casper', 'Purple',
+            'Eight Sleep', 'Oura', 'Whoop', 'Fitbit', 'Garmin', 'Dreem', 'Beddr',
+            'SleepScore Labs', 'Withings'
+        ],
+        priority_topics=[
+            'Sleep disorders', 'Insomnia', 'Sleep apnea', 'Circadian rhythm', 'REM sleep',
+            'Deep sleep', 'Sleep hygiene', 'Sleep technology',
+            'Cognitive behavioral therapy for insomnia', 'Melatonin', 'Sleep deprivation',
+            'Sleep quality', 'Chronotype', 'Sleep tracking', 'Sleep medicine',
+            'Polysomnography', 'Sleep paralysis', 'Narcolepsy'
+        ],
+        topics=[
+            'Sleep Science', 'Sleep Research', 'Sleep Disorders', 'Sleep Health',
+            'Sleep Technology', 'Insomnia', 'Sleep Apnea', 'Circadian Rhythms', 'REM Sleep',
+            'Deep Sleep', 'Sleep Hygiene', 'Sleep Medicine', 'Sleep Tracking',
+            'Sleep Quality', 'Sleep Deprivation', 'Sleep Paralysis', 'Narcolepsy',
+            'Sleep Environment', 'Sleep Habits', 'Chronotypes', 'Sleep and Mental Health',
+            'Sleep and Physical Health', 'Sleep Education', 'Sleep in Children',
+            'Sleep in Adolescents', 'Sleep in Older Adults', 'Sleep and Performance',
+            'Sleep and Productivity', 'Sleep and Diet', 'Sleep and Exercise',
+            'Sleep Medication', 'Natural Sleep Aids'
+        ],
+        categories={
+            'Sleep Research': ['research', 'study', 'discovery', 'findings', 'investigation'],
+            'Sleep Disorders': ['insomnia', 'apnea', 'narcolepsy', 'disorder', 'condition'],
+            'Sleep Technology': ['device', 'app', 'tracker', 'monitoring', 'wearable'],
+            'Sleep Health': ['health', 'wellness', 'lifestyle', 'habits', 'hygiene'],
+            'Circadian Rhythms': [
+                'circadian', 'biological clock', 'melatonin', 'light exposure'
+            ],
+            'Sleep Medicine': ['treatment', 'therapy', 'medication', 'intervention'],
+            'Sleep and Performance': [
+                'productivity', 'cognitive', 'memory', 'learning', 'athletics'
+            ],
+            'Sleep Environment': ['bedroom', 'mattress', 'pillow', 'noise', 'temperature'],
+        },
+        default_category='General Sleep News',
+        highlight_categories=['Research', 'Health', 'Technology', 'Disorders', 'Lifestyle'],
+        fallback_highlight=('moon', '#333333', 'General'),
+        title_format='Sleep Science [Theme]: [Specific Detail]',
+        title_example='Sleep Science Breakthrough: New Treatment for Chronic Insomnia',
+        title_focus='sleep science advancements',
+        default_title="Today's Sleep Science Highlights",
+        summary_focus='sleep science',
+    ),
+    TopicConfig(
+        name='Entertainment',
+        topic_id=15,
+        label='entertainment',
+        queries=[
+            'entertainment news OR showbiz', 'movie release OR TV premiere',
+            'music album OR concert tour', 'celebrity gossip OR award show',
+            'streaming service OR binge-worthy', 'video game release OR esports',
+            'box office results OR ratings', 'entertainment industry OR Hollywood'
+        ],
+        trusted_sources=[
+            'variety.com', 'hollywoodreporter.com', 'deadline.com', 'ew.com',
+            'billboard.com', 'rollingstone.com', 'imdb.com', 'rottentomatoes.com',
+            'metacritic.com', 'avclub.com', 'indiewire.com', 'vulture.com', 'pitchfork.com',
+            'thewrap.com', 'collider.com', 'cinemablend.com', 'screenrant.com',
+            'empireonline.com', 'nme.com', 'consequence.net'
+        ],
+        companies=[
+            'Disney', 'Warner Bros', 'Universal Pictures', 'Sony Pictures', 'Paramount',
+            'Netflix', 'Amazon Studios', 'Apple TV+', 'HBO', 'Hulu', 'NBC', 'CBS', 'ABC',
+            'Fox', 'Spotify', 'Live Nation', 'AEG', 'EA', 'Activision Blizzard', 'Ubisoft',
+            'Nintendo'
+        ],
+        priority_topics=[
+            'Blockbuster Movie', 'TV Series Premiere', 'Music Album Release',
+            'Celebrity News', 'Award Show', 'Streaming Platform', 'Box Office',
+            'Video Game Launch', 'Concert Tour', 'Entertainment Technology'
+        ],
+        topics=[
+            'Movies', 'Television', 'Music', 'Celebrity', 'Streaming', 'Video Games',
+            'Theater', 'Books', 'Comics', 'Animation', 'Film Festivals', 'Award Shows',
+            'Box Office', 'Streaming Wars', 'Virtual Reality Entertainment', 'Live Events',
+            'Entertainment Tech', 'Podcasts', 'Viral Content', 'Social Media Stars'
+        ],
+        categories={
+            'Movies': ['movie', 'film', 'cinema', 'box office', 'Hollywood'],
+            'Television': ['TV', 'television', 'series', 'show', 'streaming'],
+            'Music': ['music', 'album', 'song', 'concert', 'artist'],
+            'Celebrity': ['celebrity', 'star', 'famous', 'gossip', 'red carpet'],
+            'Gaming': ['game', 'gaming', 'esports', 'console', 'player'],
+            'Streaming': ['Netflix', 'Disney+', 'Hulu', 'Amazon Prime', 'streaming service'],
+        },
+        default_category='General Entertainment',
+        highlight_categories=['Movies', 'TV', 'Music', 'Celebrity', 'Gaming', 'Streaming'],
+        fallback_highlight=('film', '#FF69B4', 'General'),
+        title_format='[Theme]: [Specific Detail]',
+        title_example='Hollywood Shakeup: Major Studio Merger Rocks Entertainment Industry',
+        title_focus='entertainment news',
+        default_title="Today's Entertainment Highlights",
+        summary_focus='entertainment',
+    ),
+    TopicConfig(
+        name='Sports',
+        topic_id=16,
+        label='sports',
+        queries=[
+            'sports news OR sports update', 'championship OR tournament OR league',
+            'athlete OR player OR team', 'sports technology OR sports innovation',
+            'sports business OR sports sponsorship', 'sports health OR sports medicine',
+            'sports controversy OR sports scandal', 'Olympic OR World Cup OR Super Bowl'
+        ],
+        trusted_sources=[
+            'espn.com', 'sports.yahoo.com', 'cbssports.com', 'nbcsports.com',
+            'foxsports.com', 'bleacherreport.com', 'theathletic.com', 'si.com',
+            'skysports.com', 'bbc.com/sport', 'eurosport.com', 'goal.com', 'nfl.com',
+            'nba.com', 'mlb.com', 'nhl.com', 'fifa.com', 'uefa.com', 'olympic.org',
+            'tennis.com', 'golf.com', 'rugby.com'
+        ],
+        companies=[
+            'NFL', 'NBA', 'MLB', 'NHL', 'FIFA', 'UEFA', 'IOC', 'NCAA', 'Premier League',
+            'La Liga', 'Bundesliga', 'Serie A', 'Ligue 1', 'ATP', 'WTA', 'PGA Tour', 'F1',
+            'NASCAR', 'UFC', 'WWE'
+        ],
+        priority_topics=[
+            'Championship', 'World Cup', 'Olympics', 'Super Bowl', 'Finals', 'Grand Slam',
+            'Transfer', 'Injury', 'Record', 'Scandal', 'Comeback', 'Upset', 'Rookie',
+            'Retirement', 'Contract', 'Draft', 'Trade'
+        ],
+        topics=[
+            'Football', 'Basketball', 'Baseball', 'Soccer', 'Tennis', 'Golf', 'Hockey',
+            'Rugby', 'Cricket', 'Boxing', 'MMA', 'Athletics', 'Swimming', 'Cycling',
+            'Volleyball', 'Gymnastics', 'Skiing', 'Snowboarding', 'Skateboarding',
+            'Surfing', 'Esports'
+        ],
+        categories={
+            'Football': ['football', 'NFL', 'NCAA', 'quarterback', 'touchdown'],
+            'Basketball': ['basketball', 'NBA', 'NCAA', 'slam dunk', 'three-pointer'],
+            'Baseball': ['baseball', 'MLB', 'home run', 'pitcher', 'inning'],
+            'Soccer': ['soccer', 'football', 'FIFA', 'UEFA', 'goal', 'striker'],
+            'Tennis': ['tennis', 'ATP', 'WTA', 'Grand Slam', 'serve', 'ace'],
+            'Golf': ['golf', 'PGA', 'LPGA', 'birdie', 'eagle', 'putt'],
+            'Olympics': ['Olympics', 'Olympic Games', 'medal', 'athlete'],
+            'Motorsports': ['F1', 'NASCAR', 'racing', 'driver', 'Grand Prix'],
+            'Combat Sports': ['boxing', 'MMA', 'UFC', 'knockout', 'bout'],
+            'Winter Sports': ['skiing', 'snowboarding', 'ice hockey', 'figure skating'],
+        },
+        default_category='General Sports',
+        highlight_categories=[
+            'Football', 'Basketball', 'Baseball', 'Soccer', 'Tennis', 'Golf', 'Other'
+        ],
+        fallback_highlight=('futbol', '#333333', 'Other'),
+        title_format='Sports [Theme]: [Specific Detail]',
+        title_example='Sports Upset: Underdog Team Clinches Championship',
+        title_focus='sports events or developments',
+        default_title="Today's Sports Highlights",
+        summary_focus='sports',
+    ),
+    TopicConfig(
+        name='Games',
+        topic_id=17,
+        label='gaming',
+        queries=[
+            'video game release OR gaming news', 'esports OR competitive gaming',
+            'game development OR game design', 'gaming industry OR game sales',
+            'console gaming OR PC gaming OR mobile gaming',
+            'virtual reality gaming OR augmented reality gaming',
+            'indie games OR indie developers', 'gaming events OR gaming expo'
+        ],
+        trusted_sources=[
+            'ign.com', 'gamespot.com', 'polygon.com', 'kotaku.com', 'eurogamer.net',
+            'pcgamer.com', 'gamasutra.com', 'rockpapershotgun.com', 'vg247.com',
+            'gamesradar.com', 'gamesindustry.biz', 'pocketgamer.biz', 'nintendolife.com',
+            'pushsquare.com', 'gameinformer.com', 'destructoid.com', 'dualshockers.com',
+            'shacknews.com', 'siliconera.com', 'escapistmagazine.com'
+        ],
+        companies=[
+            'Nintendo', 'Sony', 'Microsoft', 'Electronic Arts', 'Ubisoft',
+            'Activision Blizzard', 'Take-Two Interactive', 'Epic Games', 'Valve',
+            'CD Projekt', 'Square Enix', 'Capcom', 'Sega', 'Bandai Namco', 'Konami',
+            'Bethesda', 'Rockstar Games', 'FromSoftware', 'Naughty Dog', 'BioWare',
+            'Insomniac Games', 'Riot Games', 'Blizzard Entertainment'
+        ],
+        priority_topics=[
+            'AAA Game', 'Indie Game', 'Console', 'PC Gaming', 'Mobile Gaming', 'E-Sports',
+            'Game Development', 'Game Engine', 'Virtual Reality', 'Augmented Reality',
+            'Cloud Gaming', 'Game Streaming', 'Multiplayer', 'Single-player', 'RPG', 'FPS',
+            'MMORPG', 'Strategy Game', 'Simulation Game'
+        ],
+        topics=[
+            'Video Games', 'Gaming Industry', 'Game Design', 'Game Development',
+            'Console Gaming', 'PC Gaming', 'Mobile Gaming', 'E-Sports', 'Game Reviews',
+            'Game Releases', 'Gaming Community', 'Game Mods', 'Gaming Hardware',
+            'Game Engines', 'Virtual Reality Gaming', 'Augmented Reality Gaming',
+            'Cloud Gaming', 'Game Streaming', 'Multiplayer Games', 'Single-player Games',
+            'RPG Games', 'FPS Games', 'MMORPG', 'Strategy Games', 'Simulation Games',
+            'Indie Games', 'Game Monetization', 'Gaming Trends', 'Game Accessibility',
+            'Game Localization', 'Gaming Events', 'Game Soundtracks'
+        ],
+        categories={
+            'Console Gaming': ['playstation', 'xbox', 'nintendo', 'console'],
+            'PC Gaming': ['pc gaming', 'steam', 'epic games store'],
+            'Mobile Gaming': ['mobile game', 'ios game', 'android game'],
+            'E-Sports': ['esports', 'competitive gaming', 'tournament'],
+            'Game Development': ['game engine', 'developer', 'game design'],
+            'Gaming Industry': ['sales', 'revenue', 'market', 'acquisition'],
+            'Game Reviews': ['review', 'rating', 'score'],
+            'Gaming Hardware': ['gpu', 'cpu', 'gaming pc', 'gaming laptop'],
+            'Virtual Reality': ['vr', 'virtual reality', 'oculus', 'htc vive'],
+            'Cloud Gaming': ['cloud gaming', 'game streaming', 'stadia', 'xcloud'],
+        },
+        default_category='General Gaming News',
+        highlight_categories=['Console', 'PC', 'Mobile', 'E-Sports', 'Industry', 'Innovation'],
+        fallback_highlight=('gamepad', '#333333', 'General'),
+        title_format='Gaming [Theme]: [Specific Detail]',
+        title_example='Gaming Revolution: Next-Gen Console Pushes Boundaries',
+        title_focus='gaming advancements',
+        default_title="Today's Gaming Highlights",
+        summary_focus='gaming',
+    ),
+    TopicConfig(
+        name='Social Media & Viral News',
+        topic_id=18,
+        label='social media',
+        queries=[
+            'viral social media content OR social media trend',
+            'social media platform update OR new feature',
+            'influencer marketing OR brand collaboration',
+            'social media advertising OR digital marketing strategy',
+            'social commerce OR social shopping',
+            'content moderation OR user privacy on social media',
+            'social media algorithm change OR engagement strategy',
+            'social media analytics OR performance metrics'
+        ],
+        trusted_sources=[
+            'techcrunch.com', 'mashable.com', 'theverge.com', 'socialmediatoday.com',
+            'socialmediaexaminer.com', 'sproutsocial.com', 'buffer.com/resources',
+            'hootsuite.com/blog', 'later.com/blog', 'buzzfeed.com', 'digiday.com',
+            'thedrum.com', 'adweek.com', 'convinceandconvert.com', 'neilpatel.com',
+            'jonloomer.com', 'socialmediaweek.org',
+            'searchenginejournal.com/category/social-media-marketing'
+        ],
+        companies=[
+            'Facebook', 'Instagram', 'Twitter', 'TikTok', 'LinkedIn', 'YouTube',
+            'Pinterest', 'Snapchat', 'Reddit', 'WhatsApp', 'Telegram', 'Discord', 'Twitch',
+            'Clubhouse', 'BeReal', 'Mastodon', 'Threads'
+        ],
+        priority_topics=[
+            'Viral content', 'Social media trend', 'Influencer marketing',
+            'Platform update', 'Social commerce', 'User privacy', 'Content moderation',
+            'Social media algorithm', 'Digital marketing', 'Social media analytics',
+            'Community management', 'Social listening'
+        ],
+        topics=[
+            'Social Media Marketing', 'Content Strategy', 'Influencer Collaborations',
+            'Social Media Advertising', 'Community Engagement', 'Brand Awareness',
+            'Social Media Analytics', 'User-Generated Content', 'Social Commerce',
+            'Social Media Trends', 'Platform Updates', 'Viral Campaigns',
+            'Social Media Policy', 'Crisis Management', 'Social Listening',
+            'Personal Branding', 'Social Media ROI', 'Social Media Automation',
+            'Social Media Privacy', 'Content Moderation', 'Social Media Algorithms'
+        ],
+        categories={
+            'Platform Updates': ['update', 'new feature', 'launch', 'redesign'],
+            'Viral Trends': ['viral', 'trend', 'challenge', 'meme'],
+            'Influencer Marketing': ['influencer', 'collaboration', 'sponsored', 'partnership'],
+            'Social Media Strategy': ['strategy', 'engagement', 'growth', 'optimization'],
+            'Privacy & Security': ['privacy', 'security', 'data protection', 'policy change'],
+            'Social Commerce': ['e-commerce', 'shopping', 'marketplace', 'product tag'],
+            'Content Creation': ['content', 'creation', 'video', 'reels', 'stories'],
+            'Social Media Analytics': ['analytics', 'metrics', 'performance', 'insights'],
+        },
+        default_category='General Social Media News',
+        highlight_categories=[
+            'Trend', 'Platform Update', 'Marketing', 'Privacy', 'Viral Content', 'Strategy'
+        ],
+        fallback_highlight=('hashtag', '#1DA1F2', 'Trend'),
+        title_format='Social Media [Theme]: [Specific Detail]',
+        title_example='Social Media Trend: New Platform Feature Goes Viral',
+        title_focus='social media trends or viral content',
+        default_title="Today's Social Media & Viral News Highlights",
+        summary_focus='social media and viral content',
+    ),
+    TopicConfig(
+        name='Education',
+        topic_id=19,
+        label='education',
+        queries=[
+            'Education innovation OR Education advancement',
+            'EdTech OR Education technology', 'Online learning OR Digital education',
+            'STEM education OR STEAM education', 'Education policy OR Education reform',
+            'Higher education OR University research',
+            'K-12 education OR School innovation',
+            'Teacher training OR Educational leadership'
+        ],
+        trusted_sources=[
+            'edutopia.org', 'chronicle.com', 'insidehighered.com', 'edsurge.com',
+            'educationnext.org', 'teachthought.com', 'edweek.org', 'eschoolnews.com',
+            'timeshighereducation.com', 'educationdive.com',
+            'theconversation.com/education', 'educationweek.org', 'edtechnology.co.uk',
+            'elearningindustry.com', 'edtechmagazine.com', 'theeducationist.info',
+            'educatorstechnology.com', 'educationworld.com', 'campustechnology.com',
+            'teachermagazine.com', 'educationcorner.com', 'facultyfocus.com',
+            'edutopia.org'
+        ],
+        companies=[
+            'Harvard University', 'MIT', 'Stanford University', 'Oxford University',
+            'Cambridge University', 'Yale University', 'Princeton University',
+            'California Institute of Technology', 'University of Chicago',
+            'Imperial College London', 'ETH Zurich', 'National University of Singapore',
+            'UCL', 'University of Pennsylvania', 'Tsinghua University',
+            'University of California, Berkeley', 'Columbia University',
+            'University of Toronto', 'Cornell University', 'Duke University'
+        ],
+        priority_topics=[
+            'EdTech', 'Online Learning', 'STEM Education', 'Digital Literacy',
+            'Personalized Learning', 'Artificial Intelligence in Education',
+            'Blended Learning', 'Gamification', 'Virtual Reality in Education',
+            'Adaptive Learning', 'Education Policy', 'Inclusive Education',
+            'Early Childhood Education', 'Higher Education', 'K-12 Education',
+            'Teacher Training', 'Remote Learning', 'Education Equity',
+            'Curriculum Innovation', 'Student Assessment'
+        ],
+        topics=[
+            'Education Technology', 'E-learning', 'Distance Education', 'Special Education',
+            'Montessori Education', 'Waldorf Education', 'International Baccalaureate',
+            'Gifted Education', 'Adult Education', 'Vocational Education', 'MOOC',
+            'Flipped Classroom', 'Project-Based Learning', 'Competency-Based Education',
+            'Social-Emotional Learning', 'STEM/STEAM', 'Literacy Education',
+            'Bilingual Education', 'Homeschooling', 'Education Reform',
+            'Educational Psychology', 'Educational Leadership', 'Education Funding',
+            'Student Engagement', 'Teacher Burnout', 'Education Research',
+            'Education Statistics', 'Global Education', 'Environmental Education',
+            'Arts Education', 'Physical Education', 'Health Education', 'Civic Education',
+            'Financial Literacy Education'
+        ],
+        categories={
+            'EdTech & Innovation': [
+                'technology', 'innovation', 'digital', 'online learning', 'AI',
+                'virtual reality'
+            ],
+            'Education Policy': ['policy', 'legislation', 'reform', 'standards', 'funding'],
+            'Teaching Methods': [
+                'pedagogy', 'teaching methods', 'curriculum', 'assessment',
+                'learning strategies'
+            ],
+            'Higher Education': [
+                'university', 'college', 'higher education', 'research', 'academia'
+            ],
+            'K-12 Education': [
+                'K-12', 'school', 'elementary', 'secondary', 'primary education'
+            ],
+            'Special Education': [
+                'special needs', 'inclusive education', 'learning disabilities',
+                'gifted education'
+            ],
+            'Global Education': [
+                'international', 'global', 'cross-cultural', 'education abroad'
+            ],
+            'Education Equity': [
+                'equity', 'access', 'diversity', 'inclusion', 'social justice'
+            ],
+            'Teacher Development': [
+                'teacher training', 'professional development', 'educator resources'
+            ],
+            'Student Wellbeing': [
+                'mental health', 'wellbeing', 'social-emotional learning',
+                'student support'
+            ],
+        },
+        default_category='General Education News',
+        highlight_categories=[
+            'EdTech', 'Policy', 'Innovation', 'Research', 'Higher Ed', 'K-12',
+            'Global Education'
+        ],
+        fallback_highlight=('book', '#333333', 'General'),
+        title_format='Education [Theme]: [Specific Detail]',
+        title_example='Education Innovation: AI-Powered Personalized Learning Gains Traction',
+        title_focus='education advancements',
+        default_title="Today's Education Highlights",
+        summary_focus='education',
+    ),
+    TopicConfig(
+        name='Space',
+        topic_id=20,
+        label='space',
+        queries=[
+            'Space exploration OR space discovery', 'Mars mission OR Moon landing',
+            'Exoplanet OR space telescope', 'Rocket launch OR spacecraft',
+            'Space station OR space habitat', 'Asteroid OR comet OR solar system',
+            'Space technology OR space innovation', 'NASA OR ESA OR SpaceX OR Blue Origin'
+        ],
+        trusted_sources=[
+            'nasa.gov', 'esa.int', 'space.com', 'spaceflightnow.com', 'universetoday.com',
+            'planetary.org', 'spacenews.com', 'astronomy.com', 'skyandtelescope.org',
+            'nasaspaceflight.com', 'blueorigin.com', 'spacex.com', 'rocketlabusa.com',
+            'arstechnica.com/science', 'sciencemag.org/space',
+            'nature.com/subjects/astronomy-and-astrophysics'
+        ],
+        companies=[
+            'NASA', 'ESA', 'SpaceX', 'Blue Origin', 'Rocket Lab', 'Virgin Galactic',
+            'Boeing', 'Lockheed Martin', 'Northrop Grumman', 'ULA', 'Arianespace', 'ISRO',
+            'JAXA', 'Roscosmos', 'CNSA', 'Maxar', 'Planet Labs', 'Firefly Aerospace',
+            'Relativity Space', 'Axiom Space', 'Sierra Nevada Corporation'
+        ],
+        priority_topics=[
+            'Mars exploration', 'Moon missions', 'Exoplanets', 'Space telescope',
+            'Asteroid mining', 'Space tourism', 'Satellite constellation', 'Space station',
+            'Rocket launch', 'Space debris', 'Solar system exploration', 'Black hole',
+            'Cosmic microwave background', 'Dark matter', 'Dark energy'
+        ],
+        topics=[
+            'Astronomy', 'Astrophysics', 'Cosmology', 'Planetary science',
+            'Space exploration', 'Space technology', 'Astrobiology', 'Space policy',
+            'Space weather', 'Space medicine', 'Space manufacturing',
+            'Space communications', 'Space debris mitigation', 'Space law',
+            'Satellite technology', 'Propulsion systems', 'Space habitats',
+            'Space resources', 'Extraterrestrial life', 'Space archaeology'
+        ],
+        categories={
+            'Space Exploration': ['exploration', 'mission', 'spacecraft', 'probe', 'rover'],
+            'Astronomy': ['star', 'galaxy', 'planet', 'comet', 'asteroid', 'telescope'],
+            'Space Technology': [
+                'rocket', 'satellite', 'propulsion', 'spacecraft', 'space station'
+            ],
+            'Space Policy': [
+                'policy', 'regulation', 'treaty', 'space law', 'commercialization'
+            ],
+            'Space Science': ['research', 'study', 'discovery', 'experiment', 'observation'],
+            'Space Industry': [
+                'company', 'startup', 'investment', 'commercial', 'launch provider'
+            ],
+        },
+        default_category='General Space News',
+        highlight_categories=['Exploration', 'Technology', 'Discovery', 'Policy', 'Innovation'],
+        fallback_highlight=('rocket', '#0B3D91', 'Exploration'),
+        title_format='Space [Theme]: [Specific Detail]',
+        title_example='Space Discovery: New Exoplanet With Earth-like Atmosphere Found',
+        title_focus='space advancements',
+        default_title="Today's Space Highlights",
+        summary_focus='space exploration and astronomy',
+    ),
+    TopicConfig(
+        name='Psychology',
+        topic_id=21,
+        label='psychology',
+        queries=[
+            'psychology research OR psychological study',
+            'mental health OR therapy OR counseling',
+            'cognitive psychology OR behavioral psychology', 'neuroscience OR brain study',
+            'social psychology OR personality psychology',
+            'child psychology OR developmental psychology',
+            'clinical psychology OR psychotherapy', 'positive psychology OR mindfulness',
+            'psychology application OR psychology in daily life'
+        ],
+        trusted_sources=[
+            'psychologytoday.com', 'apa.org', 'scientificamerican.com/mind',
+            'psychcentral.com', 'verywellmind.com', 'psychologicalscience.org',
+            'sciencedaily.com/news/mind_brain', 'nami.org',
+            'nature.com/subjects/psychology', 'psychiatry.org', 'mentalhealth.gov',
+            'who.int/health-topics/mental-health', 'nimh.nih.gov', 'psypost.org',
+            'medscape.com/psychiatry', 'neurosciencenews.com', 'psychiatrictimes.com',
+            'ncbi.nlm.nih.gov/pmc', 'frontiersin.org/journals/psychology',
+            'tandfonline.com/toc/rpsy20/current'
+        ],
+        companies=[
+            'Cognitive Psychology', 'Behavioral Psychology', 'Clinical Psychology',
+            'Developmental Psychology', 'Social Psychology', 'Neuropsychology',
+            'Positive Psychology', 'Abnormal Psychology', 'Forensic Psychology',
+            'Health Psychology', 'Educational Psychology',
+            'Industrial-Organizational Psychology', 'Evolutionary Psychology',
+            'Personality Psychology', 'Biopsychology', 'Psychotherapy', 'Mental Health',
+            'Psychological Disorders', 'Emotional Intelligence', 'Mindfulness',
+            'Stress Management', 'Addiction Psychology', 'Child Psychology',
+            'Geropsychology', 'Sports Psychology', 'Cultural Psychology',
+            'Environmental Psychology'
+        ],
+        priority_topics=[
+            'Mental Health', 'Psychotherapy', 'Cognitive Behavioral Therapy',
+            'Neuroscience', 'Depression', 'Anxiety', 'PTSD', 'Mindfulness',
+            'Psychological Research', 'Brain Studies', 'Emotional Intelligence',
+            'Stress Management', 'Positive Psychology', 'Child Development',
+            'Addiction Treatment', 'Personality Disorders', 'Social Behavior',
+            'Memory and Learning', 'Psychology in Education', 'Workplace Psychology'
+        ],
+        topics=[],
+        categories={
+            'Cognitive Psychology': [
+                'cognitive', 'memory', 'attention', 'perception', 'thinking', 'language'
+            ],
+            'Clinical Psychology': [
+                'clinical', 'therapy', 'treatment', 'disorder', 'mental health',
+                'counseling'
+            ],
+            'Social Psychology': [
+                'social', 'group dynamics', 'relationships', 'attitudes', 'prejudice',
+                'conformity'
+            ],
+            'Developmental Psychology': [
+                'development', 'child', 'adolescent', 'aging', 'lifespan', 'growth'
+            ],
+            'Neuroscience': ['brain', 'neural', 'neuroscience', 'neuroplasticity', 'cognition'],
+            'Positive Psychology': [
+                'happiness', 'well-being', 'resilience', 'flourishing', 'mindfulness'
+            ],
+            'Abnormal Psychology': [
+                'abnormal', 'psychopathology', 'mental illness', 'diagnosis', 'dsm'
+            ],
+            'Health Psychology': ['health', 'wellness', 'stress', 'coping', 'behavior change'],
+            'Educational Psychology': [
+                'learning', 'education', 'teaching', 'academic', 'school'
+            ],
+            'Research & Methods': [
+                'research', 'study', 'experiment', 'methodology', 'statistics'
+            ],
+        },
+        default_category='General Psychology',
+        highlight_categories=[
+            'Research', 'Clinical', 'Cognitive', 'Social', 'Development', 'Mental Health'
+        ],
+        fallback_highlight=('brain', '#4B0082', 'General'),
+        title_format='Psychology [Theme]: [Specific Detail]',
+        title_example='Psychology Breakthrough: New Therapy Technique Shows Promise for PTSD',
+        title_focus='psychology advancements',
+        default_title="Today's Psychology Highlights",
+        summary_focus='psychology',
+    ),
+    TopicConfig(
+        name='Gadgets',
+        topic_id=22,
+        label='gadget',
+        queries=[
+            'new gadget OR tech innovation', 'smartphone OR laptop OR tablet release',
+            'wearable technology OR smartwatch OR fitness tracker',
+            'smart home device OR IoT gadget', 'gaming hardware OR console OR VR headset',
+            'audio equipment OR wireless earbuds OR speakers',
+            'camera technology OR action camera OR drone',
+            'electric vehicle OR e-bike OR scooter'
+        ],
+        trusted_sources=[
+            'theverge.com', 'techcrunch.com', 'engadget.com', 'gizmodo.com', 'cnet.com',
+            'wired.com', 'arstechnica.com', 'tomshardware.com', 'techradar.com',
+            'digitaltrends.com', 'slashgear.com', 'androidcentral.com', 'appleinsider.com',
+            'macrumors.com', '9to5mac.com', '9to5google.com', 'xda-developers.com',
+            'gsmarena.com', 'phonearena.com', 'zdnet.com'
+        ],
+        companies=[
+            'Apple', 'Samsung', 'Google', 'Sony', 'Microsoft', 'Amazon', 'Lenovo', 'Dell',
+            'HP', 'LG', 'Asus', 'Acer', 'Huawei', 'OnePlus', 'Xiaomi', 'Oppo', 'Vivo',
+            'Realme', 'Nokia', 'Motorola', 'Fitbit', 'Garmin', 'DJI', 'GoPro', 'Bose',
+            'Sonos', 'Dyson', 'Roomba', 'Anker', 'Belkin', 'Logitech', 'Razer', 'Nvidia',
+            'AMD'
+        ],
+        priority_topics=[
+            'Smartphone', 'Laptop', 'Tablet', 'Smartwatch', 'Wireless Earbuds',
+            'Smart Home', 'Gaming Console', 'VR Headset', 'AR Glasses', 'Foldable Device',
+            'Electric Vehicle', 'Drone', 'Action Camera', '5G Technology', 'Wi-Fi 6',
+            'Bluetooth', 'USB-C', 'OLED', 'QLED'
+        ],
+        topics=[
+            'Consumer Electronics', 'Mobile Devices', 'Wearable Technology',
+            'Smart Home Devices', 'Gaming Hardware', 'Audio Equipment', 'Camera Technology',
+            'Computer Hardware', 'Networking Devices', 'Display Technology',
+            'Battery Technology', 'Charging Solutions', 'IoT Devices', 'Robotics',
+            'Personal Transportation', 'Health and Fitness Tech', 'Augmented Reality',
+            'Virtual Reality', 'Artificial Intelligence in Gadgets', 'Sustainable Tech'
+        ],
+        categories={
+            'Smartphones': ['smartphone', 'iphone', 'android', 'mobile device'],
+            'Laptops & Tablets': ['laptop', 'notebook', 'tablet', 'ipad', 'chromebook'],
+            'Wearables': ['smartwatch', 'fitness tracker', 'wearable', 'apple watch'],
+            'Smart Home': ['smart home', 'iot', 'connected device', 'alexa', 'google home'],
+            'Audio': ['headphones', 'earbuds', 'speaker', 'soundbar'],
+            'Gaming': ['gaming', 'console', 'playstation', 'xbox', 'nintendo'],
+            'Cameras': ['camera', 'dslr', 'mirrorless', 'action cam'],
+            'TV & Home Entertainment': ['tv', 'television', 'streaming device', 'home theater'],
+            'Computer Accessories': ['keyboard', 'mouse', 'monitor', 'printer'],
+            'Electric Vehicles': ['electric car', 'ev', 'tesla', 'e-bike', 'scooter'],
+        },
+        default_category='General Gadget News',
+        highlight_categories=[
+            'Mobile', 'Computing', 'Audio', 'Smart Home', 'Wearables', 'Gaming',
+            'Innovation'
+        ],
+        fallback_highlight=('mobile-alt', '#4a4a4a', 'Mobile'),
+        title_format='Tech [Theme]: [Specific Detail]',
+        title_example='Tech Revolution: Foldable Smartphones Redefine Mobile Experience',
+        title_focus='gadget advancements',
+        default_title="Today's Gadget Highlights",
+        summary_focus='gadget technology',
+    ),
+]
+
+_TOPICS_BY_NAME = {topic.name.lower(): topic for topic in TOPICS}
+
+
+def get_topic(name: str) -> Optional[TopicConfig]:
+    return _TOPICS_BY_NAME.get(name.strip().lower())
+
+
+def get_topics(names: List[str]) -> List[TopicConfig]:
+    """Resolve topic names (e.g. active rows of the topics table) to configs, skipping unknown ones."""
+    return [topic for topic in (get_topic(name) for name in names) if topic is not None]
@@ -2,6 +2,8 @@
 
 if [ "$RUN_SCRIPT" = "DailyNewsRun" ]; then
     python /autonomous_newsletter/app/DailyJobs/DailyNewsRun.py
+elif [ "$RUN_SCRIPT" = "DailyWorker" ]; then
+    python /autonomous_newsletter/app/DailyJobs/DailyWorker.py
 elif [ "$RUN_SCRIPT" = "DailyEmailRun" ]; then
     python /autonomous_newsletter/app/DailyJobs/DailyEmailRun.py
 else
@@ -0,0 +1,101 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import text
+
+from app.db.session import SessionLocal
+from app.pipeline.checkpoint import COMPUTED, REUSED, RunCheckpoints, fingerprint
+
+RUN_DATE = date(2026, 10, 17)
+
+
+class Compute:
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.results.pop(0)
+
+
+@pytest.fixture
+def checkpoints(database):
+    return RunCheckpoints('daily', RUN_DATE, enabled=True)
+
+
+def test_computed_result_is_reused_by_a_rerun(checkpoints):
+    compute = Compute({'title': 'first'})
+    assert checkpoints.stage('ai', 'digest', compute) == {'title': 'first'}
+
+    rerun = RunCheckpoints('daily', RUN_DATE, enabled=True)
+    assert rerun.stage('ai', 'digest', Compute()) == {'title': 'first'}
+    assert compute.calls == 1
+    assert checkpoints.report['ai']['digest'] == COMPUTED
+    assert rerun.report['ai']['digest'] == REUSED
+
+
+def test_result_not_kept_is_recomputed(checkpoints):
+    compute = Compute('fallback', 'real')
+    keep = lambda result: result != 'fallback'
+
+    assert checkpoints.stage('ai', 'digest', compute, keep=keep) == 'fallback'
+    assert checkpoints.stage('ai', 'digest', compute, keep=keep) == 'real'
+    assert checkpoints.stage('ai', 'digest', compute, keep=keep) == 'real'
+    assert compute.calls == 2
+
+
+def test_encode_and_decode_round_trip(checkpoints):
+    checkpoints.stage('ai', 'render', Compute(('title', '<web>', '<email>')), decode=tuple)
+    assert checkpoints.stage('ai', 'render', Compute(), decode=tuple) == ('title', '<web>', '<email>')
+
+
+def test_result_from_other_inputs_is_recomputed(checkpoints):
+    first, second = fingerprint(['https://a', 'https://b']), fingerprint(['https://b', 'https://a'])
+    compute = Compute('digest of a, b', 'digest of b, a')
+
+    assert checkpoints.stage('ai', 'digest', compute, inputs=first) == 'digest of a, b'
+    assert checkpoints.stage('ai', 'digest', compute, inputs=first) == 'digest of a, b'
+    assert checkpoints.stage('ai', 'digest', compute, inputs=second) == 'digest of b, a'
+    assert checkpoints.stage('ai', 'digest', compute, inputs=second) == 'digest of b, a'
+    assert compute.calls == 2
+
+
+def test_checkpoint_without_inputs_is_not_reused_when_inputs_are_given(checkpoints):
+    checkpoints.save('ai', 'digest', 'saved before inputs were recorded')
+    assert checkpoints.stage('ai', 'digest', Compute('fresh'), inputs=fingerprint(['https://a'])) == 'fresh'
+
+
+def test_topics_and_runs_are_separate(checkpoints):
+    checkpoints.stage('ai', 'digest', Compute('ai digest'))
+
+    assert checkpoints.stage('crypto', 'digest', Compute('crypto digest')) == 'crypto digest'
+    other_day = RunCheckpoints('daily', date(2026, 10, 18), enabled=True)
+    assert other_day.stage('ai', 'digest', Compute('next day')) == 'next day'
+
+
+def test_disabled_checkpoints_always_compute(database):
+    checkpoints = RunCheckpoints('daily', RUN_DATE, enabled=False)
+    compute = Compute('one', 'two')
+
+    assert checkpoints.stage('ai', 'digest', compute) == 'one'
+    assert checkpoints.stage('ai', 'digest', compute) == 'two'
+    assert not checkpoints.has('ai', 'digest')
+
+
+def test_save_in_a_rolled_back_transaction_is_discarded(checkpoints):
+    with SessionLocal() as db:
+        checkpoints.save('ai', 'store', 42, db=db)
+        db.rollback()
+    assert not checkpoints.has('ai', 'store')
+
+
+def test_checkpoints_create_a_missing_table(database, monkeypatch):
+    monkeypatch.setattr('app.db.session._created_tables', set())
+    with database.begin() as connection:
+        connection.execute(text("DROP TABLE pipeline_checkpoints"))
+    checkpoints = RunCheckpoints('daily', RUN_DATE, enabled=True)
+
+    checkpoints.save('AI', 'store', 7)
+
+    assert checkpoints.load('AI', 'store') == 7
@@ -0,0 +1,174 @@
+import threading
+import time
+from datetime import date
+
+import pytest
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.pipeline.deadline import Deadline
+from app.pipeline.jobs import DONE, FAILED, PENDING, RUNNING, JobQueue, JobWorker
+
+RUN_DATE = date(2026, 10, 17)
+
+
+@pytest.fixture
+def fast_jobs(database, monkeypatch):
+    for name, value in {
+        'JOB_MAX_ATTEMPTS': 3,
+        'JOB_RETRY_BACKOFF_SECONDS': 0.05,
+        'JOB_MAX_BACKOFF_SECONDS': 0.1,
+        'JOB_HEARTBEAT_SECONDS': 0.1,
+        'JOB_STALE_SECONDS': 0.5,
+        'JOB_POLL_SECONDS': 0.02,
+        'TOPIC_DEADLINE_SECONDS': 10,
+    }.items():
+        monkeypatch.setattr(settings, name, value)
+    return database
+
+
+@pytest.fixture
+def queue(fast_jobs):
+    queue = JobQueue('worker-a')
+    queue.ensure_table()
+    return queue
+
+
+def statuses(queue):
+    return {result.topic: result.status for result in queue.results('daily', RUN_DATE)}
+
+
+def test_enqueue_skips_jobs_already_queued(queue):
+    assert queue.enqueue('daily', RUN_DATE, 'AI', 'publish', {'n': 1})
+    assert not queue.enqueue('daily', RUN_DATE, 'AI', 'publish', {'n': 2})
+    assert queue.counts('daily', RUN_DATE) == {PENDING: 1}
+    assert queue.claim().payload == {'n': 1}
+
+
+def test_failed_job_can_be_enqueued_again(queue):
+    queue.enqueue('daily', RUN_DATE, 'AI', 'publish', {}, max_attempts=1)
+    queue.fail(queue.claim(), 'boom')
+    assert statuses(queue) == {'AI': FAILED}
+
+    assert queue.enqueue('daily', RUN_DATE, 'AI', 'publish', {'retry': True})
+    job = queue.claim()
+    assert (job.payload, job.attempts) == ({'retry': True}, 1)
+
+
+def test_claim_filters_by_run(queue):
+    queue.enqueue('daily', date(2026, 10, 16), 'AI', 'publish', {})
+    assert queue.claim('daily', RUN_DATE) is None
+    assert queue.claim('daily', date(2026, 10, 16)).topic == 'AI'
+
+
+def test_concurrent_claims_never_take_the_same_job(queue):
+    topics = [f'topic-{index}' for index in range(40)]
+    for topic in topics:
+        queue.enqueue('daily', RUN_DATE, topic, 'publish', {})
+
+    claimed, lock = [], threading.Lock()
+
+    def claim_all(worker):
+        worker_queue = JobQueue(worker)
+        while True:
+            job = worker_queue.claim('daily', RUN_DATE)
+            if job is None:
+                return
+            with lock:
+                claimed.append(job.topic)
+
+    threads = [threading.Thread(target=claim_all, args=(f'worker-{index}',)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(claimed) == sorted(topics)
+    assert queue.counts('daily', RUN_DATE) == {RUNNING: len(topics)}
+
+
+def test_failed_attempt_is_retried_after_backoff_then_given_up(queue):
+    queue.enqueue('daily', RUN_DATE, 'AI', 'publish', {}, max_attempts=2)
+
+    assert queue.fail(queue.claim(), 'first') == PENDING
+    assert queue.claim() is None  # waiting out the backoff
+    time.sleep(0.15)
+    job = queue.claim()
+    assert job.attempts == 2
+    assert queue.fail(job, 'second') == FAILED
+    assert queue.results('daily', RUN_DATE)[0].error == 'second'
+
+
+def test_stale_job_is_reclaimed_and_old_claim_is_lost(queue):
+    queue.enqueue('daily', RUN_DATE, 'AI', 'publish', {})
+    stalled = queue.claim()
+    other = JobQueue('worker-b')
+
+    assert other.claim() is None
+    time.sleep(0.6)
+    reclaimed = other.claim()
+
+    assert (reclaimed.id, reclaimed.attempts) == (stalled.id, 2)
+    assert not queue.heartbeat(stalled)
+    assert not queue.complete(stalled, {'late': True})
+    assert other.heartbeat(reclaimed)
+    assert other.complete(reclaimed, {'newsletter_id': 7})
+    assert queue.results('daily', RUN_DATE)[0].result == {'newsletter_id': 7}
+
+
+def test_worker_drains_run_with_retries(queue):
+    for topic in ('AI', 'Crypto', 'Space'):
+        queue.enqueue('daily', RUN_DATE, topic, 'publish', {'topic': topic})
+    failures = {'Crypto': 1, 'Space': 99}
+
+    def publish(job, deadline):
+        if failures.get(job.topic, 0) >= job.attempts:
+            raise RuntimeError(f"{job.topic} failed")
+        return {'newsletter_id': job.id}
+
+    stats = JobWorker(queue, {'publish': publish}, concurrency=2).run('daily', RUN_DATE, drain=True)
+
+    assert statuses(queue) == {'AI': DONE, 'Crypto': DONE, 'Space': FAILED}
+    assert stats == {'done': 2, 'retried': 3, 'failed': 1}
+    attempts = {result.topic: result.attempts for result in queue.results('daily', RUN_DATE)}
+    assert attempts == {'AI': 1, 'Crypto': 2, 'Space': 3}
+
+
+def test_unknown_job_kind_fails(queue):
+    queue.enqueue('daily', RUN_DATE, 'AI', 'render', {}, max_attempts=1)
+    JobWorker(queue, {}, concurrency=1).run('daily', RUN_DATE, drain=True)
+    result = queue.results('daily', RUN_DATE)[0]
+    assert result.status == FAILED
+    assert 'No handler' in result.error
+
+
+def test_lost_claim_cancels_the_running_job(queue, database):
+    queue.enqueue('daily', RUN_DATE, 'AI', 'publish', {})
+    cancelled = threading.Event()
+
+    def publish(job, deadline):
+        # Another worker takes the job over while this one is still running it
+        with database.begin() as connection:
+            connection.execute(text("UPDATE pipeline_jobs SET locked_by = 'worker-b' WHERE id = :id"), {"id": job.id})
+        for _ in range(50):
+            if deadline.cancelled:
+                cancelled.set()
+                raise RuntimeError("stopped")
+            time.sleep(0.05)
+        return {}
+
+    JobWorker(queue, {'publish': publish}, concurrency=1).run_job(queue.claim())
+    assert cancelled.is_set()
+
+
+def test_job_deadline_never_outlives_the_run(queue, database, monkeypatch):
+    monkeypatch.setattr(settings, 'TOPIC_DEADLINE_SECONDS', 600.0)
+    queue.enqueue('daily', RUN_DATE, 'AI', 'publish', {})
+    budgets = []
+
+    def publish(job, deadline):
+        budgets.append(deadline.remaining())
+        return {}
+
+    JobWorker(queue, {'publish': publish}, concurrency=1).run_job(queue.claim(), Deadline(5))
+    assert budgets[0] <= 5
@@ -0,0 +1,44 @@
+import random
+from collections import Counter
+
+import pytest
+
+from app.pipeline.keywords import KeywordCategorizer, KeywordMatcher, WeightedKeywordScorer
+
+
+def baseline_counts(keywords, text):
+    text = text.lower()
+    counts = Counter({keyword.lower(): text.count(keyword.lower()) for keyword in keywords})
+    return +counts
+
+
+@pytest.mark.parametrize('keywords, text', [
+    (['aa'], 'aaaa aaa'),
+    (['ana', 'banana', 'an'], 'bananas and ananas'),
+    (['ai', 'openai', 'open ai'], 'OpenAI and open AI said AI; openaiai'),
+    (['abab', 'ab', 'bab'], 'ababababab'),
+])
+def test_counts_match_str_count(keywords, text):
+    assert KeywordMatcher(keywords).counts(text) == baseline_counts(keywords, text)
+
+
+def test_counts_match_str_count_on_random_text():
+    rng = random.Random(9)
+    alphabet = 'ab n'
+    for _ in range(300):
+        keywords = {''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))).strip() or 'a'
+                    for _ in range(rng.randint(1, 6))}
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+        assert KeywordMatcher(keywords).counts(text) == baseline_counts(keywords, text), (keywords, text)
+
+
+def test_scorer_weights_each_group():
+    scorer = WeightedKeywordScorer([(2, ['machine learning', 'llm']), (1, ['openai', 'llm'])])
+    # llm is in both groups: 3 per occurrence
+    assert scorer.score('OpenAI ships an LLM; machine learning llm news') == 1 + 3 * 2 + 2
+
+
+def test_categorizer_keeps_declaration_order():
+    categorizer = KeywordCategorizer({'Research': ['paper'], 'Business': ['funding'], 'Robotics': ['robot']})
+    assert categorizer.categorize('Robot maker raises funding') == ['Business', 'Robotics']
+    assert categorizer.categorize('nothing relevant') == []
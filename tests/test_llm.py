@@ -0,0 +1,162 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from openai.types.chat import ChatCompletion
+
+from app.pipeline import llm
+from app.pipeline.cache import DiskCache
+from app.pipeline.llm import LLMExecutor
+
+
+def completion(content: str, finish_reason: str = 'stop') -> ChatCompletion:
+    return ChatCompletion.model_validate({
+        'id': 'chatcmpl-test',
+        'object': 'chat.completion',
+        'created': 0,
+        'model': 'gpt-test',
+        'choices': [{
+            'index': 0,
+            'finish_reason': finish_reason,
+            'message': {'role': 'assistant', 'content': content},
+        }],
+        'usage': {'prompt_tokens': 11, 'completion_tokens': 7, 'total_tokens': 18},
+    })
+
+
+class StubClient:
+    """Stands in for AsyncOpenAI: returns (or raises) the queued results in order."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def executor(tmp_path):
+    executor = LLMExecutor(max_concurrency=2, timeout=5, max_retries=2,
+                           cache=DiskCache(str(tmp_path / 'llm.sqlite'), ttl_seconds=3600, max_bytes=1 << 20))
+    yield executor
+    executor.close()
+
+
+def use_client(executor: LLMExecutor, client: StubClient) -> StubClient:
+    executor._client = client
+    return client
+
+
+REQUEST = dict(model='gpt-test', messages=[{'role': 'user', 'content': 'hi'}], temperature=0.7,
+               response_format={'type': 'json_object'})
+
+
+def test_uncached_call_reaches_client(executor):
+    client = use_client(executor, StubClient(completion('{"title": "ok"}')))
+
+    response = executor.complete_sync(topic='ai', **REQUEST)
+
+    assert response.choices[0].message.content == '{"title": "ok"}'
+    assert client.calls == [REQUEST]
+    stats = executor.topic_stats()['ai']
+    assert (stats['calls'], stats['prompt_tokens'], stats['completion_tokens']) == (1, 11, 7)
+
+
+def test_complete_response_is_served_from_cache(executor):
+    client = use_client(executor, StubClient(completion('{"title": "ok"}')))
+
+    executor.complete_sync(**REQUEST)
+    response = executor.complete_sync(**REQUEST)
+
+    assert response.choices[0].message.content == '{"title": "ok"}'
+    assert len(client.calls) == 1
+    assert executor.stats()['cached'] == 1
+
+
+@pytest.mark.parametrize('response', [
+    completion('{"title": "cut o', finish_reason='length'),
+    completion('not json'),
+    completion('["not", "an", "object"]'),
+])
+def test_unusable_response_is_not_cached(executor, response):
+    client = use_client(executor, StubClient(response, completion('{"title": "ok"}')))
+
+    executor.complete_sync(**REQUEST)
+    retried = executor.complete_sync(**REQUEST)
+
+    assert retried.choices[0].message.content == '{"title": "ok"}'
+    assert len(client.calls) == 2
+
+
+def test_evict_forces_a_new_request(executor):
+    client = use_client(executor, StubClient(completion('{"title": "a"}'), completion('{"title": "b"}')))
+
+    executor.complete_sync(**REQUEST)
+    executor.evict(**REQUEST)
+
+    assert executor.complete_sync(**REQUEST).choices[0].message.content == '{"title": "b"}'
+    assert len(client.calls) == 2
+
+
+def test_use_cache_false_skips_cache(executor):
+    client = use_client(executor, StubClient(completion('{"title": "a"}'), completion('{"title": "b"}')))
+
+    executor.complete_sync(**REQUEST)
+
+    assert executor.complete_sync(use_cache=False, **REQUEST).choices[0].message.content == '{"title": "b"}'
+    assert len(client.calls) == 2
+
+
+def test_transient_failures_are_retried(executor, monkeypatch):
+    monkeypatch.setattr(llm, '_retry_delay', lambda error, attempt: 0)
+    client = use_client(executor, StubClient(asyncio.TimeoutError(), completion('{"title": "ok"}')))
+
+    executor.complete_sync(topic='ai', **REQUEST)
+
+    assert len(client.calls) == 2
+    assert executor.topic_stats()['ai']['retries'] == 1
+
+
+def test_retries_give_up_after_max_retries(executor, monkeypatch):
+    monkeypatch.setattr(llm, '_retry_delay', lambda error, attempt: 0)
+    use_client(executor, StubClient(*[asyncio.TimeoutError()] * 3))
+
+    with pytest.raises(asyncio.TimeoutError):
+        executor.complete_sync(topic='ai', **REQUEST)
+
+    assert executor.stats()['failed'] == 1
+
+
+def rate_limit_error(status_code: int, **headers) -> Exception:
+    error = Exception('rate limited')
+    error.response = SimpleNamespace(status_code=status_code, headers=headers)
+    return error
+
+
+@pytest.mark.parametrize('status_code, headers, delay', [
+    (429, {'retry-after-ms': '250'}, 0.25),
+    (429, {'retry-after-ms': '900000000'}, 60.0),
+    (503, {'retry-after': '2'}, 2.0),
+    (429, {'retry-after': '3600'}, 60.0),
+    (429, {'x-ratelimit-reset-requests': '1m30s'}, 60.0),
+    (429, {'x-ratelimit-reset-tokens': '250ms'}, 0.25),
+])
+def test_retry_delay_follows_headers_up_to_the_cap(monkeypatch, status_code, headers, delay):
+    monkeypatch.setattr(llm.settings, 'LLM_MAX_BACKOFF_SECONDS', 60.0)
+    assert llm._retry_delay(rate_limit_error(status_code, **headers), 0) == pytest.approx(delay)
+
+
+def test_retry_delay_ignores_reset_headers_on_server_errors(monkeypatch):
+    monkeypatch.setattr(llm.settings, 'LLM_BACKOFF_SECONDS', 1.0)
+    monkeypatch.setattr(llm.settings, 'LLM_MAX_BACKOFF_SECONDS', 60.0)
+    error = rate_limit_error(500, **{'x-ratelimit-reset-requests': '50s'})
+    assert 0.8 <= llm._retry_delay(error, 0) <= 1.2
@@ -0,0 +1,98 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import text
+
+from app.pipeline.checkpoint import RunCheckpoints
+from app.pipeline.newsletters import NewsletterBatch, PendingNewsletter
+from app.pipeline.seen import SeenArticleIndex
+
+RUN_DATE = date(2026, 10, 17)
+TOPIC_IDS = {'AI': 1, 'Crypto': 2, 'Space': 3}
+
+
+@pytest.fixture
+def batch(database):
+    with database.begin() as connection:
+        for name, topic_id in TOPIC_IDS.items():
+            connection.execute(text("INSERT INTO topics (id, name, is_active) VALUES (:id, :name, 'Y')"),
+                               {"id": topic_id, "name": name})
+    return NewsletterBatch(RunCheckpoints('daily', RUN_DATE, enabled=True), SeenArticleIndex('daily'))
+
+
+def newsletter(topic, topic_id=None):
+    articles = [{'url': f'https://news.example/{topic}/{index}', 'title': f'{topic} story {index}'}
+                for index in range(3)]
+    return PendingNewsletter(topic, f'{topic} title', f'<web {topic}>', f'<email {topic}>',
+                             TOPIC_IDS.get(topic) if topic_id is None else topic_id, ['10', '11'], articles)
+
+
+def rows(database, query):
+    with database.connect() as connection:
+        return connection.execute(text(query)).fetchall()
+
+
+def test_flush_stores_every_newsletter_with_checkpoint_and_seen_articles(batch, database):
+    for topic in ('AI', 'Crypto', 'Space'):
+        batch.add(newsletter(topic))
+
+    stored = batch.flush()
+
+    assert rows(database, "SELECT id, title, topic_id, subscription_ids FROM newsletters ORDER BY id") == [
+        (stored['AI'], 'AI title', 1, '10,11'),
+        (stored['Crypto'], 'Crypto title', 2, '10,11'),
+        (stored['Space'], 'Space title', 3, '10,11'),
+    ]
+    for topic, inserted_id in stored.items():
+        assert batch.checkpoints.load(topic, 'store') == inserted_id
+    assert rows(database, "SELECT topic_id, count(*) FROM seen_articles GROUP BY topic_id ORDER BY topic_id") == [
+        (1, 3), (2, 3), (3, 3),
+    ]
+    assert not batch.has('AI')
+    assert batch.flush() == {}
+
+
+def test_flush_only_stores_the_given_topics(batch, database):
+    batch.add(newsletter('AI'))
+    batch.add(newsletter('Crypto'))
+
+    stored = batch.flush(['Crypto'])
+
+    assert list(stored) == ['Crypto']
+    assert rows(database, "SELECT title FROM newsletters") == [('Crypto title',)]
+    assert batch.checkpoints.load('AI', 'store') is None
+
+
+def test_failed_flush_stores_the_other_newsletters_one_by_one(batch, database):
+    batch.add(newsletter('AI'))
+    batch.add(newsletter('Crypto', topic_id=999))  # no such topic
+
+    stored = batch.flush()
+
+    assert list(stored) == ['AI']
+    assert rows(database, "SELECT id, title FROM newsletters") == [(stored['AI'], 'AI title')]
+    assert rows(database, "SELECT topic_id, count(*) FROM seen_articles GROUP BY topic_id") == [(1, 3)]
+    assert batch.checkpoints.load('AI', 'store') == stored['AI']
+    assert batch.checkpoints.load('Crypto', 'store') is None
+
+
+def test_failed_newsletter_writes_nothing(batch, database):
+    batch.add(newsletter('Crypto', topic_id=999))
+
+    assert batch.flush() == {}
+
+    assert rows(database, "SELECT count(*) FROM newsletters") == [(0,)]
+    assert rows(database, "SELECT count(*) FROM seen_articles") == [(0,)]
+    assert batch.checkpoints.load('Crypto', 'store') is None
+
+
+def test_flush_creates_a_missing_seen_articles_table(batch, database, monkeypatch):
+    # A run on a database the web app has never started against
+    monkeypatch.setattr('app.db.session._created_tables', set())
+    with database.begin() as connection:
+        connection.execute(text("DROP TABLE seen_articles"))
+    batch.add(newsletter('AI'))
+
+    assert list(batch.flush()) == ['AI']
+
+    assert rows(database, "SELECT count(*) FROM seen_articles") == [(3,)]
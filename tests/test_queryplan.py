@@ -0,0 +1,69 @@
+from dataclasses import replace
+from datetime import date
+
+import pytest
+
+from app.core.config import settings
+from app.pipeline import queryplan
+from app.pipeline.articles import ArticleRecord
+from app.pipeline.fetcher import TopicFetcher
+from app.pipeline.queryplan import QueryPlan
+from app.pipeline.stages import rank_articles
+from app.pipeline.topics import get_topic
+
+RUN_DATE = date(2026, 10, 17)
+SHARED_QUERY = 'OpenAI OR Google AI'
+
+
+def article(index):
+    return {
+        'title': f'OpenAI and Google AI story {index}',
+        'description': 'A large language model for machine learning research',
+        'url': f'https://news.example/{index}',
+        'urlToImage': f'https://news.example/{index}.jpg',
+    }
+
+
+@pytest.fixture
+def fetchers(monkeypatch):
+    pages = [[article(index) for index in range(3)], [article(index) for index in range(3, 6)]]
+    monkeypatch.setattr(queryplan, 'iter_query_pages', lambda *args, **kwargs: iter(pages))
+    fetchers = {}
+    for name in ('AI', 'Technology'):
+        fetcher = TopicFetcher(replace(get_topic(name), queries=[SHARED_QUERY]), http_session=object(), llm=object())
+        monkeypatch.setattr(fetcher.seen, 'recent_titles', lambda topic_id, limit: [])
+        fetchers[name] = fetcher
+    return fetchers
+
+
+def execute(fetchers):
+    plan = QueryPlan([fetcher.config for fetcher in fetchers.values()],
+                     scorers={name: fetcher.score_page for name, fetcher in fetchers.items()})
+    plan.execute(RUN_DATE)
+    return plan
+
+
+def test_shared_query_hands_each_topic_its_own_records(fetchers):
+    plan = execute(fetchers)
+
+    for name, fetcher in fetchers.items():
+        records = plan.for_topic(name)[SHARED_QUERY]
+        assert [record.url for record in records] == [f'https://news.example/{index}' for index in range(6)]
+        assert all(isinstance(record, ArticleRecord) for record in records)
+        # Already enriched, so the topic does not analyze them again
+        assert all(a is b for a, b in zip(fetcher.enrich_all(records), records))
+    assert plan.for_topic('AI')[SHARED_QUERY][0] is not plan.for_topic('Technology')[SHARED_QUERY][0]
+
+
+def test_shared_query_scores_pages_with_the_configured_ranker(fetchers, monkeypatch):
+    pytest.importorskip('numpy')
+    monkeypatch.setattr(settings, 'RANKER', 'tfidf')
+
+    plan = execute(fetchers)
+
+    fetcher = fetchers['AI']
+    records = plan.for_topic('AI')[SHARED_QUERY]
+    profile = fetcher.get_ranker().profile
+    expected = rank_articles(profile, [record.text for record in records[:3]])
+    assert [record.score for record in records[:3]] == pytest.approx(expected)
+    assert expected != [record.score for record in fetcher.enrich_all([article(index) for index in range(3)])]
@@ -0,0 +1,51 @@
+import pytest
+
+from app.core.config import settings
+from app.pipeline.articles import ArticleRecord
+from app.pipeline.render import render_daily, render_weekly, safe_url
+
+
+@pytest.fixture(autouse=True)
+def template_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, 'PIPELINE_CACHE_DIR', str(tmp_path))
+
+
+def record(url, image_url='https://img.example/1.jpg'):
+    return ArticleRecord(raw={}, title='Title', description='Description', url=url, image_url=image_url, text='')
+
+
+@pytest.mark.parametrize('url, expected', [
+    ('https://news.example/story', 'https://news.example/story'),
+    ('HTTP://news.example/story', 'HTTP://news.example/story'),
+    ('/api/images/abc/400/300', '/api/images/abc/400/300'),
+    ('javascript:alert(1)', ''),
+    (' JavaScript:alert(1)', ''),
+    ('java\tscript:alert(1)', ''),
+    ('data:text/html;base64,PHNjcmlwdD4=', ''),
+    ('news.example/story', ''),
+    (None, ''),
+])
+def test_safe_url_allows_only_http_and_site_relative_urls(url, expected):
+    assert safe_url(url) == expected
+
+
+def test_daily_render_drops_articles_with_unsafe_links():
+    web, email = render_daily('Title', 'Summary', [], [
+        record('https://news.example/safe'),
+        record('javascript:alert(1)'),
+        record('https://news.example/image', image_url='data:image/svg+xml,<svg onload=alert(1)>'),
+    ])
+    for html in (web, email):
+        assert 'href="https://news.example/safe"' in html
+        assert 'javascript:' not in html
+        assert 'data:image' not in html
+
+
+def test_weekly_render_neutralizes_unsafe_links():
+    html = render_weekly('AI', 'Title', 'Summary', [], [
+        {'title': 'Title', 'description': 'Description', 'url': 'javascript:alert(1)',
+         'urlToImage': 'data:image/png;base64,AAAA'},
+    ])
+    assert 'javascript:' not in html
+    assert 'data:image' not in html
+    assert 'href="#"' in html